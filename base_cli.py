@@ -197,7 +197,7 @@ class BaseCLI:
         wallet_path.mkdir(parents=True, exist_ok=True)
 
         self.wallet.set_wallet_directory(str(wallet_path))
-        account, address = self.wallet.generate_keypair()
+        address = self.wallet.generate_keypair()
 
         print_warning("SECURITY: For maximum security, generate keys on an OFFLINE device.")
         console.print()
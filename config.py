@@ -28,6 +28,18 @@ INFRASTRUCTURE_FEE_PERCENTAGE = 0.01  # 1% fee
 INFRASTRUCTURE_FEE_WALLET = "Cak1aAwxM2jTdu7AtdaHbqAc3Dfafts7KdsHNrtXN5rT"  # Solana
 INFRASTRUCTURE_FEE_WALLET_BASE = "0x0000000000000000000000000000000000000000"  # TODO: set Base fee wallet
 
+# ── FairScore ───────────────────────────────────────────────
+# Addresses with a fixed reputation tier, answered without an API call.
+# Program IDs and the incinerator can't hold user funds, so transfers
+# to them are blocked (tier 1).
+FAIRSCORE_STATIC_TIERS = {
+    "11111111111111111111111111111111": 1,               # System Program
+    "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA": 1,    # SPL Token Program
+    "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb": 1,    # Token-2022 Program
+    "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL": 1,   # Associated Token Program
+    "1nc1nerator11111111111111111111111111111111": 1,    # Incinerator (burn)
+}
+
 # ── Directories ─────────────────────────────────────────────
 WALLET_DIR = "/wallet"
 INBOX_DIR = "/inbox"
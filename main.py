@@ -33,7 +33,7 @@ from src.iso_builder import ISOBuilder
 from src.backup import WalletBackup
 from src.jupiter_integration import JupiterSwapManager, sol_to_lamports, lamports_to_sol
 from src.pyth_integration import PythPriceClient, format_usd
-from src.fairscore_integration import FairScoreClient, format_reputation_badge
+from src.fairscore_integration import get_default_client, format_reputation_badge
 
 
 class SolanaColdWalletCLI:
@@ -46,7 +46,7 @@ class SolanaColdWalletCLI:
         self.backup_manager = WalletBackup()
         self.jupiter_manager = JupiterSwapManager(slippage_bps=50)  # 0.5% slippage
         self.pyth_client = PythPriceClient()
-        self.fairscore_client = FairScoreClient()
+        self.fairscore_client = get_default_client()
 
         self.current_usb_device = None
         self.current_public_key = None
@@ -112,8 +112,8 @@ class SolanaColdWalletCLI:
         if self.network.is_connected() and self.current_public_key:
             try:
                 assessment = self.fairscore_client.get_risk_assessment(self.current_public_key)
-                if assessment["available"]:
-                    badge = format_reputation_badge(assessment["tier"])
+                if assessment.available:
+                    badge = format_reputation_badge(assessment.tier)
                     print_info(f"Wallet Reputation: {badge}")
             except:
                 pass
@@ -464,22 +464,14 @@ class SolanaColdWalletCLI:
         work_dir = tempfile.mkdtemp(prefix="solana_wallet_")
         
         try:
-            tarball = self.iso_builder.download_alpine_rootfs(work_dir)
-            if not tarball:
-                return
-            
-            rootfs = self.iso_builder.extract_rootfs(tarball)
+            rootfs = self.iso_builder.download_and_extract_rootfs(work_dir)
             if not rootfs:
                 return
             
             if not self.iso_builder.configure_offline_os():
                 return
             
-            image = self.iso_builder.build_iso()
-            if not image:
-                return
-            
-            if self.iso_builder.flash_to_usb(selected_device['device']):
+            if self.iso_builder.build_and_flash(selected_device['device']):
                 print_section_header("SUCCESS")
                 print_success("Cold wallet USB created successfully!")
                 console.print()
@@ -672,7 +664,7 @@ class SolanaColdWalletCLI:
                 return
 
             assessment = self.fairscore_client.get_risk_assessment(to_address)
-            if assessment["tier"] == 2:
+            if assessment.tier == 2:
                 print_warning("PROCEED WITH CAUTION")
                 print_warning("This wallet has a low trust score. Only proceed if you know the recipient.")
                 console.print()
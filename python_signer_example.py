@@ -238,7 +238,7 @@ class SolanaSecureSigner:
         self,
         encrypted_container: dict,
         passphrase: str
-    ) -> list:
+    ) -> bytearray:
         """
         Decrypt the private key from an encrypted container.
 
@@ -251,7 +251,7 @@ class SolanaSecureSigner:
             passphrase: Passphrase for decryption
 
         Returns:
-            List of 32 int values (Ed25519 seed bytes)
+            Mutable 32-byte bytearray (Ed25519 seed) so callers can zeroize it
 
         Raises:
             RuntimeError: If decryption fails (wrong password or corrupted container)
@@ -281,7 +281,7 @@ class SolanaSecureSigner:
         except Exception:
             raise RuntimeError("Decryption failed: wrong password or corrupted container")
 
-        return list(plaintext[:32])
+        return bytearray(plaintext[:32])
 
 
 # ============================================================================
@@ -0,0 +1,42 @@
+"""
+Optional accelerator packages (h2, pybase64, orjson) and their stdlib fallbacks
+
+B - Love U 3000
+"""
+
+import importlib.util
+import json
+import os
+
+# HTTP/2 needs the optional h2 package (httpx[http2]). httpx imports it
+# itself when a client enables http2, so only check that it is installed.
+HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# pybase64 is a drop-in SIMD codec; the stdlib module is the fallback
+try:
+    import pybase64 as base64
+    b64encode_str = base64.b64encode_as_string
+except ImportError:
+    import base64
+
+    def b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
+
+# Transaction files are machine-read, so they are written compact;
+# COLDSTAR_PRETTY=1 indents them for reading by hand
+PRETTY_JSON = os.environ.get("COLDSTAR_PRETTY") == "1"
+
+# orjson serializes and parses several times faster than the stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(",", ":")).encode()
@@ -0,0 +1,27 @@
+"""
+Shared worker pool for blocking network I/O
+
+B - Love U 3000
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+IO_POOL_WORKERS = 8
+
+_IO_POOL: Optional[ThreadPoolExecutor] = None
+_IO_POOL_LOCK = threading.Lock()
+
+
+def get_io_pool() -> ThreadPoolExecutor:
+    """Return the process-wide I/O pool, creating it on first use."""
+    global _IO_POOL
+    if _IO_POOL is None:
+        with _IO_POOL_LOCK:
+            if _IO_POOL is None:
+                _IO_POOL = ThreadPoolExecutor(
+                    max_workers=IO_POOL_WORKERS,
+                    thread_name_prefix="coldstar-io",
+                )
+    return _IO_POOL
@@ -14,9 +14,10 @@ import base64
 import hashlib
 import secrets
 import os
+import time
 from pathlib import Path
+from string import Template
 from typing import Optional, Tuple, List
-from datetime import datetime
 
 from solders.keypair import Keypair
 
@@ -53,6 +54,149 @@ WORDLIST_SAMPLE = [
     "agree", "ahead", "aim", "air", "airport", "aisle", "alarm", "album",
 ]
 
+# Shared OS-backed CSPRNG; randbytes() is a direct bound-method call
+_SYSRAND = secrets.SystemRandom()
+
+# Paper wallet HTML, compiled once at import. `$name` placeholders leave the
+# CSS braces untouched, so no `{{`/`}}` escaping is needed. The page is split
+# around the two QR images so their base64 data can be streamed to disk.
+_PAPER_HEAD = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Coldstar Paper Wallet</title>
+    <style>
+        body {
+            font-family: 'Courier New', monospace;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 40px;
+            background: #fff;
+        }
+        .header {
+            text-align: center;
+            border-bottom: 3px solid #000;
+            padding-bottom: 20px;
+            margin-bottom: 30px;
+        }
+        .section {
+            margin: 30px 0;
+            padding: 20px;
+            border: 2px solid #000;
+        }
+        .qr-container {
+            text-align: center;
+            margin: 20px 0;
+        }
+        .qr-container img {
+            max-width: 250px;
+        }
+        .address {
+            word-break: break-all;
+            font-size: 14px;
+            background: #f0f0f0;
+            padding: 10px;
+            margin: 10px 0;
+        }
+        .warning {
+            background: #fff3cd;
+            border: 2px solid #ffc107;
+            padding: 15px;
+            margin: 20px 0;
+        }
+        .fold-line {
+            border-top: 2px dashed #ccc;
+            margin: 40px 0;
+            text-align: center;
+        }
+        .fold-line::before {
+            content: '✂ FOLD HERE - KEEP PRIVATE KEY HIDDEN ✂';
+            background: #fff;
+            padding: 0 20px;
+            position: relative;
+            top: -12px;
+            color: #999;
+        }
+        @media print {
+            .no-print { display: none; }
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>COLDSTAR PAPER WALLET</h1>
+        <p>Solana Cold Storage</p>
+        <p style="font-size: 12px;">Generated: ${generated}</p>
+    </div>
+
+    <div class="section">
+        <h2>PUBLIC ADDRESS (Share this to receive SOL)</h2>
+        <div class="qr-container">
+            <img src="data:image/png;base64,""")
+
+_PAPER_MIDDLE = Template("""" alt="Public Key QR">
+        </div>
+        <div class="address">${pubkey}</div>
+    </div>
+
+    <div class="fold-line"></div>
+
+    <div class="section" style="background: #ffe6e6;">
+        <h2>PRIVATE KEY (NEVER SHARE!)</h2>
+        <div class="warning">
+            <strong>WARNING:</strong> Anyone with this key can steal all your funds!
+            Keep this hidden, secure, and never photograph or share it.
+        </div>
+        <div class="qr-container">
+            <img src="data:image/png;base64,""")
+
+_PAPER_TAIL = Template("""" alt="Private Key QR">
+        </div>
+        <div class="address" style="font-size: 10px;">
+            ${kp_b64}
+        </div>
+    </div>
+
+    <div class="section no-print">
+        <h3>Instructions:</h3>
+        <ol>
+            <li>Print this page on a secure, offline printer</li>
+            <li>Fold along the dashed line to hide the private key</li>
+            <li>Store in a fireproof safe or safety deposit box</li>
+            <li>Consider making multiple copies stored in different locations</li>
+            <li>Delete this file securely after printing</li>
+        </ol>
+    </div>
+
+    <p style="text-align: center; margin-top: 40px; color: #999;">
+        Generated by Coldstar | github.com/ExpertVagabond/coldstar-colosseum
+    </p>
+</body>
+</html>""")
+
+# Raw bytes per base64 chunk when streaming QR images; a multiple of 3 so the
+# encoded chunks concatenate without padding.
+_B64_CHUNK = 3 * 16384
+
+
+def _utc_iso_now() -> str:
+    """Current UTC time as an ISO-8601 string, without building a datetime"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+
+
+def _write_png_b64(f, image) -> None:
+    """Write a PIL image to an open text file as base64-encoded PNG data"""
+    import io
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    view = buffer.getbuffer()
+    try:
+        for i in range(0, len(view), _B64_CHUNK):
+            f.write(base64.b64encode(view[i:i + _B64_CHUNK]).decode())
+    finally:
+        view.release()
+
 
 class WalletBackup:
     """Secure wallet backup and restore operations"""
@@ -84,7 +228,7 @@ class WalletBackup:
     def _generate_simple_mnemonic(self, word_count: int) -> str:
         """Fallback mnemonic generation using random bytes"""
         # Generate random entropy
-        entropy = secrets.token_bytes(word_count * 2)
+        entropy = _SYSRAND.randbytes(word_count * 2)
 
         # Convert to word indices (simplified)
         words = []
@@ -143,7 +287,7 @@ class WalletBackup:
                 "nonce": base64.b64encode(nonce).decode(),
                 "ciphertext": base64.b64encode(encrypted.ciphertext).decode(),
                 "pubkey": str(keypair.pubkey()),
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": _utc_iso_now()
             }
 
         except Exception as e:
@@ -159,7 +303,7 @@ class WalletBackup:
             "data": base64.b64encode(bytes(keypair)).decode(),
             "pubkey": str(keypair.pubkey()),
             "warning": "NOT ENCRYPTED - FOR TESTING ONLY",
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": _utc_iso_now()
         }
 
     def import_encrypted(self, encrypted_data: dict, password: str) -> Optional[Keypair]:
@@ -206,139 +350,26 @@ class WalletBackup:
             output_path.mkdir(parents=True, exist_ok=True)
 
             pubkey = str(keypair.pubkey())
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = time.localtime()
+            timestamp = time.strftime("%Y%m%d_%H%M%S", now)
             filename = f"paper_wallet_{pubkey[:8]}_{timestamp}.html"
             filepath = output_path / filename
 
             # Generate QR codes
             pubkey_qr = qrcode.make(pubkey)
-            secret_qr = qrcode.make(base64.b64encode(bytes(keypair)).decode())
-
-            # Save QR images temporarily
-            import io
-            import base64 as b64
-
-            pubkey_buffer = io.BytesIO()
-            pubkey_qr.save(pubkey_buffer, format='PNG')
-            pubkey_b64 = b64.b64encode(pubkey_buffer.getvalue()).decode()
-
-            secret_buffer = io.BytesIO()
-            secret_qr.save(secret_buffer, format='PNG')
-            secret_b64 = b64.b64encode(secret_buffer.getvalue()).decode()
-
-            # Generate HTML paper wallet
-            html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Coldstar Paper Wallet</title>
-    <style>
-        body {{
-            font-family: 'Courier New', monospace;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 40px;
-            background: #fff;
-        }}
-        .header {{
-            text-align: center;
-            border-bottom: 3px solid #000;
-            padding-bottom: 20px;
-            margin-bottom: 30px;
-        }}
-        .section {{
-            margin: 30px 0;
-            padding: 20px;
-            border: 2px solid #000;
-        }}
-        .qr-container {{
-            text-align: center;
-            margin: 20px 0;
-        }}
-        .qr-container img {{
-            max-width: 250px;
-        }}
-        .address {{
-            word-break: break-all;
-            font-size: 14px;
-            background: #f0f0f0;
-            padding: 10px;
-            margin: 10px 0;
-        }}
-        .warning {{
-            background: #fff3cd;
-            border: 2px solid #ffc107;
-            padding: 15px;
-            margin: 20px 0;
-        }}
-        .fold-line {{
-            border-top: 2px dashed #ccc;
-            margin: 40px 0;
-            text-align: center;
-        }}
-        .fold-line::before {{
-            content: '✂ FOLD HERE - KEEP PRIVATE KEY HIDDEN ✂';
-            background: #fff;
-            padding: 0 20px;
-            position: relative;
-            top: -12px;
-            color: #999;
-        }}
-        @media print {{
-            .no-print {{ display: none; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>COLDSTAR PAPER WALLET</h1>
-        <p>Solana Cold Storage</p>
-        <p style="font-size: 12px;">Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")}</p>
-    </div>
-
-    <div class="section">
-        <h2>PUBLIC ADDRESS (Share this to receive SOL)</h2>
-        <div class="qr-container">
-            <img src="data:image/png;base64,{pubkey_b64}" alt="Public Key QR">
-        </div>
-        <div class="address">{pubkey}</div>
-    </div>
-
-    <div class="fold-line"></div>
-
-    <div class="section" style="background: #ffe6e6;">
-        <h2>PRIVATE KEY (NEVER SHARE!)</h2>
-        <div class="warning">
-            <strong>WARNING:</strong> Anyone with this key can steal all your funds!
-            Keep this hidden, secure, and never photograph or share it.
-        </div>
-        <div class="qr-container">
-            <img src="data:image/png;base64,{secret_b64}" alt="Private Key QR">
-        </div>
-        <div class="address" style="font-size: 10px;">
-            {base64.b64encode(bytes(keypair)).decode()}
-        </div>
-    </div>
-
-    <div class="section no-print">
-        <h3>Instructions:</h3>
-        <ol>
-            <li>Print this page on a secure, offline printer</li>
-            <li>Fold along the dashed line to hide the private key</li>
-            <li>Store in a fireproof safe or safety deposit box</li>
-            <li>Consider making multiple copies stored in different locations</li>
-            <li>Delete this file securely after printing</li>
-        </ol>
-    </div>
-
-    <p style="text-align: center; margin-top: 40px; color: #999;">
-        Generated by Coldstar | github.com/ExpertVagabond/coldstar-colosseum
-    </p>
-</body>
-</html>"""
-
-            with open(filepath, 'w') as f:
-                f.write(html_content)
+            kp_b64 = base64.b64encode(bytes(keypair)).decode()
+            secret_qr = qrcode.make(kp_b64)
+
+            # Stream the page to disk section by section so the PNG data
+            # is never held alongside a fully assembled HTML string
+            with open(filepath, 'w', buffering=131072) as f:
+                f.write(_PAPER_HEAD.substitute(
+                    generated=time.strftime("%Y-%m-%d %H:%M:%S UTC", now)
+                ))
+                _write_png_b64(f, pubkey_qr)
+                f.write(_PAPER_MIDDLE.substitute(pubkey=pubkey))
+                _write_png_b64(f, secret_qr)
+                f.write(_PAPER_TAIL.substitute(kp_b64=kp_b64))
 
             print_success(f"Paper wallet created: {filepath}")
             return str(filepath)
@@ -361,7 +392,7 @@ class WalletBackup:
                     "type": "plaintext_keypair",
                     "keypair": list(bytes(keypair)),
                     "pubkey": str(keypair.pubkey()),
-                    "created_at": datetime.utcnow().isoformat()
+                    "created_at": _utc_iso_now()
                 }
 
             with open(filepath, 'w') as f:
@@ -430,7 +461,7 @@ def interactive_backup():
         print_error("No wallet found to backup")
         return
 
-    import gc
+    from src.secure_memory import zeroize
 
     # Load encrypted wallet container
     container = wallet.load_encrypted_container(str(wallet_path))
@@ -477,6 +508,7 @@ def interactive_backup():
                 return
             from solders.keypair import Keypair
             keypair = Keypair.from_bytes(bytes(private_key))
+            zeroize(private_key)
             del private_key
         else:
             print_error("Rust signer required for wallet decryption")
@@ -506,7 +538,6 @@ def interactive_backup():
     finally:
         if keypair is not None:
             del keypair
-        gc.collect()
 
 
 if __name__ == "__main__":
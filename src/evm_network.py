@@ -29,6 +29,9 @@ class BaseNetwork:
         self.testnet = testnet
         self.client = httpx.Client(timeout=30.0)
         self._request_id = 0
+        # Set once the RPC has reported the expected chain ID; a URL cannot
+        # switch chains, so later checks only need a liveness probe
+        self._chain_id_verified = False
 
     def __enter__(self):
         return self
@@ -214,9 +217,17 @@ class BaseNetwork:
 
     def is_connected(self) -> bool:
         try:
-            result = self._make_rpc_request("eth_chainId")
-            chain_id = int(result.get("result", "0x0"), 16)
-            return chain_id == self.chain_id
+            if not self._chain_id_verified:
+                result = self._make_rpc_request("eth_chainId")
+                if "error" in result:
+                    return False
+                chain_id = int(result.get("result", "0x0"), 16)
+                if chain_id != self.chain_id:
+                    return False
+                self._chain_id_verified = True
+                return True
+            result = self._make_rpc_request("eth_blockNumber")
+            return "error" not in result
         except Exception:
             return False
 
@@ -261,4 +272,5 @@ class BaseNetwork:
     # ── Cleanup ─────────────────────────────────────────────
 
     def close(self):
+        self._chain_id_verified = False
         self.client.close()
@@ -11,9 +11,45 @@ B - Love U 3000
 import json
 import base64
 from pathlib import Path
-from typing import Optional
-
-from eth_account import Account
+from typing import List, Optional, Tuple
+
+# Optional libsecp256k1 signing path (falls back to eth-account's pure-Python ECDSA)
+try:
+    import coincurve
+    HAS_COINCURVE = True
+except ImportError:
+    HAS_COINCURVE = False
+
+# eth-account is only needed for the fallback signer; it costs ~1 s to import.
+# rlp and eth_utils (~0.2 s, mostly pydantic) are likewise imported inside
+# the generic encode/decode paths; the ETH transfer encoder needs neither.
+Account = None
+
+
+def _account():
+    """Import eth_account.Account lazily for the non-libsecp256k1 paths."""
+    global Account
+    if Account is None:
+        from eth_account import Account as _Account
+        Account = _Account
+    return Account
+
+
+# Keccak-256 backend, resolved once at import: call pycryptodome's C core
+# directly (skipping eth_utils' argument dispatch), then pysha3, then eth_utils.
+try:
+    from Crypto.Hash import keccak as _crypto_keccak
+
+    def keccak(data: bytes) -> bytes:
+        return _crypto_keccak.new(data=data, digest_bits=256).digest()
+except ImportError:
+    try:
+        from sha3 import keccak_256 as _sha3_keccak_256
+
+        def keccak(data: bytes) -> bytes:
+            return _sha3_keccak_256(data).digest()
+    except ImportError:
+        from eth_utils import keccak
 
 from config import (
     BASE_CHAIN_ID, BASE_TESTNET_CHAIN_ID,
@@ -21,16 +57,172 @@ from config import (
     INFRASTRUCTURE_FEE_PERCENTAGE, INFRASTRUCTURE_FEE_WALLET_BASE,
 )
 from src.ui import print_success, print_error, print_info, print_warning, console
+from src.secure_memory import zeroize
+from src._compat import json_loads
+
+# Bytes hex-encoded per write when saving signed transactions
+_HEX_CHUNK = 4096
+
+# transfer(address,uint256) function selector
+_ERC20_TRANSFER_SELECTOR = b"\xa9\x05\x9c\xbb"
+
+
+# Fixed EIP-1559 tx shape for the legacy JSON encoding: (key, value type)
+_EIP1559_SCHEMA = (
+    ("type", int),
+    ("chainId", int),
+    ("nonce", int),
+    ("to", str),
+    ("value", int),
+    ("gas", int),
+    ("maxFeePerGas", int),
+    ("maxPriorityFeePerGas", int),
+    ("data", bytes),
+)
+
+
+def _eip1559_fields(tx: dict) -> list:
+    """Unsigned EIP-1559 fields in RLP order (empty access list)."""
+    to = tx.get("to")
+    return [
+        tx["chainId"],
+        tx["nonce"],
+        tx["maxPriorityFeePerGas"],
+        tx["maxFeePerGas"],
+        tx["gas"],
+        bytes.fromhex(to[2:] if to.startswith("0x") else to) if to else b"",
+        tx["value"],
+        tx.get("data") or b"",
+        [],
+    ]
+
+
+def _rlp_list_prefix(length: int) -> bytes:
+    """RLP header for a list whose encoded items total `length` bytes."""
+    if length < 56:
+        return bytes((0xc0 + length,))
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes((0xf7 + len(length_bytes),)) + length_bytes
+
+
+def _rlp_list_body(encoded: bytes) -> bytes:
+    """Strip the list header from an RLP-encoded list."""
+    first = encoded[0]
+    return encoded[1:] if first <= 0xf7 else encoded[1 + first - 0xf7:]
+
+
+def _unsigned_payload(tx: dict) -> bytes:
+    """EIP-1559 signing payload: 0x02 || rlp(unsigned fields)."""
+    import rlp
+
+    return b"\x02" + rlp.encode(_eip1559_fields(tx))
+
+
+# Every tx field the EIP-1559 signing payload covers
+_SIGNED_FIELDS = (
+    "type", "chainId", "nonce", "maxPriorityFeePerGas", "maxFeePerGas",
+    "gas", "to", "value", "data", "accessList",
+)
+
+
+def _signing_key(tx: dict) -> tuple:
+    return tuple(tx.get(k) for k in _SIGNED_FIELDS)
+
+
+def _cached_payload(tx: dict) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """(payload, hash) precomputed by the create_* builders, or (None, None).
+
+    The cache is keyed on the signed fields, so a tx edited after it was
+    built (nonce bump, fee change) is re-encoded rather than signed stale.
+    """
+    cached = tx.get("_signing_cache")
+    if cached is None or cached[0] != _signing_key(tx):
+        return None, None
+    return cached[1], cached[2]
+
+
+def _public_tx(tx: dict) -> dict:
+    """Drop the private precomputed signing fields (leading underscore)."""
+    return {k: v for k, v in tx.items() if not k.startswith("_")}
+
+
+def _rlp_int(value: int) -> bytes:
+    """RLP-encode a non-negative integer (minimal big-endian byte string)."""
+    if value == 0:
+        return b"\x80"
+    if value < 0x80:
+        return bytes((value,))
+    data = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return bytes((0x80 + len(data),)) + data
+
+
+# gas=21000, and the trailing empty-data / empty-access-list pair
+_RLP_GAS_21000 = b"\x82\x52\x08"
+_RLP_EMPTY_DATA_AND_ACCESS_LIST = b"\x80\xc0"
+
+
+def _eth_transfer_payload(tx: dict) -> bytes:
+    """Signing payload for a plain 21000-gas ETH transfer.
+
+    Specialization of _unsigned_payload for the fixed transfer shape: only
+    the integer fields need length prefixes, so the generic rlp encoder is
+    skipped entirely.
+    """
+    to = tx["to"]
+    to20 = bytes.fromhex(to[2:] if to.startswith("0x") else to)
+    if len(to20) != 20:
+        raise ValueError(f"invalid recipient address: {to}")
+    body = b"".join((
+        _rlp_int(tx["chainId"]),
+        _rlp_int(tx["nonce"]),
+        _rlp_int(tx["maxPriorityFeePerGas"]),
+        _rlp_int(tx["maxFeePerGas"]),
+        _RLP_GAS_21000,
+        b"\x94", to20,
+        _rlp_int(tx["value"]),
+        _RLP_EMPTY_DATA_AND_ACCESS_LIST,
+    ))
+    return b"\x02" + _rlp_list_prefix(len(body)) + body
+
+
+def _sign_fast(tx: dict, signer: "coincurve.PrivateKey") -> Tuple[bytes, bytes]:
+    """Sign an EIP-1559 tx with libsecp256k1. Returns (raw signed tx, tx hash).
+
+    Reuses the payload and hash precomputed by the create_* builders while
+    the tx still matches them, so the unsigned fields are only RLP-encoded
+    once. Otherwise plain ETH transfers take the specialized encoder.
+    """
+    payload, msg_hash = _cached_payload(tx)
+    if payload is None:
+        if tx["gas"] == 21000 and not tx.get("data") and tx.get("to"):
+            payload = _eth_transfer_payload(tx)
+        else:
+            payload = _unsigned_payload(tx)
+        msg_hash = keccak(payload)
+    sig = signer.sign_recoverable(msg_hash, hasher=None)
+    body = b"".join((
+        _rlp_list_body(payload[1:]),
+        _rlp_int(sig[64]),
+        _rlp_int(int.from_bytes(sig[:32], "big")),
+        _rlp_int(int.from_bytes(sig[32:64], "big")),
+    ))
+    raw = b"\x02" + _rlp_list_prefix(len(body)) + body
+    return raw, keccak(raw)
 
 
 class EVMTransactionManager:
     """Build and sign EVM transactions for Base L2."""
 
-    def __init__(self, testnet: bool = False):
+    def __init__(self, testnet: bool = False, verbose: bool = True):
         self.testnet = testnet
         self.chain_id = BASE_TESTNET_CHAIN_ID if testnet else BASE_CHAIN_ID
+        # Set False for scripted/batch use to skip the per-tx summary output
+        self.verbose = verbose
+        self._chain_label = f"Base {'Sepolia' if testnet else 'Mainnet'} ({self.chain_id})"
         self.unsigned_tx: Optional[dict] = None
         self.signed_tx_bytes: Optional[bytes] = None
+        # "0x"-prefixed hex of signed_tx_bytes, encoded once per signature
+        self._signed_hex: Optional[str] = None
 
     # ── Fee calculation ─────────────────────────────────────
 
@@ -40,6 +232,15 @@ class EVMTransactionManager:
 
     # ── Build unsigned transactions ─────────────────────────
 
+    def _precompute_signing_hash(self, tx: dict) -> None:
+        """Cache the unsigned RLP payload and its hash on the tx for signing.
+
+        Stored under an underscore key, which is stripped before serialization,
+        together with the field values it was computed from.
+        """
+        payload = _unsigned_payload(tx)
+        tx["_signing_cache"] = (_signing_key(tx), payload, keccak(payload))
+
     def create_eth_transfer(
         self,
         from_address: str,
@@ -65,23 +266,25 @@ class EVMTransactionManager:
                 "maxPriorityFeePerGas": max_priority_fee_per_gas,
                 "data": b"",
             }
+            self._precompute_signing_hash(tx)
 
             self.unsigned_tx = tx
 
-            print_success("Created unsigned EIP-1559 transaction")
-            print_info(f"  From:    {from_address}")
-            print_info(f"  To:      {to_address}")
-            print_info(f"  Amount:  {amount_eth} ETH ({value_wei} wei)")
-            print_info(f"  Nonce:   {nonce}")
-            print_info(f"  Gas:     {gas_limit}")
-            print_info(f"  Max fee: {max_fee_per_gas / GWEI_PER_ETH:.4f} gwei")
-            print_info(f"  Tip:     {max_priority_fee_per_gas / GWEI_PER_ETH:.4f} gwei")
-            print_info(f"  Chain:   Base {'Sepolia' if self.testnet else 'Mainnet'} ({self.chain_id})")
-
-            # Infrastructure fee transfer (separate tx, not bundled)
-            infra_fee_wei = self.calculate_infrastructure_fee(value_wei)
-            if infra_fee_wei > 0 and INFRASTRUCTURE_FEE_WALLET_BASE != "0x" + "0" * 40:
-                print_info(f"  Infra fee: {infra_fee_wei / WEI_PER_ETH:.9f} ETH (separate tx)")
+            if self.verbose:
+                print_success("Created unsigned EIP-1559 transaction")
+                print_info(f"  From:    {from_address}")
+                print_info(f"  To:      {to_address}")
+                print_info(f"  Amount:  {amount_eth} ETH ({value_wei} wei)")
+                print_info(f"  Nonce:   {nonce}")
+                print_info(f"  Gas:     {gas_limit}")
+                print_info(f"  Max fee: {max_fee_per_gas / GWEI_PER_ETH:.4f} gwei")
+                print_info(f"  Tip:     {max_priority_fee_per_gas / GWEI_PER_ETH:.4f} gwei")
+                print_info(f"  Chain:   {self._chain_label}")
+
+                # Infrastructure fee transfer (separate tx, not bundled)
+                infra_fee_wei = self.calculate_infrastructure_fee(value_wei)
+                if infra_fee_wei > 0 and INFRASTRUCTURE_FEE_WALLET_BASE != "0x" + "0" * 40:
+                    print_info(f"  Infra fee: {infra_fee_wei / WEI_PER_ETH:.9f} ETH (separate tx)")
 
             return tx
 
@@ -102,11 +305,16 @@ class EVMTransactionManager:
     ) -> Optional[dict]:
         """Create an unsigned ERC-20 transfer transaction."""
         try:
-            # Encode transfer(address,uint256) call data
-            # Function selector: 0xa9059cbb
-            padded_to = to_address[2:].lower().zfill(64)
-            padded_amount = hex(amount_raw)[2:].zfill(64)
-            data = bytes.fromhex("a9059cbb" + padded_to + padded_amount)
+            # Encode transfer(address,uint256) call data:
+            # selector || address left-padded to 32 bytes || uint256 amount
+            to_bytes = bytes.fromhex(to_address[2:] if to_address.startswith("0x") else to_address)
+            if len(to_bytes) != 20:
+                raise ValueError(f"invalid recipient address: {to_address}")
+            buf = bytearray(68)
+            buf[0:4] = _ERC20_TRANSFER_SELECTOR
+            buf[16:36] = to_bytes
+            buf[36:68] = amount_raw.to_bytes(32, "big")
+            data = bytes(buf)
 
             tx = {
                 "type": 2,
@@ -119,14 +327,16 @@ class EVMTransactionManager:
                 "maxPriorityFeePerGas": max_priority_fee_per_gas,
                 "data": data,
             }
+            self._precompute_signing_hash(tx)
 
             self.unsigned_tx = tx
 
-            print_success("Created unsigned ERC-20 transfer")
-            print_info(f"  Token:   {token_address}")
-            print_info(f"  From:    {from_address}")
-            print_info(f"  To:      {to_address}")
-            print_info(f"  Amount:  {amount_raw} (raw token units)")
+            if self.verbose:
+                print_success("Created unsigned ERC-20 transfer")
+                print_info(f"  Token:   {token_address}")
+                print_info(f"  From:    {from_address}")
+                print_info(f"  To:      {to_address}")
+                print_info(f"  Amount:  {amount_raw} (raw token units)")
 
             return tx
 
@@ -136,15 +346,59 @@ class EVMTransactionManager:
 
     # ── Signing ─────────────────────────────────────────────
 
+    @staticmethod
+    def _can_sign_fast(tx: dict) -> bool:
+        return HAS_COINCURVE and tx.get("type") == 2 and not tx.get("accessList")
+
+    def _sign(self, tx: dict, private_key: bytes) -> Tuple[bytes, bytes]:
+        """Sign with libsecp256k1 when available, else eth-account. Returns (raw, hash)."""
+        # Both signers take the (zeroizable) bytearray directly; no bytes copy
+        if self._can_sign_fast(tx):
+            return _sign_fast(tx, coincurve.PrivateKey(private_key))
+        signed = _account().sign_transaction(_public_tx(tx), private_key)
+        return bytes(signed.raw_transaction), bytes(signed.hash)
+
+    def _store_signed(self, raw: bytes, hex_str: Optional[str] = None) -> None:
+        """Record a signed tx and its broadcast hex (replacing any previous one)."""
+        self.signed_tx_bytes = raw
+        self._signed_hex = hex_str or "0x" + raw.hex()
+
+    def sign_transaction_batch(self, txs: List[dict], private_key: bytes) -> Optional[List[bytes]]:
+        """Sign several transactions with one key. Returns raw signed txs in order.
+
+        The key is parsed once for the whole batch instead of once per tx.
+        """
+        try:
+            signer = coincurve.PrivateKey(private_key) if HAS_COINCURVE else None
+            account = None
+            signed_txs = []
+            for tx in txs:
+                if signer is not None and self._can_sign_fast(tx):
+                    raw, _ = _sign_fast(tx, signer)
+                else:
+                    if account is None:
+                        account = _account().from_key(private_key)
+                    raw = bytes(account.sign_transaction(_public_tx(tx)).raw_transaction)
+                signed_txs.append(raw)
+
+            if self.verbose:
+                print_success(f"Signed {len(signed_txs)} transactions")
+            return signed_txs
+
+        except Exception as e:
+            print_error(f"Failed to sign transaction batch: {e}")
+            return None
+
     def sign_transaction(self, tx: dict, private_key: bytes) -> Optional[bytes]:
         """Sign a transaction with a raw private key. Returns raw signed tx bytes."""
         try:
-            signed = Account.sign_transaction(tx, private_key)
-            self.signed_tx_bytes = signed.raw_transaction
+            raw, tx_hash = self._sign(tx, private_key)
+            self._store_signed(raw)
 
-            print_success("Transaction signed!")
-            print_info(f"  Tx hash:  {signed.hash.hex()}")
-            print_info(f"  Raw size: {len(self.signed_tx_bytes)} bytes")
+            if self.verbose:
+                print_success("Transaction signed!")
+                print_info(f"  Tx hash:  0x{tx_hash.hex()}")
+                print_info(f"  Raw size: {len(self.signed_tx_bytes)} bytes")
 
             return self.signed_tx_bytes
 
@@ -184,21 +438,23 @@ class EVMTransactionManager:
             print_info("  Step 2: Key decrypted for signing")
             print_success("    Signing EIP-1559 transaction...")
 
-            # Sign
-            signed = Account.sign_transaction(tx, private_key)
-            self.signed_tx_bytes = signed.raw_transaction
-
-            # Wipe key from memory immediately
-            import gc
-            del private_key
-            gc.collect()
+            # Sign, then overwrite the key buffer in place (a GC pass would
+            # stall the interpreter without actually clearing the bytes)
+            if not isinstance(private_key, bytearray):
+                private_key = bytearray(private_key)
+            try:
+                raw, tx_hash = self._sign(tx, private_key)
+            finally:
+                zeroize(private_key)
+                del private_key
+            self._store_signed(raw)
 
             print_info("  Step 3: Signature complete")
             print_success("    Private key: WIPED from memory")
             print_info("-------------------------------------------")
             print_success("TRANSACTION SIGNED SECURELY!")
             print_info("-------------------------------------------")
-            print_info(f"  Tx hash:  {signed.hash.hex()}")
+            print_info(f"  Tx hash:  0x{tx_hash.hex()}")
             print_info(f"  Raw size: {len(self.signed_tx_bytes)} bytes")
             console.print()
 
@@ -210,48 +466,83 @@ class EVMTransactionManager:
 
     # ── Serialization (for QR / file transfer) ──────────────
 
-    def serialize_unsigned_tx(self, tx: dict) -> str:
-        """Serialize unsigned tx to JSON string for QR transfer."""
-        serializable = {}
-        for k, v in tx.items():
-            if isinstance(v, bytes):
-                serializable[k] = "0x" + v.hex()
-            elif isinstance(v, int):
-                serializable[k] = v
-            else:
-                serializable[k] = v
-        return json.dumps(serializable, separators=(',', ':'))
+    def serialize_unsigned_tx(self, tx: dict, legacy: bool = False) -> str:
+        """Serialize unsigned tx for QR transfer.
+
+        Emits the canonical EIP-1559 signing payload (0x02 || rlp(fields)) as
+        unpadded base64url. Pass legacy=True for the older JSON encoding.
+        """
+        if legacy:
+            return json.dumps(
+                {k: "0x" + tx[k].hex() if t is bytes else tx[k] for k, t in _EIP1559_SCHEMA},
+                separators=(',', ':'),
+            )
+
+        payload = _cached_payload(tx)[0] or _unsigned_payload(tx)
+        return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
 
     def deserialize_unsigned_tx(self, data: str) -> Optional[dict]:
-        """Deserialize unsigned tx from JSON string (from QR scan)."""
+        """Deserialize unsigned tx from QR/file payload (RLP or legacy JSON)."""
         try:
-            tx = json.loads(data)
-            # Convert hex data field back to bytes
-            if "data" in tx and isinstance(tx["data"], str):
-                if tx["data"].startswith("0x"):
-                    tx["data"] = bytes.fromhex(tx["data"][2:])
-                else:
-                    tx["data"] = b""
-            return tx
+            if data.lstrip().startswith("{"):
+                return self._deserialize_unsigned_json(data)
+
+            import rlp
+            from eth_utils import to_checksum_address
+
+            payload = base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+            if payload[:1] != b"\x02":
+                raise ValueError("not an EIP-1559 payload")
+            fields = rlp.decode(payload[1:])
+            if len(fields) != 9:
+                raise ValueError(f"expected 9 fields, got {len(fields)}")
+            if fields[8]:
+                raise ValueError("access lists are not supported")
+
+            chain_id, nonce, tip, max_fee, gas, to, value, call_data, _ = fields
+            return {
+                "type": 2,
+                "chainId": int.from_bytes(chain_id, "big"),
+                "nonce": int.from_bytes(nonce, "big"),
+                "to": to_checksum_address(to) if to else None,
+                "value": int.from_bytes(value, "big"),
+                "gas": int.from_bytes(gas, "big"),
+                "maxFeePerGas": int.from_bytes(max_fee, "big"),
+                "maxPriorityFeePerGas": int.from_bytes(tip, "big"),
+                "data": call_data,
+            }
         except Exception as e:
             print_error(f"Failed to deserialize transaction: {e}")
             return None
 
+    def _deserialize_unsigned_json(self, data: str) -> dict:
+        """Decode the legacy JSON serialization."""
+        tx = json_loads(data)
+        # Convert hex data field back to bytes
+        if "data" in tx and isinstance(tx["data"], str):
+            if tx["data"].startswith("0x"):
+                tx["data"] = bytes.fromhex(tx["data"][2:])
+            else:
+                tx["data"] = b""
+        return tx
+
     # ── File save/load ──────────────────────────────────────
 
+    def _write_tx_header(self, f, tx_type: str) -> None:
+        """Write the JSON envelope up to the opening quote of the "data" value."""
+        f.write(
+            '{"type":"%s","version":"1.0","chain":"base","chain_id":%d,"data":"'
+            % (tx_type, self.chain_id)
+        )
+
     def save_unsigned_transaction(self, tx: dict, path: str) -> bool:
         try:
             filepath = Path(path)
             filepath.parent.mkdir(parents=True, exist_ok=True)
-            tx_data = {
-                "type": "unsigned_evm_transaction",
-                "version": "1.0",
-                "chain": "base",
-                "chain_id": self.chain_id,
-                "data": self.serialize_unsigned_tx(tx),
-            }
             with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+                self._write_tx_header(f, "unsigned_evm_transaction")
+                f.write(self.serialize_unsigned_tx(tx))
+                f.write('"}')
             print_success(f"Unsigned transaction saved to: {filepath}")
             return True
         except Exception as e:
@@ -264,8 +555,8 @@ class EVMTransactionManager:
             if not filepath.exists():
                 print_error(f"Transaction file not found: {filepath}")
                 return None
-            with open(filepath, 'r') as f:
-                tx_data = json.load(f)
+            with open(filepath, 'rb') as f:
+                tx_data = json_loads(f.read())
             if tx_data.get("type") != "unsigned_evm_transaction":
                 print_error("Invalid transaction file format")
                 return None
@@ -281,15 +572,17 @@ class EVMTransactionManager:
         try:
             filepath = Path(path)
             filepath.parent.mkdir(parents=True, exist_ok=True)
-            tx_data = {
-                "type": "signed_evm_transaction",
-                "version": "1.0",
-                "chain": "base",
-                "chain_id": self.chain_id,
-                "data": "0x" + signed_bytes.hex(),
-            }
             with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+                self._write_tx_header(f, "signed_evm_transaction")
+                if signed_bytes is self.signed_tx_bytes and self._signed_hex:
+                    f.write(self._signed_hex)
+                else:
+                    f.write("0x")
+                    # Hex-encode in chunks rather than materializing the full string
+                    view = memoryview(signed_bytes)
+                    for i in range(0, len(view), _HEX_CHUNK):
+                        f.write(view[i:i + _HEX_CHUNK].hex())
+                f.write('"}')
             print_success(f"Signed transaction saved to: {filepath}")
             return True
         except Exception as e:
@@ -302,15 +595,15 @@ class EVMTransactionManager:
             if not filepath.exists():
                 print_error(f"Transaction file not found: {filepath}")
                 return None
-            with open(filepath, 'r') as f:
-                tx_data = json.load(f)
+            with open(filepath, 'rb') as f:
+                tx_data = json_loads(f.read())
             if tx_data.get("type") != "signed_evm_transaction":
                 print_error("Invalid signed transaction file format")
                 return None
             hex_data = tx_data["data"]
             if hex_data.startswith("0x"):
                 hex_data = hex_data[2:]
-            self.signed_tx_bytes = bytes.fromhex(hex_data)
+            self._store_signed(bytes.fromhex(hex_data), "0x" + hex_data.lower())
             print_success(f"Loaded signed transaction from: {filepath}")
             return self.signed_tx_bytes
         except Exception as e:
@@ -322,4 +615,6 @@ class EVMTransactionManager:
         if self.signed_tx_bytes is None:
             print_error("No signed transaction available")
             return None
-        return "0x" + self.signed_tx_bytes.hex()
+        if self._signed_hex is None:
+            self._signed_hex = "0x" + self.signed_tx_bytes.hex()
+        return self._signed_hex
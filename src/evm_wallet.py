@@ -8,32 +8,113 @@ format used by the Solana wallet (Argon2id + AES-256-GCM).
 B - Love U 3000
 """
 
-import json
 import os
-import gc
 import sys
-import base64
-import secrets
+import functools
+import importlib.util
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from eth_account import Account
-from eth_account.signers.local import LocalAccount
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
 
 from src.ui import (
     print_success, print_error, print_info, print_warning,
     get_password_input, confirm_dangerous_action,
 )
-from src.secure_memory import SecureWalletHandler
+from src.secure_memory import SecureWalletHandler, zeroize
+from src._compat import json_dumps, json_loads
+
+# Rust signer (python_signer_example.py at the repo root) for encrypted
+# container management; probed once per process without touching sys.path
+_RUST_SIGNER_PATH = Path(__file__).resolve().parent.parent / "python_signer_example.py"
+
+
+@functools.lru_cache(1)
+def _probe_rust_signer():
+    """Return the SolanaSecureSigner class, or None if it can't be loaded."""
+    module = sys.modules.get("python_signer_example")
+    if module is None:
+        try:
+            spec = importlib.util.spec_from_file_location(
+                "python_signer_example", _RUST_SIGNER_PATH
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception:
+            return None  # Fall back to Python-only encryption
+        sys.modules["python_signer_example"] = module
+    return getattr(module, "SolanaSecureSigner", None)
+
 
-# Try to import Rust signer for encrypted container management
-RUST_SIGNER_AVAILABLE = False
 try:
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-    from python_signer_example import SolanaSecureSigner  # reuse encryption primitives
-    RUST_SIGNER_AVAILABLE = True
+    import coincurve
+    HAS_COINCURVE = True
 except ImportError:
-    pass  # Fall back to Python-only encryption
+    HAS_COINCURVE = False
+
+# eth-account pulls in eth_keys, eth_utils, rlp and pycryptodome (~1 s cold),
+# so it is imported on first use rather than when the CLI starts
+Account = None
+
+
+def _account():
+    """Return eth_account.Account, importing it on first call."""
+    global Account
+    if Account is None:
+        from eth_account import Account as _Account
+        Account = _Account
+    return Account
+
+
+def _generate_secp256k1_key() -> Tuple[bytearray, str]:
+    """Generate a private key (as a zeroizable bytearray) and its checksummed address."""
+    from eth_utils import keccak, to_checksum_address
+
+    while True:
+        private_key = bytearray(os.urandom(32))
+        try:
+            public_key = coincurve.PrivateKey(private_key).public_key
+            break
+        except ValueError:
+            zeroize(private_key)
+            continue  # zero or >= curve order (~2**-128 odds)
+    address = keccak(public_key.format(compressed=False)[1:])[-20:]
+    return private_key, to_checksum_address(address)
+
+
+# str.translate table that strips hex digits (used by validate_address)
+_HEX_DIGITS_DELETE = str.maketrans("", "", "0123456789abcdefABCDEF")
+
+# Rust container fields that may arrive as JSON int arrays instead of base64
+_CONTAINER_BYTE_FIELDS = ("ciphertext", "nonce", "salt")
+
+
+def _normalize_container(container: dict) -> dict:
+    """Return a Rust container with byte-array fields as base64 strings.
+
+    Containers that are already normalized are returned as-is (no copy);
+    otherwise a converted copy is returned.
+    """
+    array_fields = [f for f in _CONTAINER_BYTE_FIELDS if container.get(f).__class__ is list]
+    if not array_fields and "version" in container:
+        return container
+
+    import base64
+
+    normalized = container.copy()
+    normalized.setdefault("version", 1)
+    for field in array_fields:
+        normalized[field] = base64.b64encode(bytes(normalized[field])).decode("ascii")
+    return normalized
+
+
+def _prefix_address(container: dict) -> dict:
+    """Give a loaded container's address the canonical 0x prefix, in place."""
+    address = container.get("address")
+    if address and not address.startswith("0x"):
+        container["address"] = "0x" + address
+    return container
 
 
 class EVMWalletManager:
@@ -41,7 +122,11 @@ class EVMWalletManager:
 
     def __init__(self, wallet_dir: str = None):
         self.wallet_dir = Path(wallet_dir) if wallet_dir else None
-        self.account: Optional[LocalAccount] = None
+        # Raw key (mutable, so it can be zeroized) + address; the
+        # eth-account object is only built on demand
+        self._private_key: Optional[bytearray] = None
+        self._address: Optional[str] = None
+        self._local_account: Optional["LocalAccount"] = None
         self.keypair_path: Optional[Path] = None
         self.address_path: Optional[Path] = None
         self.encrypted_container: Optional[dict] = None
@@ -49,12 +134,32 @@ class EVMWalletManager:
 
         # Try Rust signer for encryption (optional — Python fallback available)
         self.rust_signer = None
-        if RUST_SIGNER_AVAILABLE:
+        signer_cls = _probe_rust_signer()
+        if signer_cls is not None:
             try:
-                self.rust_signer = SolanaSecureSigner()
+                self.rust_signer = signer_cls()
             except Exception:
                 pass
 
+    @property
+    def account(self) -> Optional["LocalAccount"]:
+        """eth-account view of the in-memory key, constructed on first access."""
+        if self._local_account is None and self._private_key is not None:
+            self._local_account = _account().from_key(self._private_key)
+        return self._local_account
+
+    @account.setter
+    def account(self, value: Optional["LocalAccount"]):
+        self._local_account = value
+        if self._private_key is not None:
+            zeroize(self._private_key)
+        if value is None:
+            self._private_key = None
+            self._address = None
+        else:
+            self._private_key = bytearray(value.key)
+            self._address = value.address
+
     def set_wallet_directory(self, path: str):
         self.wallet_dir = Path(path)
         self.keypair_path = self.wallet_dir / "evm_keypair.json"
@@ -62,23 +167,27 @@ class EVMWalletManager:
 
     # ── Key Generation ──────────────────────────────────────
 
-    def generate_keypair(self) -> Tuple[LocalAccount, str]:
-        """Generate a new secp256k1 keypair for EVM."""
-        # Use secrets for cryptographically secure randomness
-        private_key = secrets.token_bytes(32)
-        self.account = Account.from_key(private_key)
-        address = self.account.address
+    def generate_keypair(self) -> str:
+        """Generate a new secp256k1 keypair for EVM. Returns the address.
+
+        The key stays in memory until save_keypair(); `self.account` gives
+        an eth-account view of it if one is needed.
+        """
+        if HAS_COINCURVE:
+            self.account = None
+            self._private_key, self._address = _generate_secp256k1_key()
+        else:
+            self.account = _account().from_key(os.urandom(32))
+        address = self._address
         print_success(f"Generated new EVM keypair")
         print_info(f"Address: {address}")
-        # Wipe the intermediate private_key reference
-        del private_key
-        return self.account, address
+        return address
 
     # ── Save / Load ─────────────────────────────────────────
 
     def save_keypair(self, path: str = None) -> bool:
         """Encrypt and save EVM private key to disk."""
-        if self.account is None:
+        if self._private_key is None:
             print_error("No keypair to save. Generate one first.")
             return False
 
@@ -102,34 +211,37 @@ class EVMWalletManager:
                 return False
 
             # Get raw 32-byte private key
-            private_key_bytes = self.account.key
+            private_key_bytes = self._private_key
 
             # Encrypt using Rust signer if available, else Python fallback
             if self.rust_signer:
+                # The FFI wrapper only accepts bytes (it base58-encodes them)
                 container = self.rust_signer.create_encrypted_container(
                     bytes(private_key_bytes), password
                 )
                 container = self._normalize_container_format(container)
                 container["chain"] = "evm"
-                container["address"] = self.account.address
+                container["address"] = self._address
             else:
                 # Python-only fallback using eth-account's keystore
-                container = Account.encrypt(private_key_bytes, password)
+                container = _account().encrypt(private_key_bytes, password)
                 container["chain"] = "evm"
 
-            with open(save_path, 'w') as f:
-                json.dump(container, f, indent=2)
+            # Create owner-only from the start so the key file is never
+            # briefly world-readable between open() and chmod()
+            fd = os.open(save_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o600)  # O_CREAT mode doesn't apply to existing files
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json_dumps(container))
 
             # Save address in plaintext for quick lookup
             address_path = save_path.parent / "evm_address.txt"
             with open(address_path, 'w') as f:
-                f.write(self.account.address)
+                f.write(self._address)
 
-            os.chmod(save_path, 0o600)
-
-            # Clear plaintext key from memory
+            # Overwrite the plaintext key in place
             self.account = None
-            gc.collect()
 
             print_success(f"Encrypted EVM keypair saved to {save_path}")
             print_success(f"Address saved to {address_path}")
@@ -139,7 +251,7 @@ class EVMWalletManager:
             print_error(f"Failed to save keypair: {e}")
             return False
 
-    def load_keypair(self, path: str = None) -> Optional[LocalAccount]:
+    def load_keypair(self, path: str = None) -> Optional["LocalAccount"]:
         """Load and decrypt EVM keypair from disk."""
         load_path = Path(path) if path else self.keypair_path
         if load_path is None or not load_path.exists():
@@ -147,15 +259,15 @@ class EVMWalletManager:
             return None
 
         try:
-            with open(load_path, 'r') as f:
-                data = json.load(f)
+            with open(load_path, 'rb') as f:
+                data = json_loads(f.read())
 
             if not data:
                 print_error("Wallet file is empty or corrupted!")
                 return None
 
             # Store encrypted container (don't decrypt yet)
-            self.encrypted_container = data
+            self.encrypted_container = _prefix_address(data)
             print_info("EVM wallet loaded (encrypted).")
             return None  # Password requested at signing time
 
@@ -171,8 +283,8 @@ class EVMWalletManager:
             return None
 
         try:
-            with open(load_path, 'r') as f:
-                data = json.load(f)
+            with open(load_path, 'rb') as f:
+                data = json_loads(f.read())
 
             if not data:
                 print_error("Wallet file is empty or corrupted!")
@@ -190,7 +302,7 @@ class EVMWalletManager:
                 print_error("Unknown wallet format")
                 return None
 
-            self.encrypted_container = data
+            self.encrypted_container = _prefix_address(data)
             return data
 
         except Exception as e:
@@ -201,19 +313,17 @@ class EVMWalletManager:
 
     def get_address(self) -> Optional[str]:
         """Get the EVM address from loaded account or file."""
-        if self.account:
-            return self.account.address
+        if self._address:
+            return self._address
         return self.get_address_from_file()
 
     def get_address_from_file(self, path: str = None) -> Optional[str]:
         addr_path = Path(path) if path else self.address_path
         if addr_path is None or not addr_path.exists():
             # Try reading from encrypted container
+            # (address is 0x-prefixed when the container is loaded)
             if self.encrypted_container and "address" in self.encrypted_container:
-                addr = self.encrypted_container["address"]
-                if not addr.startswith("0x"):
-                    addr = "0x" + addr
-                return addr
+                return self.encrypted_container["address"]
             return None
         try:
             with open(addr_path, 'r') as f:
@@ -224,31 +334,33 @@ class EVMWalletManager:
     @staticmethod
     def validate_address(address: str) -> bool:
         """Validate an EVM address (basic checksum-aware check)."""
-        if not address or not address.startswith("0x"):
-            return False
-        if len(address) != 42:
-            return False
-        try:
-            int(address, 16)
-            return True
-        except ValueError:
-            return False
+        # Deleting every hex digit must leave nothing behind; avoids int()'s
+        # bignum allocation and exception path on bad input
+        return (
+            isinstance(address, str)
+            and len(address) == 42
+            and address.startswith("0x")
+            and not address[2:].translate(_HEX_DIGITS_DELETE)
+        )
 
     # ── Decryption (for signing) ────────────────────────────
 
-    def decrypt_private_key(self, container: dict, password: str) -> Optional[bytes]:
-        """Decrypt private key from container. Returns raw 32-byte key."""
+    def decrypt_private_key(self, container: dict, password: str) -> Optional[bytearray]:
+        """Decrypt private key from container.
+
+        Returns the raw 32-byte key as a bytearray so the caller can zeroize it.
+        """
         try:
             if "ciphertext" in container and self.rust_signer:
                 # Rust format — decrypt via Rust signer
                 private_key = self.rust_signer.decrypt_private_key(container, password)
                 if private_key and len(private_key) == 32:
-                    return bytes(private_key)
+                    return private_key if isinstance(private_key, bytearray) else bytearray(private_key)
                 return None
             elif "crypto" in container:
                 # eth-account keystore format
-                private_key = Account.decrypt(container, password)
-                return private_key
+                private_key = _account().decrypt(container, password)
+                return bytearray(private_key)
             else:
                 print_error("Unknown container format")
                 return None
@@ -259,23 +371,20 @@ class EVMWalletManager:
     # ── Memory Management ───────────────────────────────────
 
     def clear_memory(self):
-        """Securely clear loaded key material from memory."""
+        """Securely clear loaded key material from memory.
+
+        The raw key buffer is overwritten in place; copies held by an
+        eth-account object (immutable bytes) can only be dropped.
+        """
         self.account = None
         self.encrypted_container = None
         self._cached_password = None
-        gc.collect()
 
     # ── Helpers ──────────────────────────────────────────────
 
     def _normalize_container_format(self, container: dict) -> dict:
         """Normalize Rust container — convert array fields to base64 strings."""
-        normalized = container.copy()
-        if 'version' not in normalized:
-            normalized['version'] = 1
-        for field in ['ciphertext', 'nonce', 'salt']:
-            if field in normalized and isinstance(normalized[field], list):
-                normalized[field] = base64.b64encode(bytes(normalized[field])).decode('utf-8')
-        return normalized
+        return _normalize_container(container)
 
     def keypair_exists(self, path: str = None) -> bool:
         check_path = Path(path) if path else self.keypair_path
@@ -10,19 +10,45 @@ B - Love U 3000
 """
 
 import os
+import sys
+import bisect
+import json
 import time
+import logging
+import atexit
+import asyncio
+import sqlite3
+import threading
 import httpx
-from typing import Optional, Dict, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, Iterable, List, Sequence, Tuple, Union
 
 from rich.panel import Panel
 from rich.table import Table
 
+from config import FAIRSCORE_STATIC_TIERS
 from src.ui import print_success, print_error, print_info, print_warning, console
+from src._compat import HAS_HTTP2, json_loads
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
 
 
 # FairScale API Configuration
 FAIRSCORE_API_BASE = os.environ.get("FAIRSCORE_API_URL", "https://api2.fairscale.xyz")
 FAIRSCORE_API_KEY = os.environ.get("FAIRSCORE_API_KEY", "")
+# Opt-in on-disk score cache shared across runs. It records which wallets
+# were looked up, so scores stay in memory unless a path is set, e.g.
+# FAIRSCORE_CACHE_DB=~/.coldstar/fairscore.db (see PRIVACY.md)
+DEFAULT_CACHE_DB = os.path.expanduser("~/.coldstar/fairscore.db")
+FAIRSCORE_CACHE_DB = os.path.expanduser(os.environ.get("FAIRSCORE_CACHE_DB", ""))
 
 # Map FairScale string tiers to our numeric tier system (1-5)
 TIER_MAP = {
@@ -33,19 +59,14 @@ TIER_MAP = {
     "diamond": 5,
 }
 
-# Score-based fallback tier mapping (if string tier is missing)
+# Score-based fallback tier mapping (if string tier is missing):
+# <20 -> 1, <40 -> 2, <60 -> 3, <80 -> 4, else 5
+_TIER_THRESHOLDS = (20, 40, 60, 80)
+
+
 def score_to_tier(score: float) -> int:
     """Convert fairscore (0-100) to tier (1-5)."""
-    if score < 20:
-        return 1
-    elif score < 40:
-        return 2
-    elif score < 60:
-        return 3
-    elif score < 80:
-        return 4
-    else:
-        return 5
+    return bisect.bisect_right(_TIER_THRESHOLDS, score) + 1
 
 # Tier definitions for display and gating
 TIER_DEFINITIONS = {
@@ -91,6 +112,23 @@ TIER_DEFINITIONS = {
     },
 }
 
+# Score cache bounds - reputation changes slowly
+CACHE_MAXSIZE = 10_000
+CACHE_TTL = 300  # 5 minutes
+# A 404 ("no score for this wallet") is reported as UNKNOWN like any other
+# failed lookup, but it is stable, so the API isn't asked again for longer
+UNSCORED_CACHE_TTL = 3600  # 1 hour
+# Short-lived failure cache so an API outage isn't retried on every call
+FAIL_CACHE_MAXSIZE = 1024
+FAIL_CACHE_TTL = 30
+# Minimum seconds between console warnings; every failure still goes to logging
+WARN_INTERVAL = 5.0
+
+# Concurrent /score requests when the batch endpoint is unavailable
+BATCH_FALLBACK_WORKERS = 5
+# Wallets per batch request when warming the cache
+PREFETCH_CHUNK = 50
+
 # Dynamic transaction limits by tier (SOL)
 TIER_LIMITS = {
     1: 0,          # Blocked
@@ -101,28 +139,440 @@ TIER_LIMITS = {
 }
 
 
-class FairScoreClient:
-    """Client for FairScale reputation scoring API"""
+def _limit_label(limit: float) -> str:
+    if limit == float("inf"):
+        return "Unlimited"
+    return f"{limit} SOL" if limit > 0 else "BLOCKED"
+
+
+# Display strings derived from the tables above, built once at import
+_SCORE_RANGES = {1: "0-19", 2: "20-39", 3: "40-59", 4: "60-79", 5: "80-100"}
+
+_LEGEND_ROWS = tuple(
+    (
+        str(tier),
+        f"[{info['color']}]{info['api_tier']}[/{info['color']}]",
+        f"[{info['color']}]{info['label']}[/{info['color']}]",
+        _SCORE_RANGES[tier],
+        f"[{info['color']}]{info['action']}[/{info['color']}]",
+        _limit_label(TIER_LIMITS.get(tier, 0)),
+        info["description"],
+    )
+    for tier, info in sorted(TIER_DEFINITIONS.items())
+)
+
+for _info in TIER_DEFINITIONS.values():
+    _info["rendered_badge"] = f"[{_info['color']}]{_info['icon']} {_info['label']}[/{_info['color']}]"
+    _info["rendered_status"] = f"[{_info['color']}]{_info['description']}[/{_info['color']}]"
+del _info
+
+# Per-field tuples indexed by tier - 1, for the per-wallet assessment path
+_TIER_ORDER = tuple(sorted(TIER_DEFINITIONS))
+_TIER_LABELS = tuple(TIER_DEFINITIONS[t]["label"] for t in _TIER_ORDER)
+_TIER_COLORS = tuple(TIER_DEFINITIONS[t]["color"] for t in _TIER_ORDER)
+_TIER_ICONS = tuple(TIER_DEFINITIONS[t]["icon"] for t in _TIER_ORDER)
+_TIER_ACTIONS = tuple(TIER_DEFINITIONS[t]["action"] for t in _TIER_ORDER)
+_TIER_DESCRIPTIONS = tuple(TIER_DEFINITIONS[t]["description"] for t in _TIER_ORDER)
+
+# Fixed entries for well-known addresses; never sent to the API or cached.
+# They have no FairScore, so the displays show _KNOWN_PROGRAM instead.
+_KNOWN_PROGRAM = "known program"
+_STATIC_ENTRIES = {
+    address: {
+        "tier": tier,
+        "fairscore": None,
+        "api_tier": TIER_DEFINITIONS[tier]["api_tier"],
+        "badges": [],
+        "timestamp": 0.0,
+        "raw": None,
+    }
+    for address, tier in FAIRSCORE_STATIC_TIERS.items()
+}
+
+@dataclass(frozen=True, slots=True)
+class RiskAssessment:
+    """Reputation verdict for one wallet, as returned by get_risk_assessment."""
+    tier: Optional[int]
+    fairscore: Optional[float]
+    label: str
+    color: str
+    icon: str
+    action: str
+    description: str
+    badges: Sequence[Dict[str, Any]]
+    available: bool
+    api_tier: str = ""
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+_UNKNOWN_ASSESSMENT = RiskAssessment(
+    tier=None,
+    fairscore=None,
+    label="UNKNOWN",
+    color="dim",
+    icon="(?)",
+    action="WARN",
+    description="Reputation check unavailable - proceed with caution",
+    badges=(),
+    available=False,
+)
+
+_UNKNOWN_BADGE = "[dim](?) UNKNOWN[/dim]"
+_UNKNOWN_STATUS = "[dim]Reputation check unavailable - proceed with caution[/dim]"
+
+
+class _TTLCache:
+    """Minimal stand-in for cachetools.TTLCache (oldest entry evicted first)."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __setitem__(self, key, value):
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __getitem__(self, key):
+        expires, value = self._data[key]
+        if expires <= time.monotonic():
+            del self._data[key]
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def clear(self):
+        self._data.clear()
+
+
+class _LockedCache:
+    """Serializes access to a cache shared with prefetch and batch worker threads."""
+
+    def __init__(self, cache):
+        self._cache = cache
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+
+    def __getitem__(self, key):
+        with self._lock:
+            return self._cache[key]
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._cache
+
+    def __len__(self):
+        with self._lock:
+            return len(self._cache)
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._cache.get(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+def _make_cache(ttl: float, maxsize: int = CACHE_MAXSIZE) -> _LockedCache:
+    """Size-bounded, thread-safe TTL cache for score entries."""
+    if TTLCache is not None:
+        return _LockedCache(TTLCache(maxsize=maxsize, ttl=ttl))
+    return _LockedCache(_TTLCache(maxsize, ttl))
+
+
+def _trace_request(request: httpx.Request, is_async: bool = False) -> None:
+    """Attach an httpcore trace that notes whether a new TCP connection was opened."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    connects: List[str] = []
+
+    def trace(event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            connects.append(event_name)
+
+    async def trace_async(event_name: str, info: Dict[str, Any]) -> None:
+        trace(event_name, info)
+
+    request.extensions["trace"] = trace_async if is_async else trace
+    request.extensions["coldstar_connects"] = connects
+
+
+def _log_connection(response: httpx.Response) -> None:
+    """Debug-log connection reuse and protocol, to catch pooling regressions."""
+    connects = response.request.extensions.get("coldstar_connects")
+    if connects is not None:
+        logger.debug(
+            "FairScore %s %s reused=%s http_version=%s",
+            response.request.method, response.url.path,
+            not connects, response.http_version,
+        )
+
+
+async def _trace_request_async(request: httpx.Request) -> None:
+    _trace_request(request, is_async=True)
+
+
+async def _log_connection_async(response: httpx.Response) -> None:
+    _log_connection(response)
 
-    def __init__(self, api_key: Optional[str] = None):
+
+def _client_options(api_key: str, is_async: bool = False) -> Dict[str, Any]:
+    """httpx settings shared by the sync and async clients."""
+    if is_async:
+        hooks = {"request": [_trace_request_async], "response": [_log_connection_async]}
+    else:
+        hooks = {"request": [_trace_request], "response": [_log_connection]}
+    return {
+        "timeout": httpx.Timeout(15.0, connect=5.0),
+        # Keep TLS sessions alive between lookups instead of re-handshaking
+        "limits": httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=60.0,
+        ),
+        "http2": HAS_HTTP2,
+        "headers": {"fairkey": api_key} if api_key else None,
+        "event_hooks": hooks,
+    }
+
+
+def _cache_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a cache entry from a /score response."""
+    api_tier_str = data.get("tier", "")
+    fairscore = data.get("fairscore", 0)
+    # Map string tier to numeric (the API sends lowercase, so .lower() is
+    # only paid on a miss), fall back to score-based
+    tier = (
+        TIER_MAP.get(api_tier_str)
+        or (api_tier_str and TIER_MAP.get(api_tier_str.lower()))
+        or score_to_tier(fairscore)
+    )
+    return {
+        "tier": tier,
+        "fairscore": fairscore,
+        "api_tier": api_tier_str,
+        "badges": data.get("badges", []),
+        "timestamp": time.time(),
+        "raw": data,
+    }
+
+
+def _open_score_db(path: str) -> Optional[sqlite3.Connection]:
+    """Open (creating if needed) the persistent score cache. None if unavailable."""
+    if not path:
+        return None
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        # WAL so concurrent CLI invocations don't block each other
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS scores("
+            "wallet TEXT PRIMARY KEY, tier INT, fairscore REAL, api_tier TEXT, "
+            "expires_at REAL, raw TEXT)"
+        )
+        return db
+    except (sqlite3.Error, OSError):
+        return None
+
+
+class _ScoreCache:
+    """API key plus score, unscored-wallet and failure caches shared by both clients."""
+
+    def __init__(self, api_key: Optional[str] = None, db_path: str = FAIRSCORE_CACHE_DB):
         self.api_key = api_key or FAIRSCORE_API_KEY
-        self.client = httpx.Client(timeout=15.0)
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.cache_ttl = 300  # 5 minutes - reputation changes slowly
+        self.cache_ttl = CACHE_TTL
+        # Expired entries are dropped by the caches themselves; "timestamp" is informational
+        self.cache = _make_cache(self.cache_ttl)
+        self.unscored_cache = _make_cache(UNSCORED_CACHE_TTL)
+        self.fail_cache = _make_cache(FAIL_CACHE_TTL, FAIL_CACHE_MAXSIZE)
+        # Persistent layer behind the in-memory caches (batch lookups write from worker threads)
+        self.db = _open_score_db(db_path)
+        self._db_lock = threading.Lock()
+        self._last_warn = 0.0
+
+    def _cached_entry(self, wallet_address: str) -> Optional[Dict[str, Any]]:
+        entry = self.cache.get(wallet_address)
+        if entry is None and self.db is not None:
+            entry = self._load_persisted(wallet_address)
+        return entry
+
+    def _load_persisted(self, wallet_address: str) -> Optional[Dict[str, Any]]:
+        try:
+            with self._db_lock:
+                row = self.db.execute(
+                    "SELECT tier, fairscore, api_tier, raw FROM scores "
+                    "WHERE wallet=? AND expires_at>?",
+                    (wallet_address, time.time()),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        tier, fairscore, api_tier, raw = row
+        data = json_loads(raw) if raw else None
+        wallet_address = sys.intern(wallet_address)
+        entry = {
+            "tier": tier,
+            "fairscore": fairscore,
+            "api_tier": api_tier,
+            "badges": data.get("badges", []) if data else [],
+            "timestamp": time.time(),
+            "raw": data,
+        }
+        self.cache[wallet_address] = entry
+        return entry
+
+    def _persist(self, entries: List[Tuple[str, Dict[str, Any]]], ttl: float) -> None:
+        if self.db is None:
+            return
+        expires_at = time.time() + ttl
+        rows = [
+            (wallet_address, entry["tier"], entry["fairscore"], entry["api_tier"], expires_at,
+             json.dumps(entry["raw"]) if entry["raw"] is not None else None)
+            for wallet_address, entry in entries
+        ]
+        try:
+            with self._db_lock:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+        except sqlite3.Error:
+            pass  # the in-memory cache still holds the entries
+
+    def purge_cache(self) -> None:
+        """Forget every cached score and lookup failure, in memory and on disk."""
+        self.cache.clear()
+        self.unscored_cache.clear()
+        self.fail_cache.clear()
+        if self.db is not None:
+            try:
+                with self._db_lock:
+                    self.db.execute("DELETE FROM scores")
+                    self.db.execute("VACUUM")
+            except sqlite3.Error:
+                pass
+
+    def _close_db(self) -> None:
+        if self.db is not None:
+            try:
+                self.db.close()
+            except sqlite3.Error:
+                pass
+            self.db = None
+
+    def _split_cached(self, wallets: List[str], use_cache: bool) -> Tuple[Dict[str, Optional[int]], List[str]]:
+        """Resolve cache hits; returns ({wallet: tier or None}, wallets still to query)."""
+        tiers: Dict[str, Optional[int]] = {}
+        misses = []
+        for wallet in dict.fromkeys(wallets):
+            cached = _STATIC_ENTRIES.get(wallet)
+            if cached is None and use_cache:
+                cached = self._cached_entry(wallet)
+            if cached is not None:
+                tiers[wallet] = cached["tier"]
+            else:
+                tiers[wallet] = None
+                if not self._recently_failed(wallet):
+                    misses.append(wallet)
+        return tiers, misses
+
+    def _warn(self, message: str, error: Exception) -> None:
+        """Log a lookup failure; echo it to the console at most every WARN_INTERVAL."""
+        logger.warning("%s: %s", message, error)
+        now = time.monotonic()
+        if now - self._last_warn > WARN_INTERVAL:
+            self._last_warn = now
+            print_warning(f"{message}: {error}")
+
+    def _remember(self, wallet_address: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a /score response in memory only."""
+        entry = _cache_entry(data)
+        # Long-lived cache keys: intern so repeat lookups share one string
+        wallet_address = sys.intern(wallet_address)
+        self.cache[wallet_address] = entry
+        return entry
+
+    def _store(self, wallet_address: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        entry = self._remember(wallet_address, data)
+        self._persist([(wallet_address, entry)], self.cache_ttl)
+        return entry
+
+    def _recently_failed(self, wallet_address: str) -> bool:
+        return wallet_address in self.fail_cache or wallet_address in self.unscored_cache
+
+    def _store_error(self, wallet_address: str, error: Exception) -> None:
+        """Record a failed lookup so it isn't retried until its cache entry expires."""
+        wallet_address = sys.intern(wallet_address)
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 404:
+            self.unscored_cache[wallet_address] = True
+            self._warn("FairScore has no score for this wallet", error)
+        elif isinstance(error, httpx.HTTPError):
+            self.fail_cache[wallet_address] = True
+            self._warn("FairScore API unavailable", error)
+        else:
+            self._warn("FairScore check failed", error)
+
+
+class FairScoreClient(_ScoreCache):
+    """Client for FairScale reputation scoring API"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        db_path: str = FAIRSCORE_CACHE_DB,
+        prefetch_from: Optional[Iterable[str]] = None,
+    ):
+        super().__init__(api_key, db_path)
+        self.client = httpx.Client(**_client_options(self.api_key))
+        self._batch_supported = True  # cleared once /score/batch returns 404/405
+
+        # Warm the cache for known addresses (address book, recent
+        # recipients) while the UI starts up
+        self._prefetch_thread: Optional[threading.Thread] = None
+        if prefetch_from:
+            self._prefetch_thread = threading.Thread(
+                target=self.prefetch,
+                args=(list(prefetch_from),),
+                name="fairscore-prefetch",
+                daemon=True,
+            )
+            self._prefetch_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
 
     def _query_api(self, wallet_address: str) -> Optional[Dict[str, Any]]:
         """Raw API call to FairScale /score endpoint."""
-        headers = {}
-        if self.api_key:
-            headers["fairkey"] = self.api_key
-
         response = self.client.get(
             f"{FAIRSCORE_API_BASE}/score",
             params={"wallet": wallet_address},
-            headers=headers,
         )
         response.raise_for_status()
-        return response.json()
+        return json_loads(response.content)
 
     def get_tier(self, wallet_address: str, use_cache: bool = True) -> Optional[int]:
         """
@@ -131,93 +581,141 @@ class FairScoreClient:
         Returns:
             Tier (1-5) or None on error
         """
+        entry = self._get_entry(wallet_address, use_cache)
+        return entry["tier"] if entry else None
+
+    def _get_entry(self, wallet_address: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """Full cache row (tier, fairscore, api_tier, badges, ...) for a wallet, or None on error."""
+        if (static := _STATIC_ENTRIES.get(wallet_address)) is not None:
+            return static
+        if use_cache and (cached := self._cached_entry(wallet_address)) is not None:
+            return cached
+        return self._fetch_entry(wallet_address)
+
+    def _fetch_entry(self, wallet_address: str) -> Optional[Dict[str, Any]]:
+        """Query the API for one wallet and cache the outcome."""
+        if self._recently_failed(wallet_address):
+            return None
         try:
-            # Check cache
-            if use_cache and wallet_address in self.cache:
-                cached = self.cache[wallet_address]
-                if time.time() - cached["timestamp"] < self.cache_ttl:
-                    return cached["tier"]
-
             data = self._query_api(wallet_address)
             if data is None:
                 return None
+            return self._store(wallet_address, data)
+        except Exception as e:
+            self._store_error(wallet_address, e)
+            return None
 
-            # Extract tier from API response
-            api_tier_str = data.get("tier", "")
-            fairscore = data.get("fairscore", 0)
+    def _query_batch(self, wallets: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """POST to /score/batch. Returns None if the endpoint isn't available."""
+        if not self._batch_supported:
+            return None
+        response = self.client.post(
+            f"{FAIRSCORE_API_BASE}/score/batch",
+            json={"wallets": wallets},
+        )
+        if response.status_code in (404, 405):
+            self._batch_supported = False
+            return None
+        response.raise_for_status()
+        data = json_loads(response.content)
+        return data.get("results", []) if isinstance(data, dict) else data
 
-            # Map string tier to numeric, fall back to score-based
-            tier = TIER_MAP.get(api_tier_str.lower(), score_to_tier(fairscore))
+    def get_tiers_batch(self, wallets: List[str], use_cache: bool = True) -> Dict[str, Optional[int]]:
+        """
+        Get FairScore tiers for several wallets with as few round trips as possible.
 
-            self.cache[wallet_address] = {
-                "tier": tier,
-                "fairscore": fairscore,
-                "api_tier": api_tier_str,
-                "badges": data.get("badges", []),
-                "timestamp": time.time(),
-                "raw": data,
-            }
-            return tier
+        Uses the /score/batch endpoint when available, otherwise queries
+        cache misses concurrently (BATCH_FALLBACK_WORKERS at a time).
 
-        except httpx.HTTPError as e:
-            print_warning(f"FairScore API unavailable: {e}")
-            return None
-        except Exception as e:
-            print_warning(f"FairScore check failed: {e}")
-            return None
+        Returns:
+            {address: tier (1-5) or None on error}
+        """
+        tiers, misses = self._split_cached(wallets, use_cache)
+        if not misses:
+            return tiers
 
-    def get_risk_assessment(self, wallet_address: str) -> Dict[str, Any]:
+        try:
+            rows = self._query_batch(misses)
+        except httpx.HTTPError as e:
+            self._warn("FairScore batch API unavailable", e)
+            rows = None
+
+        if rows is None:
+            with ThreadPoolExecutor(max_workers=BATCH_FALLBACK_WORKERS) as pool:
+                for wallet, entry in zip(misses, pool.map(self._fetch_entry, misses)):
+                    tiers[wallet] = entry["tier"] if entry else None
+            return tiers
+
+        for row in rows:
+            wallet = row.get("wallet")
+            if wallet in tiers:
+                tiers[wallet] = self._store(wallet, row)["tier"]
+        return tiers
+
+    def prefetch(self, wallets: Iterable[str]) -> None:
+        """Populate the cache for wallets likely to be looked up soon."""
+        pending = [
+            w for w in dict.fromkeys(wallets)
+            if w not in _STATIC_ENTRIES and self._cached_entry(w) is None
+        ]
+        for i in range(0, len(pending), PREFETCH_CHUNK):
+            self.get_tiers_batch(pending[i:i + PREFETCH_CHUNK])
+
+    def get_risk_assessment(self, wallet_address: str) -> RiskAssessment:
         """
         Get full risk assessment for a wallet.
 
         Returns:
-            Dict with tier, label, color, icon, action, description, fairscore, badges, available
+            RiskAssessment with tier, label, color, icon, action, description,
+            fairscore, badges, available, api_tier (use .as_dict() for JSON)
         """
-        tier = self.get_tier(wallet_address)
-
-        if tier is None:
-            return {
-                "tier": None,
-                "fairscore": None,
-                "label": "UNKNOWN",
-                "color": "dim",
-                "icon": "(?)",
-                "action": "WARN",
-                "description": "Reputation check unavailable - proceed with caution",
-                "badges": [],
-                "available": False,
-            }
-
-        cached = self.cache.get(wallet_address, {})
-        info = TIER_DEFINITIONS.get(tier, TIER_DEFINITIONS[2])
-        return {
-            "tier": tier,
-            "fairscore": cached.get("fairscore", 0),
-            "api_tier": cached.get("api_tier", ""),
-            "label": info["label"],
-            "color": info["color"],
-            "icon": info["icon"],
-            "action": info["action"],
-            "description": info["description"],
-            "badges": cached.get("badges", []),
-            "available": True,
-        }
+        entry = self._get_entry(wallet_address)
+
+        if entry is None:
+            return _UNKNOWN_ASSESSMENT
+
+        tier = entry["tier"]
+        i = tier - 1 if tier in TIER_DEFINITIONS else 1  # unknown tiers display as tier 2
+        return RiskAssessment(
+            tier=tier,
+            fairscore=entry["fairscore"],
+            label=_TIER_LABELS[i],
+            color=_TIER_COLORS[i],
+            icon=_TIER_ICONS[i],
+            action=_TIER_ACTIONS[i],
+            description=_TIER_DESCRIPTIONS[i],
+            badges=entry["badges"],
+            available=True,
+            api_tier=entry["api_tier"],
+        )
 
-    def should_block_transaction(self, wallet_address: str) -> Tuple[bool, str]:
+    def should_block_transaction(self, wallet_address: Union[str, List[str]]) -> Tuple[bool, str]:
         """
-        Check if a transaction to this wallet should be blocked.
+        Check if a transaction to this wallet (or any of several recipients)
+        should be blocked.
 
         Returns:
             (should_block, reason)
         """
+        if not isinstance(wallet_address, str):
+            # Warm the cache with one batch call, then check each recipient
+            self.get_tiers_batch(wallet_address)
+            for wallet in wallet_address:
+                result = self.should_block_transaction(wallet)
+                if result[0]:
+                    return result
+            return (False, "")
+
         assessment = self.get_risk_assessment(wallet_address)
 
-        if assessment["action"] == "BLOCK":
+        if assessment.action == "BLOCK":
+            if assessment.fairscore is None:
+                score = f"{_KNOWN_PROGRAM} address"
+            else:
+                score = f"FairScore: {assessment.fairscore:.1f}, Tier: {assessment.api_tier or 'bronze'}"
             return (
                 True,
-                f"Recipient has {assessment['label']} reputation "
-                f"(FairScore: {assessment['fairscore']:.1f}, Tier: {assessment.get('api_tier', 'bronze')}) "
-                f"- transaction blocked",
+                f"Recipient has {assessment.label} reputation ({score}) - transaction blocked",
             )
 
         return (False, "")
@@ -237,11 +735,17 @@ class FairScoreClient:
     def display_reputation_badge(self, wallet_address: str, verbose: bool = False):
         """Display reputation badge for a wallet using Rich."""
         assessment = self.get_risk_assessment(wallet_address)
-        color = assessment["color"]
-        icon = assessment["icon"]
-        label = assessment["label"]
+        color = assessment.color
+        icon = assessment.icon
+        label = assessment.label
 
         if verbose:
+            if assessment.tier is None:
+                badge, status = _UNKNOWN_BADGE, _UNKNOWN_STATUS
+            else:
+                info = TIER_DEFINITIONS.get(assessment.tier, TIER_DEFINITIONS[2])
+                badge, status = info["rendered_badge"], info["rendered_status"]
+
             table = Table.grid(padding=(0, 1))
             table.add_column(style="dim", width=14)
             table.add_column(style="white")
@@ -250,12 +754,15 @@ class FairScoreClient:
                 "Address:",
                 f"[cyan]{wallet_address[:12]}...{wallet_address[-8:]}[/cyan]",
             )
-            table.add_row("Reputation:", f"[{color}]{icon} {label}[/{color}]")
+            table.add_row("Reputation:", badge)
 
-            if assessment["tier"] is not None:
-                table.add_row("Tier:", f"[white]{assessment.get('api_tier', '').title()} ({assessment['tier']}/5)[/white]")
-                table.add_row("FairScore:", f"[white]{assessment.get('fairscore', 0):.1f}/100[/white]")
-                limit = TIER_LIMITS.get(assessment["tier"], 0)
+            if assessment.tier is not None:
+                table.add_row("Tier:", f"[white]{assessment.api_tier.title()} ({assessment.tier}/5)[/white]")
+                if assessment.fairscore is None:
+                    table.add_row("FairScore:", f"[dim]n/a ({_KNOWN_PROGRAM})[/dim]")
+                else:
+                    table.add_row("FairScore:", f"[white]{assessment.fairscore:.1f}/100[/white]")
+                limit = TIER_LIMITS.get(assessment.tier, 0)
                 if limit == float("inf"):
                     table.add_row("TX Limit:", "[green]Unlimited[/green]")
                 elif limit == 0:
@@ -264,15 +771,12 @@ class FairScoreClient:
                     table.add_row("TX Limit:", f"[yellow]{limit} SOL max[/yellow]")
 
             # Show badges if present
-            badges = assessment.get("badges", [])
+            badges = assessment.badges
             if badges:
                 badge_str = " ".join(f"[cyan]{b['label']}[/cyan]" for b in badges[:3])
                 table.add_row("Badges:", badge_str)
 
-            table.add_row(
-                "Status:",
-                f"[{color}]{assessment['description']}[/{color}]",
-            )
+            table.add_row("Status:", status)
 
             panel = Panel(
                 table,
@@ -283,10 +787,46 @@ class FairScoreClient:
             console.print(panel)
         else:
             score_str = ""
-            if assessment.get("fairscore") is not None:
-                score_str = f" ({assessment['fairscore']:.0f}/100)"
+            if assessment.fairscore is not None:
+                score_str = f" ({assessment.fairscore:.0f}/100)"
+            elif assessment.tier is not None:
+                score_str = f" ({_KNOWN_PROGRAM})"
             console.print(f"  Reputation: [{color}]{icon} {label}{score_str}[/{color}]")
 
+    def display_reputation_badges(self, wallets: List[str]):
+        """Display reputation for several wallets as one Rich table."""
+        # One batch round trip, then every assessment below is a cache hit
+        self.get_tiers_batch(wallets)
+
+        table = Table(
+            title="FairScore Reputation",
+            show_header=True,
+            header_style="bold cyan",
+        )
+        table.add_column("Address", style="cyan", no_wrap=True)
+        table.add_column("Tier", width=16)
+        table.add_column("Score", width=8)
+        table.add_column("Action", width=8)
+        table.add_column("Status", style="dim")
+
+        for wallet in wallets:
+            assessment = self.get_risk_assessment(wallet)
+            color = assessment.color
+            score = assessment.fairscore
+            if score is not None:
+                score_text = f"{score:.1f}"
+            else:
+                score_text = "program" if assessment.tier is not None else "-"
+            table.add_row(
+                f"{wallet[:12]}...{wallet[-8:]}",
+                f"[{color}]{assessment.icon} {assessment.label}[/{color}]",
+                score_text,
+                f"[{color}]{assessment.action}[/{color}]",
+                assessment.description,
+            )
+
+        console.print(table)
+
     def display_tier_legend(self):
         """Display legend explaining all FairScore tiers."""
         table = Table(
@@ -302,22 +842,8 @@ class FairScoreClient:
         table.add_column("TX Limit", width=12)
         table.add_column("Description", style="dim")
 
-        score_ranges = {1: "0-19", 2: "20-39", 3: "40-59", 4: "60-79", 5: "80-100"}
-
-        for tier in sorted(TIER_DEFINITIONS.keys()):
-            info = TIER_DEFINITIONS[tier]
-            limit = TIER_LIMITS.get(tier, 0)
-            limit_str = "Unlimited" if limit == float("inf") else f"{limit} SOL" if limit > 0 else "BLOCKED"
-
-            table.add_row(
-                str(tier),
-                f"[{info['color']}]{info['api_tier']}[/{info['color']}]",
-                f"[{info['color']}]{info['label']}[/{info['color']}]",
-                score_ranges[tier],
-                f"[{info['color']}]{info['action']}[/{info['color']}]",
-                limit_str,
-                info["description"],
-            )
+        for row in _LEGEND_ROWS:
+            table.add_row(*row)
 
         console.print()
         console.print(table)
@@ -325,16 +851,136 @@ class FairScoreClient:
 
     def close(self):
         """Cleanup HTTP client."""
+        global _DEFAULT_CLIENT
+        with _DEFAULT_CLIENT_LOCK:
+            if self is _DEFAULT_CLIENT:
+                _DEFAULT_CLIENT = None  # next get_default_client() starts fresh
+        self._close_db()
         try:
             self.client.close()
         except Exception:
             pass
 
 
+# Process-wide client so callers share one connection pool and cache
+_DEFAULT_CLIENT: Optional[FairScoreClient] = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def get_default_client() -> FairScoreClient:
+    """Return the shared FairScoreClient, creating it on first use."""
+    global _DEFAULT_CLIENT
+    client = _DEFAULT_CLIENT
+    if client is None:
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_CLIENT is None:
+                _DEFAULT_CLIENT = FairScoreClient()
+            client = _DEFAULT_CLIENT
+    return client
+
+
+def purge_score_cache(path: Optional[str] = None) -> bool:
+    """Delete an on-disk score cache and its WAL files. True if anything was removed.
+
+    Defaults to FAIRSCORE_CACHE_DB, or ~/.coldstar/fairscore.db when unset
+    (where earlier releases kept it by default).
+    """
+    if _DEFAULT_CLIENT is not None:
+        _DEFAULT_CLIENT.purge_cache()
+    path = path or FAIRSCORE_CACHE_DB or DEFAULT_CACHE_DB
+    removed = False
+    for name in (path, path + "-wal", path + "-shm"):
+        try:
+            os.remove(name)
+            removed = True
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+@atexit.register
+def _close_default_client():
+    if _DEFAULT_CLIENT is not None:
+        _DEFAULT_CLIENT.close()
+
+
+class AsyncFairScoreClient(_ScoreCache):
+    """Async FairScale client for scoring many wallets concurrently"""
+
+    def __init__(self, api_key: Optional[str] = None, db_path: str = FAIRSCORE_CACHE_DB):
+        super().__init__(api_key, db_path)
+        self.client = httpx.AsyncClient(**_client_options(self.api_key, is_async=True))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        return False
+
+    async def _query_api(self, wallet_address: str) -> Optional[Dict[str, Any]]:
+        """Raw API call to FairScale /score endpoint."""
+        response = await self.client.get(
+            f"{FAIRSCORE_API_BASE}/score",
+            params={"wallet": wallet_address},
+        )
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    async def get_tier(self, wallet_address: str, use_cache: bool = True) -> Optional[int]:
+        """Get FairScore tier (1-5) for a wallet address, or None on error."""
+        tiers = await self.get_tiers([wallet_address], use_cache=use_cache)
+        return tiers[wallet_address]
+
+    async def get_tiers(self, wallets: List[str], use_cache: bool = True) -> Dict[str, Optional[int]]:
+        """
+        Get FairScore tiers for several wallets, querying cache misses concurrently.
+
+        Returns:
+            {address: tier (1-5) or None on error}
+        """
+        # SQLite calls block, so with an on-disk cache they run in a worker
+        # thread instead of stalling the event loop
+        if self.db is None:
+            tiers, misses = self._split_cached(wallets, use_cache)
+        else:
+            tiers, misses = await asyncio.to_thread(self._split_cached, wallets, use_cache)
+
+        results = await asyncio.gather(
+            *(self._query_api(w) for w in misses), return_exceptions=True
+        )
+        fetched = []
+        for wallet, data in zip(misses, results):
+            if isinstance(data, Exception):
+                self._store_error(wallet, data)
+            elif data is not None:
+                entry = self._remember(wallet, data)
+                tiers[wallet] = entry["tier"]
+                fetched.append((wallet, entry))
+        if fetched and self.db is not None:
+            await asyncio.to_thread(self._persist, fetched, self.cache_ttl)
+        return tiers
+
+    async def aclose(self):
+        """Cleanup HTTP client."""
+        if self.db is not None:
+            await asyncio.to_thread(self._close_db)
+        try:
+            await self.client.aclose()
+        except Exception:
+            pass
+
+
 def format_reputation_badge(tier: Optional[int]) -> str:
     """Format a compact reputation badge for inline display."""
     if tier is None:
-        return "[dim](?) UNKNOWN[/dim]"
+        return _UNKNOWN_BADGE
+    return TIER_DEFINITIONS.get(tier, TIER_DEFINITIONS[2])["rendered_badge"]
 
-    info = TIER_DEFINITIONS.get(tier, TIER_DEFINITIONS[2])
-    return f"[{info['color']}]{info['icon']} {info['label']}[/{info['color']}]"
+
+if __name__ == "__main__":
+    if "--purge-cache" in sys.argv[1:]:
+        if purge_score_cache():
+            print_success("FairScore cache deleted")
+        else:
+            print_info("No FairScore cache on disk")
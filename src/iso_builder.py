@@ -10,9 +10,16 @@ import os
 import shutil
 import tempfile
 import json
+import hashlib
+import mmap
 import platform
+import tarfile
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from src.ui import (
     print_success, print_error, print_info, print_warning,
@@ -21,221 +28,557 @@ from src.ui import (
 )
 from config import ALPINE_MINIROOTFS_URL, NETWORK_BLACKLIST_MODULES
 
+# Read/copy buffer for rootfs downloads and hashing
+_TAR_BUFSIZE = 2 * 1024 * 1024
 
-class ISOBuilder:
-    def __init__(self):
-        self.work_dir: Optional[Path] = None
-        self.rootfs_dir: Optional[Path] = None
-        self.iso_path: Optional[Path] = None
-        self.generated_pubkey: Optional[str] = None
-        self.is_windows = platform.system() == 'Windows'
+# COLDSTAR_SQUASHFS=1 makes the fallback image (no loop devices) a zstd
+# SquashFS instead of a tar.gz; flashing it needs unsquashfs on the host
+_USE_SQUASHFS = os.environ.get("COLDSTAR_SQUASHFS") == "1"
+
+# Downloaded minirootfs tarballs, keyed by SHA-256 of the URL. Release
+# URLs are versioned, so a given URL always serves the same tarball. The
+# digest each one was verified against is kept beside it (.sha256) so an
+# offline rebuild can still check the cache.
+ROOTFS_CACHE_DIR = Path(os.path.expanduser("~/.cache/coldstar/alpine"))
+
+
+def _rootfs_cache_path() -> Path:
+    key = hashlib.sha256(ALPINE_MINIROOTFS_URL.encode()).hexdigest()
+    return ROOTFS_CACHE_DIR / f"{key}.tar.gz"
+
+
+def _recorded_sha256() -> Optional[str]:
+    """Digest the cached tarball was verified against when it was downloaded."""
+    try:
+        return _rootfs_cache_path().with_suffix('.sha256').read_text().strip() or None
+    except OSError:
+        return None
+
+
+def _cached_rootfs(expected_sha256: str) -> Optional[Path]:
+    """Return the cached minirootfs if it still hashes to the expected checksum.
     
-    def build_complete_iso(self, output_dir: str = "./output") -> Optional[Path]:
-        """Build complete bootable ISO with transaction signing and keygen"""
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        with tempfile.TemporaryDirectory() as work_dir:
-            self.work_dir = Path(work_dir)
-            
-            tarball = self.download_alpine_rootfs(work_dir)
-            if not tarball:
-                return None
-            
-            if not self.extract_rootfs(tarball):
-                return None
-            
-            if not self.configure_offline_os():
-                return None
-            
-            if not self._install_python_deps():
-                return None
-            
-            iso_path = self._create_bootable_image(output_path)
-            if iso_path:
-                print_success(f"ISO created successfully: {iso_path}")
-                return iso_path
-            
+    Re-hashed on every use: the cache lives in the user's home directory
+    and feeds straight into the signing OS image.
+    """
+    cached = _rootfs_cache_path()
+    if not cached.is_file():
+        return None
+    if _file_sha256(cached) != expected_sha256:
+        # Truncated, corrupted or tampered with: fetch a fresh copy
+        cached.unlink()
+        return None
+    return cached
+
+
+# Parallel ranged download: below _MIN_RANGED_SIZE a single connection wins
+_DOWNLOAD_CONNECTIONS = 6
+_MIN_RANGED_SIZE = 1024 * 1024
+
+
+def _probe_ranged_size() -> Optional[int]:
+    """Content-Length of the minirootfs if the mirror serves byte ranges."""
+    request = urllib.request.Request(ALPINE_MINIROOTFS_URL, method="HEAD")
+    with urllib.request.urlopen(request, timeout=10) as response:
+        length = response.headers.get("Content-Length")
+        if response.headers.get("Accept-Ranges", "").lower() != "bytes" or not length:
             return None
+        return int(length)
+
+
+def _fetch_range(fd: int, start: int, end: int, advance) -> None:
+    """GET bytes start..end (inclusive) and pwrite them at their own offset."""
+    request = urllib.request.Request(
+        ALPINE_MINIROOTFS_URL, headers={"Range": f"bytes={start}-{end}"}
+    )
+    offset = start
+    with urllib.request.urlopen(request, timeout=60) as response:
+        if response.status != 206:
+            raise ValueError(f"range request answered with HTTP {response.status}")
+        while offset <= end:
+            chunk = response.read(min(_TAR_BUFSIZE, end + 1 - offset))
+            if not chunk:
+                break
+            view = memoryview(chunk)
+            while view:
+                written = os.pwrite(fd, view, offset)
+                view = view[written:]
+                offset += written
+            advance(len(chunk))
+    if offset != end + 1:
+        raise ValueError(f"range {start}-{end} ended early at {offset}")
+
+
+def _published_sha256() -> Optional[str]:
+    """Alpine publishes <tarball>.sha256 next to each release tarball."""
+    try:
+        with urllib.request.urlopen(ALPINE_MINIROOTFS_URL + ".sha256", timeout=10) as response:
+            return response.read().split()[0].decode().lower()
+    except (urllib.error.URLError, OSError, IndexError, UnicodeDecodeError):
+        return None
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_TAR_BUFSIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _check_rootfs_members(archive: Path, dest: Path) -> None:
+    """List the archive and raise TarError on any member that could write outside `dest`.
     
-    def download_alpine_rootfs(self, work_dir: str) -> Optional[Path]:
-        self.work_dir = Path(work_dir)
-        self.work_dir.mkdir(parents=True, exist_ok=True)
-        
-        # On Windows, skip the Alpine download and use simplified approach
-        if self.is_windows:
-            print_step(1, 7, "Preparing wallet structure for Windows...")
-            print_info("Using simplified wallet structure for Windows")
-            # Create a dummy tarball path to satisfy the workflow
-            tarball_path = self.work_dir / "wallet_structure.marker"
-            tarball_path.touch()
-            return tarball_path
-        
-        tarball_path = self.work_dir / "alpine-minirootfs.tar.gz"
-        
-        print_step(1, 7, "Downloading Alpine Linux minirootfs...")
-        
+    Absolute names, '..' components, hardlinks pointing out of the tree and
+    device nodes are rejected; absolute symlinks are kept since Alpine's
+    rootfs is full of them. A name below a symlink from earlier in the
+    archive, or whose parent already resolves outside `dest`, is rejected
+    too. Headers only: tar does the extraction afterwards.
+    """
+    root = os.path.realpath(dest)
+    symlinks = set()
+    with tarfile.open(archive, mode="r|gz", bufsize=_TAR_BUFSIZE) as tar:
+        for member in tar:
+            name = member.name.rstrip("/")
+            parts = name.split("/")
+            if os.path.isabs(name) or ".." in parts:
+                raise tarfile.TarError(f"unsafe path in rootfs archive: {name}")
+            if member.ischr() or member.isblk():
+                raise tarfile.TarError(f"device node in rootfs archive: {name}")
+            if member.islnk() and (
+                os.path.isabs(member.linkname) or ".." in member.linkname.split("/")
+            ):
+                raise tarfile.TarError(f"unsafe hardlink in rootfs archive: {name}")
+            if any("/".join(parts[:i]) in symlinks for i in range(1, len(parts))):
+                raise tarfile.TarError(f"path through symlink in rootfs archive: {name}")
+            parent = os.path.realpath(os.path.join(root, os.path.dirname(name)))
+            if os.path.commonpath([root, parent]) != root:
+                raise tarfile.TarError(f"path escapes rootfs: {name}")
+            if member.issym():
+                symlinks.add(name)
+
+
+# (path relative to rootfs, chmod mode or None for default perms, contents)
+_FileEntry = Tuple[str, Optional[int], bytes]
+
+_O_BINARY = getattr(os, "O_BINARY", 0)  # keep LF line endings on Windows
+
+# Optional io_uring bindings (Linux 5.6+ for IORING_OP_OPENAT/CLOSE), via the
+# `uring` extra. liburing 2026.x replaced the io_uring()/io_uring_cqe() API
+# used here, so only the 2024 releases are picked up.
+try:
+    import liburing
+    HAS_IO_URING = sys.platform.startswith("linux") and hasattr(liburing, "io_uring_cqe")
+except ImportError:
+    HAS_IO_URING = False
+
+_URING_DEPTH = 64
+
+# Raw image flashing: FLASH_DEPTH chunks of FLASH_CHUNK bytes in flight,
+# written O_DIRECT so the page cache isn't filled with the whole image
+_O_DIRECT = getattr(os, "O_DIRECT", 0)
+_FLASH_CHUNK = 4 * 1024 * 1024
+_FLASH_DEPTH = 8
+_DIRECT_ALIGN = 4096
+
+
+def _uring_reap(ring, cqe, count: int) -> dict:
+    """Wait for `count` completions, returning {user_data: res}."""
+    results = {}
+    for _ in range(count):
+        liburing.io_uring_wait_cqe(ring, cqe)
+        results[cqe.user_data] = cqe.res
+        liburing.io_uring_cqe_seen(ring, cqe)
+    return results
+
+
+def _write_files_uring(ring, cqe, batch: List[_FileEntry]) -> None:
+    """Write one batch of files with two submissions: all openats, then write+close pairs."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    # The SQEs only point at these buffers, so keep them alive until submitted
+    paths = [path.encode() for path, _, _ in batch]
+    for i, path in enumerate(paths):
+        sqe = liburing.io_uring_get_sqe(ring)
+        liburing.io_uring_prep_openat(sqe, path, flags, 0o666)
+        liburing.io_uring_sqe_set_data64(sqe, i)
+    liburing.io_uring_submit_and_wait(ring, len(batch))
+    opened = _uring_reap(ring, cqe, len(batch))
+    
+    failed = [i for i, res in opened.items() if res < 0]
+    if failed:
+        for res in opened.values():
+            if res >= 0:
+                os.close(res)
+        err = -opened[failed[0]]
+        raise OSError(err, os.strerror(err), batch[failed[0]][0])
+    
+    for i, (_, mode, payload) in enumerate(batch):
+        fd = opened[i]
+        if mode is not None:
+            os.fchmod(fd, mode)
+        sqe = liburing.io_uring_get_sqe(ring)
+        liburing.io_uring_prep_write(sqe, fd, payload, len(payload), 0)
+        liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+        liburing.io_uring_sqe_set_data64(sqe, 2 * i)
+        sqe = liburing.io_uring_get_sqe(ring)
+        liburing.io_uring_prep_close(sqe, fd)
+        liburing.io_uring_sqe_set_data64(sqe, 2 * i + 1)
+    liburing.io_uring_submit_and_wait(ring, 2 * len(batch))
+    done = _uring_reap(ring, cqe, 2 * len(batch))
+    
+    for i, (path, _, payload) in enumerate(batch):
+        written = done[2 * i]
+        if written != len(payload):
+            # A short write cancels the linked close, so close it here
+            if done[2 * i + 1] < 0:
+                os.close(opened[i])
+            err = -written if written < 0 else 5  # EIO
+            raise OSError(err, os.strerror(err), path)
+
+
+def _write_manifest_uring(files: List[_FileEntry]) -> bool:
+    """Write absolute-path entries through io_uring; False if no ring is available."""
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    try:
+        liburing.io_uring_queue_init(_URING_DEPTH, ring, 0)
+    except OSError:
+        # ENOSYS/EPERM: kernel too old or io_uring disabled by sysctl/seccomp
+        return False
+    
+    try:
+        # Each file needs two SQEs in the write phase
+        step = _URING_DEPTH // 2
+        for start in range(0, len(files), step):
+            _write_files_uring(ring, cqe, files[start:start + step])
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return True
+
+
+def _alloc_io_buffer(size: int) -> mmap.mmap:
+    """Page-aligned anonymous buffer, backed by transparent huge pages where allowed."""
+    buf = mmap.mmap(-1, size)
+    if hasattr(mmap, "MADV_HUGEPAGE"):
         try:
-            result = subprocess.run(
-                ['wget', '-q', '--show-progress', '-O', str(tarball_path), ALPINE_MINIROOTFS_URL],
-                capture_output=False,
-                timeout=300
-            )
+            # 2 MiB pages: fewer TLB misses while the kernel copies through it
+            buf.madvise(mmap.MADV_HUGEPAGE)
+        except OSError:
+            pass  # THP disabled ("never") or unsupported
+    return buf
+
+
+def _aligned(length: int) -> int:
+    return -(-length // _DIRECT_ALIGN) * _DIRECT_ALIGN
+
+
+def _prep_image_write(ring, dst_fd: int, buf: memoryview, span: int, offset: int, slot: int) -> None:
+    sqe = liburing.io_uring_get_sqe(ring)
+    liburing.io_uring_prep_write(sqe, dst_fd, buf, span, offset)
+    liburing.io_uring_sqe_set_data64(sqe, 2 * slot + 1)
+
+
+def _copy_image_uring(src_fd: int, dst_fd: int, size: int, buffers: List[memoryview], advance) -> bool:
+    """Keep one linked read->write pair per buffer in flight; False if no ring is available.
+    
+    An unaligned tail is the exception: its padded read comes back short
+    at EOF, which would cancel a linked write, so that write is only
+    queued once the read has completed.
+    """
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    try:
+        liburing.io_uring_queue_init(2 * len(buffers), ring, 0)
+    except OSError:
+        return False
+    
+    try:
+        free = list(range(len(buffers)))
+        inflight = {}  # slot -> [offset, length, completions seen]
+        offset = 0
+        while offset < size or inflight:
+            while free and offset < size:
+                slot = free.pop()
+                length = min(_FLASH_CHUNK, size - offset)
+                span = _aligned(length)
+                buf = buffers[slot]
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_read(sqe, src_fd, buf, span, offset)
+                liburing.io_uring_sqe_set_data64(sqe, 2 * slot)
+                if span == length:
+                    liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+                    _prep_image_write(ring, dst_fd, buf, span, offset, slot)
+                inflight[slot] = [offset, length, 0]
+                offset += length
+            liburing.io_uring_submit(ring)
             
-            if result.returncode != 0:
-                result = subprocess.run(
-                    ['curl', '-L', '-o', str(tarball_path), ALPINE_MINIROOTFS_URL],
-                    capture_output=True,
-                    timeout=300
-                )
+            liburing.io_uring_wait_cqe(ring, cqe)
+            slot, is_write = divmod(cqe.user_data, 2)
+            res = cqe.res
+            liburing.io_uring_cqe_seen(ring, cqe)
             
-            if tarball_path.exists():
-                print_success("Alpine Linux rootfs downloaded")
-                return tarball_path
+            start, length, seen = inflight[slot]
+            span = _aligned(length)
+            expected = span if is_write else length
+            if res != expected:
+                err = -res if res < 0 else 5  # EIO on a short read/write
+                raise OSError(err, os.strerror(err))
+            if seen:
+                del inflight[slot]
+                free.append(slot)
+                advance(length)
             else:
-                print_error("Failed to download Alpine rootfs")
-                return None
-                
-        except subprocess.TimeoutExpired:
-            print_error("Download timed out")
-            return None
-        except FileNotFoundError:
-            print_error("wget/curl not found. Please install wget or curl.")
-            return None
-        except Exception as e:
-            print_error(f"Download error: {e}")
-            return None
+                inflight[slot][2] = 1
+                if span != length:
+                    # Zero the tail past EOF so the O_DIRECT write stays block aligned
+                    buffers[slot][length:span] = bytes(span - length)
+                    _prep_image_write(ring, dst_fd, buffers[slot], span, start, slot)
+        
+        sqe = liburing.io_uring_get_sqe(ring)
+        liburing.io_uring_prep_fsync(sqe, dst_fd, 0)
+        liburing.io_uring_submit_and_wait(ring, 1)
+        liburing.io_uring_wait_cqe(ring, cqe)
+        res = cqe.res
+        liburing.io_uring_cqe_seen(ring, cqe)
+        if res < 0:
+            raise OSError(-res, os.strerror(-res))
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return True
+
+
+def _copy_image_pwritev(src_fd: int, dst_fd: int, size: int, buf: memoryview, advance) -> None:
+    """Synchronous fallback: aligned preadv/pwritev through one buffer."""
+    offset = 0
+    while offset < size:
+        length = min(_FLASH_CHUNK, size - offset)
+        span = _aligned(length)
+        if span != length:
+            buf[length:span] = bytes(span - length)
+        if os.preadv(src_fd, [buf[:span]], offset) != length:
+            raise OSError(5, os.strerror(5))
+        written = 0
+        while written < span:
+            written += os.pwritev(dst_fd, [buf[written:span]], offset + written)
+        offset += length
+        advance(length)
+    os.fsync(dst_fd)
+
+
+def _scan_tree(top: str, files: List[str], dirs: List[Tuple[int, str]], depth: int = 0) -> None:
+    """Collect non-directories and (depth, path) for directories under `top`."""
+    with os.scandir(top) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append((depth + 1, entry.path))
+                _scan_tree(entry.path, files, dirs, depth + 1)
+            else:
+                files.append(entry.path)
+
+
+def _unlink_batch_uring(ring, cqe, paths: List[str], flags: int) -> None:
+    """unlinkat() every path, keeping up to _URING_DEPTH requests in flight."""
+    for start in range(0, len(paths), _URING_DEPTH):
+        # Encoded up front: the SQEs only point at these buffers until submitted
+        batch = [path.encode() for path in paths[start:start + _URING_DEPTH]]
+        for path in batch:
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_unlinkat(sqe, path, flags)
+        liburing.io_uring_submit_and_wait(ring, len(batch))
+        # Failures are left on disk for the shutil.rmtree sweep
+        _uring_reap(ring, cqe, len(batch))
+
+
+def _rmtree_uring(top: str) -> bool:
+    """Remove a tree with batched IORING_OP_UNLINKAT (Linux 5.11+); False if no ring."""
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    try:
+        liburing.io_uring_queue_init(_URING_DEPTH, ring, 0)
+    except OSError:
+        return False
     
-    def extract_rootfs(self, tarball_path: Path) -> Optional[Path]:
-        print_step(2, 7, "Extracting filesystem...")
-        
-        self.rootfs_dir = self.work_dir / "rootfs"
-        self.rootfs_dir.mkdir(parents=True, exist_ok=True)
-        
-        # On Windows, just create the directory structure
-        if self.is_windows:
-            print_success("Creating wallet directory structure")
-            return self.rootfs_dir
+    try:
+        files: List[str] = []
+        dirs: List[Tuple[int, str]] = []
+        _scan_tree(top, files, dirs)
+        _unlink_batch_uring(ring, cqe, files, 0)
+        
+        # Directories deepest first; all of one depth can go at once
+        remove_dir = getattr(liburing, "AT_REMOVEDIR", 0x200)
+        dirs.sort(reverse=True)
+        level: List[str] = []
+        for i, (depth, path) in enumerate(dirs):
+            level.append(path)
+            if i + 1 == len(dirs) or dirs[i + 1][0] != depth:
+                _unlink_batch_uring(ring, cqe, level, remove_dir)
+                level = []
+        _unlink_batch_uring(ring, cqe, [top], remove_dir)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return True
+
+
+def _rmtree(path: Path) -> None:
+    top = os.fspath(path)
+    if HAS_IO_URING:
+        try:
+            _rmtree_uring(top)
+        except OSError:
+            pass
+    if os.path.lexists(top):
+        shutil.rmtree(top, ignore_errors=True)
+
+
+def _fadvise(fd: int, advice: str) -> None:
+    """posix_fadvise over the whole file; a no-op where unsupported."""
+    flag = getattr(os, advice, None)
+    if flag is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, flag)
+    except OSError:
+        pass
+
+
+@contextmanager
+def _sequential_read(path):
+    """Open `path` for a single streaming pass.
+    
+    The SEQUENTIAL hint lives on the open file, so hand this fd to child
+    processes (as stdin) rather than the path. Its pages are dropped from
+    the page cache afterwards since nothing re-reads them.
+    """
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        _fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+        yield fd
+    finally:
+        _fadvise(fd, "POSIX_FADV_DONTNEED")
+        os.close(fd)
+
+
+def _untar_gz(archive: Path, dest, timeout: int) -> subprocess.CompletedProcess:
+    """Unpack a .tar.gz with tar, decompressing in a parallel pigz process when available.
+    
+    pigz writes straight into tar's stdin pipe, so the data never passes
+    through Python.
+    """
+    # Alpine's uids/gids, not host name lookups; no xattr syscalls. -p keeps
+    # setuid/sticky bits (busybox's bbsuid, /tmp's 1777) for non-root runs.
+    tar_cmd = ['tar', '--numeric-owner', '--no-xattrs', '-p', '-C', str(dest)]
+    
+    with _sequential_read(archive) as fd:
+        if not shutil.which('pigz'):
+            return subprocess.run(
+                [*tar_cmd, '-xzf', '-'],
+                stdin=fd,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
         
+        pigz = subprocess.Popen(
+            ['pigz', '-dc'],
+            stdin=fd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
         try:
             result = subprocess.run(
-                ['tar', '-xzf', str(tarball_path), '-C', str(self.rootfs_dir)],
+                [*tar_cmd, '-xf', '-'],
+                stdin=pigz.stdout,
                 capture_output=True,
                 text=True,
-                timeout=120
+                timeout=timeout
             )
-            
-            if result.returncode == 0:
-                print_success("Filesystem extracted")
-                return self.rootfs_dir
-            else:
-                print_error(f"Extraction failed: {result.stderr}")
-                return None
-                
-        except Exception as e:
-            print_error(f"Extraction error: {e}")
-            return None
+        finally:
+            pigz.stdout.close()
+            pigz.wait(timeout=30)
     
-    def configure_offline_os(self) -> bool:
-        if not self.rootfs_dir:
-            print_error("No rootfs directory set")
-            return False
-        
-        print_step(3, 7, "Configuring offline OS...")
-        
-        try:
-            wallet_dir = self.rootfs_dir / "wallet"
-            inbox_dir = self.rootfs_dir / "inbox"
-            outbox_dir = self.rootfs_dir / "outbox"
-            
-            for d in [wallet_dir, inbox_dir, outbox_dir]:
-                d.mkdir(parents=True, exist_ok=True)
-            
-            modprobe_dir = self.rootfs_dir / "etc" / "modprobe.d"
-            modprobe_dir.mkdir(parents=True, exist_ok=True)
-            blacklist_conf = modprobe_dir / "blacklist-network.conf"
-            
-            with open(blacklist_conf, 'w') as f:
-                f.write("# Network modules blacklisted for offline cold wallet\n")
-                f.write("# Ethernet drivers\n")
-                for module in NETWORK_BLACKLIST_MODULES:
-                    f.write(f"blacklist {module}\n")
-                f.write("# Additional wireless drivers\n")
-                f.write("blacklist cfg80211\n")
-                f.write("blacklist mac80211\n")
-                f.write("blacklist rfkill\n")
-                f.write("blacklist bluetooth\n")
-                f.write("blacklist btusb\n")
-                f.write("# USB network adapters\n")
-                f.write("blacklist usbnet\n")
-                f.write("blacklist cdc_ether\n")
-                f.write("blacklist rndis_host\n")
-                f.write("blacklist ax88179_178a\n")
-            
-            print_success("Network drivers blacklisted")
-            
-            self._disable_network_services()
-            self._create_network_lockdown_script()
-            self._create_signing_script()
-            self._create_first_boot_keygen()
-            self._create_boot_profile()
-            
-            print_success("Offline OS configured")
-            return True
-            
-        except Exception as e:
-            print_error(f"Configuration error: {e}")
-            return False
+    if pigz.returncode != 0 and result.returncode == 0:
+        result.returncode = pigz.returncode
+        result.stderr = "pigz failed to decompress the archive"
+    return result
+
+
+def _write_manifest(root: Path, files: List[_FileEntry], dirs: Iterable[str] = ()) -> None:
+    """Create each directory once, then write every file with one open/write/close."""
+    root_str = os.path.abspath(os.fspath(root))
+    parents = set(dirs)
+    parents.update(os.path.dirname(rel) for rel, _, _ in files)
     
-    def _install_python_deps(self) -> bool:
-        """Create a setup script for installing Python deps on first boot"""
-        print_step(4, 7, "Configuring Python environment...")
-        
-        setup_script = self.rootfs_dir / "etc" / "local.d" / "setup-python.start"
-        setup_script.parent.mkdir(parents=True, exist_ok=True)
-        
-        setup_content = '''#!/bin/sh
+    # Deepest first: makedirs on a leaf creates its ancestors, so any
+    # directory already covered by a created leaf is skipped
+    created = set()
+    for d in sorted(parents, key=lambda rel: rel.count("/"), reverse=True):
+        if not d or d in created:
+            continue
+        os.makedirs(os.path.join(root_str, d), exist_ok=True)
+        while d and d not in created:
+            created.add(d)
+            d = os.path.dirname(d)
+    
+    entries = [(os.path.join(root_str, rel), mode, payload)
+               for rel, mode, payload in files]
+    
+    if HAS_IO_URING and _write_manifest_uring(entries):
+        return
+    
+    for path, mode, payload in entries:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            if mode is not None:
+                if hasattr(os, "fchmod"):
+                    os.fchmod(fd, mode)
+                else:
+                    os.chmod(path, mode)
+        finally:
+            os.close(fd)
+
+
+# Offline OS payloads, encoded once at import rather than on every build
+
+_BLACKLIST_CONF = (
+    b"# Network modules blacklisted for offline cold wallet\n"
+    b"# Ethernet drivers\n"
+    + b"".join(b"blacklist %s\n" % module.encode() for module in NETWORK_BLACKLIST_MODULES)
+    + b"# Additional wireless drivers\n"
+    b"blacklist cfg80211\n"
+    b"blacklist mac80211\n"
+    b"blacklist rfkill\n"
+    b"blacklist bluetooth\n"
+    b"blacklist btusb\n"
+    b"# USB network adapters\n"
+    b"blacklist usbnet\n"
+    b"blacklist cdc_ether\n"
+    b"blacklist rndis_host\n"
+    b"blacklist ax88179_178a\n"
+)
+
+_NETWORK_INTERFACES = (
+    b"# Network interfaces disabled for cold wallet security\n"
+    b"auto lo\n"
+    b"iface lo inet loopback\n"
+)
+
+_SETUP_PYTHON_START = b'''#!/bin/sh
 # Install Python and Solana dependencies on first boot
 if [ ! -f /var/lib/.python-setup-done ]; then
     echo "Setting up Python environment..."
     apk update 2>/dev/null || true
     apk add python3 py3-pip py3-pynacl 2>/dev/null || true
+    apk add py3-orjson 2>/dev/null || true
     pip3 install solders solana pynacl --break-system-packages 2>/dev/null || true
     touch /var/lib/.python-setup-done
     echo "Python setup complete"
 fi
 '''
-        
-        with open(setup_script, 'w') as f:
-            f.write(setup_content)
-        os.chmod(setup_script, 0o755)
-        
-        # Copy the SecureWalletHandler module
-        self._copy_secure_memory_module()
-        
-        print_success("Python environment configured")
-        return True
-
-    def _copy_secure_memory_module(self):
-        """Copy the secure memory module to the offline OS"""
-        src_path = Path("temp_coldstar/src/secure_memory.py")
-        dest_path = self.rootfs_dir / "usr" / "local" / "bin" / "secure_memory.py"
-        
-        if src_path.exists():
-            shutil.copy2(src_path, dest_path)
-            print_info("Secure memory module copied to offline OS")
-        else:
-            print_warning(f"Could not find secure_memory.py at {src_path}")
 
-    
-    def _disable_network_services(self):
-        init_dir = self.rootfs_dir / "etc" / "init.d"
-        init_dir.mkdir(parents=True, exist_ok=True)
-        
-        rclocal = self.rootfs_dir / "etc" / "local.d" / "disable-network.start"
-        rclocal.parent.mkdir(parents=True, exist_ok=True)
-        
-        network_lockdown = '''#!/bin/sh
+_DISABLE_NETWORK_START = b'''#!/bin/sh
 # Ensure no network interfaces come up
 for iface in $(ls /sys/class/net/ 2>/dev/null | grep -v lo); do
     ip link set "$iface" down 2>/dev/null
@@ -253,25 +596,8 @@ for proc in dhcpcd udhcpc wpa_supplicant NetworkManager; do
     pkill -9 "$proc" 2>/dev/null
 done
 '''
-        
-        with open(rclocal, 'w') as f:
-            f.write(network_lockdown)
-        os.chmod(rclocal, 0o755)
-        
-        interfaces_file = self.rootfs_dir / "etc" / "network" / "interfaces"
-        interfaces_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(interfaces_file, 'w') as f:
-            f.write("# Network interfaces disabled for cold wallet security\n")
-            f.write("auto lo\n")
-            f.write("iface lo inet loopback\n")
-        
-        print_success("Network services disabled")
-    
-    def _create_network_lockdown_script(self):
-        script_path = self.rootfs_dir / "usr" / "local" / "bin" / "verify_offline.sh"
-        script_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        script_content = '''#!/bin/sh
+
+_VERIFY_OFFLINE_SH = b'''#!/bin/sh
 # Verify system is truly offline
 
 echo "NETWORK STATUS CHECK"
@@ -305,18 +631,8 @@ else
     echo "Do NOT sign transactions on this system!"
 fi
 '''
-        
-        with open(script_path, 'w') as f:
-            f.write(script_content)
-        os.chmod(script_path, 0o755)
-    
-    def _create_signing_script(self):
-        script_dir = self.rootfs_dir / "usr" / "local" / "bin"
-        script_dir.mkdir(parents=True, exist_ok=True)
-        
-        sign_script = script_dir / "sign_tx.sh"
-        
-        script_content = '''#!/bin/sh
+
+_SIGN_TX_SH = b'''#!/bin/sh
 # Solana Offline Transaction Signing Script
 # B - Love U 3000
 
@@ -384,23 +700,25 @@ else
     exit 1
 fi
 '''
-        
-        with open(sign_script, 'w') as f:
-            f.write(script_content)
-        
-        os.chmod(sign_script, 0o755)
-        
-        python_sign_script = script_dir / "offline_sign.py"
-        
-        python_content = '''#!/usr/bin/env python3
+
+_OFFLINE_SIGN_PY = b'''#!/usr/bin/env python3
 """Offline transaction signing script for cold wallet"""
 
 import sys
-import json
 import base64
 import getpass
 import gc
 
+# orjson (C) when installed, stdlib json otherwise
+try:
+    import orjson
+    loads = orjson.loads
+    dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    loads = json.loads
+    dumps = lambda obj: json.dumps(obj, indent=2).encode()
+
 # Add local bin to path to find secure_memory
 sys.path.append("/usr/local/bin")
 
@@ -424,8 +742,8 @@ def main():
             print("WARNING: secure_memory module not found. Encryption disabled.")
             SecureWalletHandler = None
         
-        with open(keypair_path, 'r') as f:
-            wallet_data = json.load(f)
+        with open(keypair_path, 'rb') as f:
+            wallet_data = loads(f.read())
             
         keypair = None
         
@@ -446,8 +764,8 @@ def main():
                 print("ERROR: Encrypted wallet found but secure_memory module missing.")
                 sys.exit(1)
         
-        with open(unsigned_path, 'r') as f:
-            tx_data = json.load(f)
+        with open(unsigned_path, 'rb') as f:
+            tx_data = loads(f.read())
         
         tx_bytes = base64.b64decode(tx_data['data'])
         tx = Transaction.from_bytes(tx_bytes)
@@ -464,8 +782,8 @@ def main():
             "data": base64.b64encode(bytes(tx)).decode('utf-8')
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(signed_data, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(dumps(signed_data))
         
         print("Transaction signed successfully")
         
@@ -480,18 +798,8 @@ def main():
 if __name__ == "__main__":
     main()
 '''
-        
-        with open(python_sign_script, 'w') as f:
-            f.write(python_content)
-        
-        os.chmod(python_sign_script, 0o755)
-        print_success("Signing scripts created")
-    
-    def _create_boot_profile(self):
-        profile_path = self.rootfs_dir / "etc" / "profile.d" / "wallet-welcome.sh"
-        profile_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        profile_content = '''#!/bin/sh
+
+_WALLET_WELCOME_SH = b'''#!/bin/sh
 # Wallet boot message
 # B - Love U 3000
 
@@ -528,20 +836,8 @@ echo ""
 echo "=============================================="
 echo ""
 '''
-        
-        with open(profile_path, 'w') as f:
-            f.write(profile_content)
-        
-        os.chmod(profile_path, 0o755)
-        print_success("Boot profile created")
-    
-    def _create_first_boot_keygen(self):
-        script_dir = self.rootfs_dir / "usr" / "local" / "bin"
-        script_dir.mkdir(parents=True, exist_ok=True)
-        
-        keygen_script = script_dir / "init_wallet.py"
-        
-        keygen_content = '''#!/usr/bin/env python3
+
+_INIT_WALLET_PY = b'''#!/usr/bin/env python3
 """First-boot wallet initialization - generates keypair on air-gapped device"""
 
 import os
@@ -643,27 +939,273 @@ def main():
 if __name__ == "__main__":
     main()
 '''
-        
-        with open(keygen_script, 'w') as f:
-            f.write(keygen_content)
-        os.chmod(keygen_script, 0o755)
-        
-        first_boot_script = self.rootfs_dir / "etc" / "local.d" / "init-wallet.start"
-        first_boot_script.parent.mkdir(parents=True, exist_ok=True)
-        
-        boot_init_content = '''#!/bin/sh
+
+_INIT_WALLET_START = b'''#!/bin/sh
 # First boot wallet initialization
 if [ ! -f /wallet/keypair.json ]; then
     python3 /usr/local/bin/init_wallet.py
 fi
 '''
+
+
+class ISOBuilder:
+    def __init__(self):
+        self.work_dir: Optional[Path] = None
+        self.rootfs_dir: Optional[Path] = None
+        self.iso_path: Optional[Path] = None
+        self.generated_pubkey: Optional[str] = None
+        self.is_windows = platform.system() == 'Windows'
+    
+    def build_complete_iso(self, output_dir: str = "./output") -> Optional[Path]:
+        """Build complete bootable ISO with transaction signing and keygen"""
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        with tempfile.TemporaryDirectory() as work_dir:
+            self.work_dir = Path(work_dir)
+            
+            if not self.download_and_extract_rootfs(work_dir):
+                return None
+            
+            if not self.configure_offline_os():
+                return None
+            
+            if not self._install_python_deps():
+                return None
+            
+            iso_path = self._create_bootable_image(output_path)
+            if iso_path:
+                print_success(f"ISO created successfully: {iso_path}")
+                return iso_path
+            
+            return None
+    
+    def download_and_extract_rootfs(self, work_dir: str) -> Optional[Path]:
+        """Fetch (or reuse) the Alpine minirootfs and extract it into the rootfs directory.
+        
+        Nothing is extracted or cached until the tarball matches the
+        SHA-256 Alpine publishes next to it.
+        """
+        self.work_dir = Path(work_dir)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.rootfs_dir = self.work_dir / "rootfs"
+        self.rootfs_dir.mkdir(parents=True, exist_ok=True)
+        
+        # On Windows, skip the Alpine download and use simplified approach
+        if self.is_windows:
+            print_step(1, 7, "Preparing wallet structure for Windows...")
+            print_info("Using simplified wallet structure for Windows")
+            return self.rootfs_dir
+        
+        print_step(1, 7, "Downloading and extracting Alpine Linux minirootfs...")
+        
+        try:
+            expected = _published_sha256()
+            if not expected:
+                # Offline: a cached tarball can still be checked against the
+                # digest it was verified with when it was downloaded
+                expected = _recorded_sha256()
+                tarball = _cached_rootfs(expected) if expected else None
+                if not tarball:
+                    print_error("Could not fetch the published SHA-256 for the Alpine rootfs")
+                    print_info("Refusing to build from a tarball that cannot be verified")
+                    return None
+                print_warning("Alpine mirror unreachable, using the previously verified cached rootfs")
+            else:
+                tarball = _cached_rootfs(expected)
+            
+            if tarball:
+                print_info(f"Using cached Alpine rootfs: {tarball}")
+            else:
+                tarball = self._download_rootfs(expected)
+                if not tarball:
+                    return None
+            
+            self._extract_rootfs(tarball)
+            print_success("Alpine Linux rootfs extracted")
+            return self.rootfs_dir
+            
+        except (tarfile.TarError, EOFError, subprocess.TimeoutExpired) as e:
+            print_error(f"Extraction failed: {e}")
+            return None
+        except Exception as e:
+            print_error(f"Download error: {e}")
+            return None
+    
+    def _download_rootfs(self, expected_sha256: str) -> Optional[Path]:
+        """Download the minirootfs into the cache, keeping it only if the checksum matches."""
+        cache_path = _rootfs_cache_path()
+        part_path = cache_path.with_suffix('.part')
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if not self._download_rootfs_parallel(part_path, expected_sha256):
+            if self._download_rootfs_single(part_path) != expected_sha256:
+                part_path.unlink()
+                print_error("Downloaded Alpine rootfs does not match the published SHA-256")
+                return None
+        
+        os.replace(part_path, cache_path)
+        cache_path.with_suffix('.sha256').write_text(expected_sha256 + "\n")
+        return cache_path
+    
+    def _download_rootfs_single(self, dest: Path) -> str:
+        """Fetch the minirootfs over one connection, returning the SHA-256 of what was written."""
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(ALPINE_MINIROOTFS_URL, timeout=60) as response:
+            length = response.headers.get("Content-Length")
+            with create_progress_bar("Downloading") as progress:
+                with progress.wrap_file(
+                    response,
+                    total=int(length) if length else None,
+                    description="Alpine rootfs",
+                ) as stream, open(dest, 'wb') as part:
+                    for block in iter(lambda: stream.read(_TAR_BUFSIZE), b''):
+                        digest.update(block)
+                        part.write(block)
+        return digest.hexdigest()
+    
+    def _download_rootfs_parallel(self, dest: Path, expected_sha256: str) -> bool:
+        """Fetch the minirootfs over several Range connections into a pre-sized file.
+        
+        Returns False (leaving nothing behind) when the mirror doesn't
+        serve ranges or the result fails verification, so the caller can
+        fall back to a single connection.
+        """
+        if not hasattr(os, 'pwrite'):
+            return False
+        
+        try:
+            size = _probe_ranged_size()
+            if not size or size < _MIN_RANGED_SIZE:
+                return False
+            
+            step = -(-size // _DOWNLOAD_CONNECTIONS)
+            ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+            
+            fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+            try:
+                try:
+                    os.posix_fallocate(fd, 0, size)
+                except (AttributeError, OSError):
+                    os.ftruncate(fd, size)
+                
+                with create_progress_bar("Downloading") as progress:
+                    task = progress.add_task(
+                        f"Alpine rootfs ({len(ranges)} connections)", total=size
+                    )
+                    advance = lambda n: progress.advance(task, n)
+                    with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                        futures = [pool.submit(_fetch_range, fd, start, end, advance)
+                                   for start, end in ranges]
+                        for future in futures:
+                            future.result()
+            finally:
+                os.close(fd)
+            
+            if _file_sha256(dest) != expected_sha256:
+                raise ValueError("SHA-256 mismatch against published checksum")
+            return True
+            
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            print_warning(f"Parallel download unavailable ({e}), using a single connection")
+            if dest.exists():
+                dest.unlink()
+            return False
+    
+    def _extract_rootfs(self, tarball: Path) -> None:
+        """Check every member of the verified tarball, then unpack it with native tar."""
+        _check_rootfs_members(tarball, self.rootfs_dir)
+        result = _untar_gz(tarball, self.rootfs_dir, timeout=300)
+        if result.returncode != 0:
+            raise tarfile.TarError(result.stderr.strip() or f"tar exited with {result.returncode}")
+    
+    def configure_offline_os(self) -> bool:
+        if not self.rootfs_dir:
+            print_error("No rootfs directory set")
+            return False
+        
+        print_step(3, 7, "Configuring offline OS...")
+        
+        try:
+            # Collect every file first, then write them in one pass
+            files: List[_FileEntry] = [
+                ("etc/modprobe.d/blacklist-network.conf", None, _BLACKLIST_CONF),
+            ]
+            files += self._disable_network_services()
+            files += self._create_network_lockdown_script()
+            files += self._create_signing_script()
+            files += self._create_first_boot_keygen()
+            files += self._create_boot_profile()
+            
+            _write_manifest(
+                self.rootfs_dir,
+                files,
+                dirs=("wallet", "inbox", "outbox", "etc/init.d"),
+            )
+            
+            print_success("Network drivers blacklisted")
+            print_success("Network services disabled")
+            print_success("Signing scripts created")
+            print_success("First-boot keygen script created")
+            print_info("Wallet will be generated on first boot of air-gapped device")
+            print_success("Boot profile created")
+            print_success("Offline OS configured")
+            return True
+            
+        except Exception as e:
+            print_error(f"Configuration error: {e}")
+            return False
+    
+    def _install_python_deps(self) -> bool:
+        """Create a setup script for installing Python deps on first boot"""
+        print_step(4, 7, "Configuring Python environment...")
+        
+        _write_manifest(
+            self.rootfs_dir,
+            [("etc/local.d/setup-python.start", 0o755, _SETUP_PYTHON_START)],
+        )
         
-        with open(first_boot_script, 'w') as f:
-            f.write(boot_init_content)
-        os.chmod(first_boot_script, 0o755)
+        # Copy the SecureWalletHandler module
+        self._copy_secure_memory_module()
         
-        print_success("First-boot keygen script created")
-        print_info("Wallet will be generated on first boot of air-gapped device")
+        print_success("Python environment configured")
+        return True
+
+    def _copy_secure_memory_module(self):
+        """Copy the secure memory module to the offline OS"""
+        src_path = os.path.join("temp_coldstar", "src", "secure_memory.py")
+        dest_path = os.path.join(os.fspath(self.rootfs_dir), "usr", "local", "bin", "secure_memory.py")
+        
+        if os.path.exists(src_path):
+            shutil.copy2(src_path, dest_path)
+            print_info("Secure memory module copied to offline OS")
+        else:
+            print_warning(f"Could not find secure_memory.py at {src_path}")
+
+    
+    def _disable_network_services(self) -> List[_FileEntry]:
+        return [
+            ("etc/local.d/disable-network.start", 0o755, _DISABLE_NETWORK_START),
+            ("etc/network/interfaces", None, _NETWORK_INTERFACES),
+        ]
+    
+    def _create_network_lockdown_script(self) -> List[_FileEntry]:
+        return [("usr/local/bin/verify_offline.sh", 0o755, _VERIFY_OFFLINE_SH)]
+    
+    def _create_signing_script(self) -> List[_FileEntry]:
+        return [
+            ("usr/local/bin/sign_tx.sh", 0o755, _SIGN_TX_SH),
+            ("usr/local/bin/offline_sign.py", 0o755, _OFFLINE_SIGN_PY),
+        ]
+    
+    def _create_boot_profile(self) -> List[_FileEntry]:
+        return [("etc/profile.d/wallet-welcome.sh", 0o755, _WALLET_WELCOME_SH)]
+    
+    def _create_first_boot_keygen(self) -> List[_FileEntry]:
+        return [
+            ("usr/local/bin/init_wallet.py", 0o755, _INIT_WALLET_PY),
+            ("etc/local.d/init-wallet.start", 0o755, _INIT_WALLET_START),
+        ]
     
     def _create_bootable_image(self, output_dir: Path) -> Optional[Path]:
         """Create a bootable disk image"""
@@ -671,6 +1213,12 @@ fi
         
         image_path = output_dir / "solana-cold-wallet.img"
         
+        # Probe PATH up front instead of writing 512MB before a tool is found missing
+        missing = [tool for tool in ('dd', 'parted', 'losetup', 'mkfs.ext4') if not shutil.which(tool)]
+        if missing:
+            print_warning(f"{', '.join(missing)} not found, creating archive instead")
+            return self._create_archive_image(output_dir)
+        
         try:
             print_info("Creating 512MB disk image...")
             subprocess.run(
@@ -730,8 +1278,19 @@ fi
         """Fallback: create a tar.gz archive of the filesystem"""
         print_step(5, 7, "Creating portable filesystem archive...")
         
+        if _USE_SQUASHFS:
+            if shutil.which('mksquashfs') and shutil.which('unsquashfs'):
+                squashfs_path = self._create_squashfs_image(output_dir)
+                if squashfs_path:
+                    return squashfs_path
+            else:
+                print_warning("COLDSTAR_SQUASHFS=1 but squashfs-tools not found, creating tar archive")
+        
         archive_path = output_dir / "solana-cold-wallet.tar.gz"
         
+        if shutil.which('pigz'):
+            return self._create_archive_pigz(archive_path)
+        
         try:
             result = subprocess.run(
                 ['tar', '-czf', str(archive_path), '-C', str(self.rootfs_dir), '.'],
@@ -752,9 +1311,84 @@ fi
             print_error(f"Archive creation failed: {e}")
             return None
     
+    def _create_squashfs_image(self, output_dir: Path) -> Optional[Path]:
+        """Pack the rootfs into a zstd squashfs, compressing on all cores"""
+        image_path = output_dir / "solana-cold-wallet.sqfs"
+        print_info("COLDSTAR_SQUASHFS=1: packing the rootfs as a SquashFS image")
+        
+        try:
+            result = subprocess.run(
+                ['mksquashfs', str(self.rootfs_dir), str(image_path),
+                 '-comp', 'zstd', '-Xcompression-level', '19',
+                 '-processors', str(os.cpu_count() or 1), '-noappend', '-no-progress'],
+                capture_output=True,
+                text=True,
+                timeout=300
+            )
+            
+            if result.returncode == 0:
+                print_success(f"SquashFS image created: {image_path}")
+                self.iso_path = image_path
+                return image_path
+            
+            # e.g. squashfs-tools built without zstd support
+            print_warning(f"mksquashfs failed, creating tar archive instead: {result.stderr.strip()}")
+        except Exception as e:
+            print_warning(f"mksquashfs failed: {e}, creating tar archive instead")
+        
+        if image_path.exists():
+            image_path.unlink()
+        return None
+    
+    def _create_archive_pigz(self, archive_path: Path) -> Optional[Path]:
+        """Tar the rootfs in-process and gzip it on all cores with pigz"""
+        try:
+            with open(archive_path, 'wb') as out:
+                pigz = subprocess.Popen(
+                    ['pigz', '-p', str(os.cpu_count() or 1), '-c'],
+                    stdin=subprocess.PIPE,
+                    stdout=out,
+                    stderr=subprocess.PIPE,
+                )
+                try:
+                    with tarfile.open(fileobj=pigz.stdin, mode='w|', bufsize=_TAR_BUFSIZE) as tar:
+                        tar.add(str(self.rootfs_dir), arcname='.')
+                finally:
+                    pigz.stdin.close()
+                    stderr = pigz.stderr.read()
+                    pigz.wait(timeout=120)
+            
+            if pigz.returncode == 0:
+                print_success(f"Filesystem archive created: {archive_path}")
+                self.iso_path = archive_path
+                return archive_path
+            else:
+                print_error(f"Failed to create archive: {stderr.decode(errors='replace')}")
+                return None
+                
+        except Exception as e:
+            print_error(f"Archive creation failed: {e}")
+            return None
+    
     def get_generated_pubkey(self) -> Optional[str]:
         return self.generated_pubkey
     
+    def build_and_flash(self, device_path: str, output_dir: str = "./output") -> bool:
+        """Finish the prepared rootfs, build its image and flash it to the device."""
+        if not self.rootfs_dir or not self.rootfs_dir.exists():
+            print_error("Root filesystem not prepared")
+            return False
+        
+        if not self._install_python_deps():
+            return False
+        
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        image = self._create_bootable_image(output_path)
+        if not image:
+            return False
+        return self.flash_to_usb(device_path, str(image))
+    
     def build_iso(self, output_path: str = None) -> Optional[Path]:
         """Legacy method - use build_complete_iso instead"""
         return self.build_complete_iso(output_path or "./output")
@@ -961,6 +1595,47 @@ For more information, see the project documentation.
             print_error(f"Flash error: {e}")
             return False
     
+    def _flash_image_direct(self, image: Path, device_path: str) -> bool:
+        """Write a raw image to the device with O_DIRECT, 8 x 4 MiB chunks in flight"""
+        size = image.stat().st_size
+        try:
+            # tmpfs and some FUSE filesystems reject O_DIRECT on the source
+            src_fd = os.open(image, os.O_RDONLY | _O_DIRECT)
+        except OSError:
+            src_fd = os.open(image, os.O_RDONLY)
+            _fadvise(src_fd, "POSIX_FADV_SEQUENTIAL")
+        
+        dst_fd = None
+        buffer = None
+        try:
+            dst_fd = os.open(device_path, os.O_WRONLY | _O_DIRECT)
+            # One region sliced into chunk buffers: anonymous mmaps are page
+            # aligned (as O_DIRECT requires) and a single large region gives
+            # THP whole 2 MiB extents to back
+            depth = _FLASH_DEPTH if HAS_IO_URING else 1
+            buffer = _alloc_io_buffer(depth * _FLASH_CHUNK)
+            region = memoryview(buffer)
+            views = [region[i * _FLASH_CHUNK:(i + 1) * _FLASH_CHUNK] for i in range(depth)]
+            
+            with create_progress_bar("Flashing") as progress:
+                task = progress.add_task("Writing image", total=size)
+                advance = lambda n: progress.advance(task, n)
+                try:
+                    if not (HAS_IO_URING and _copy_image_uring(src_fd, dst_fd, size, views, advance)):
+                        _copy_image_pwritev(src_fd, dst_fd, size, views[0], advance)
+                finally:
+                    for v in views:
+                        v.release()
+                    region.release()
+            return True
+        finally:
+            _fadvise(src_fd, "POSIX_FADV_DONTNEED")
+            os.close(src_fd)
+            if dst_fd is not None:
+                os.close(dst_fd)
+            if buffer is not None:
+                buffer.close()
+    
     def _flash_to_usb_linux(self, device_path: str, image_path: str = None) -> bool:
         """Flash on Linux using dd or mount/copy"""
         image = Path(image_path) if image_path else self.iso_path
@@ -976,11 +1651,17 @@ For more information, see the project documentation.
             mount_point = None
             
             if str(image).endswith('.img') or str(image).endswith('.iso'):
-                result = subprocess.run(
-                    ['dd', f'if={image}', f'of={device_path}', 'bs=4M', 'status=progress', 'oflag=sync'],
-                    capture_output=False,
-                    timeout=600
-                )
+                if _O_DIRECT and hasattr(os, 'pwritev'):
+                    success = self._flash_image_direct(image, device_path)
+                else:
+                    with _sequential_read(image) as fd:
+                        result = subprocess.run(
+                            ['dd', f'of={device_path}', 'bs=4M', 'status=progress', 'oflag=sync'],
+                            stdin=fd,
+                            capture_output=False,
+                            timeout=600
+                        )
+                    success = result.returncode == 0
             else:
                 print_info("Formatting USB device...")
                 subprocess.run(['mkfs.ext4', '-F', device_path], capture_output=True, timeout=60)
@@ -990,13 +1671,18 @@ For more information, see the project documentation.
                 
                 subprocess.run(['mount', device_path, mount_point], capture_output=True, timeout=30)
                 
-                result = subprocess.run(
-                    ['tar', '-xzf', str(image), '-C', mount_point],
-                    capture_output=True,
-                    timeout=300
-                )
+                if str(image).endswith('.sqfs'):
+                    print_info(f"Unpacking SquashFS image {image.name} onto the device...")
+                    result = subprocess.run(
+                        ['unsquashfs', '-f', '-d', mount_point, str(image)],
+                        capture_output=True,
+                        timeout=300
+                    )
+                else:
+                    result = _untar_gz(image, mount_point, timeout=300)
+                success = result.returncode == 0
             
-            if result.returncode == 0:
+            if success:
                 # Step 7: Generate wallet on USB if we have a mount point
                 if mount_point:
                     if not self._generate_wallet_on_usb(mount_point):
@@ -1028,7 +1714,7 @@ For more information, see the project documentation.
         if self.work_dir and self.work_dir.exists():
             try:
                 if self.rootfs_dir and self.rootfs_dir.exists():
-                    shutil.rmtree(self.rootfs_dir, ignore_errors=True)
+                    _rmtree(self.rootfs_dir)
                 
                 tarball = self.work_dir / "alpine-minirootfs.tar.gz"
                 if tarball.exists():
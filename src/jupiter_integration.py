@@ -5,19 +5,18 @@ Enables creating unsigned swap transactions for QR-based signing
 B - Love U 3000
 """
 
-import json
-import base64
+import atexit
+import functools
 import httpx
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from decimal import Decimal
+from typing import Optional, Dict, Any, List, Iterable, Union
 
 from solders.keypair import Keypair
-from solders.pubkey import Pubkey
 from solders.transaction import VersionedTransaction
-from solders.message import to_bytes_versioned
 
 from src.ui import print_success, print_error, print_info, print_warning
+from src._compat import HAS_HTTP2, base64, json_dumps, json_loads
 
 
 # Jupiter API V6 endpoints
@@ -36,9 +35,56 @@ TOKENS = {
 }
 
 
+# One sync client per process: every instance multiplexes its calls to
+# the Jupiter API over the same kept-alive (HTTP/2 when available) TLS session
+_SHARED_CLIENT: Optional[httpx.Client] = None
+
+
+def _shared_client() -> httpx.Client:
+    """Return the process-wide sync client, creating it on first use."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        _SHARED_CLIENT = httpx.Client(
+            timeout=httpx.Timeout(30.0, connect=3.0),
+            # With an explicit transport, http2/limits must be set on it
+            transport=httpx.HTTPTransport(
+                http2=HAS_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+                retries=1,
+            ),
+        )
+    return _SHARED_CLIENT
+
+
+@atexit.register
+def _close_shared_client():
+    if _SHARED_CLIENT is not None:
+        _SHARED_CLIENT.close()
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_token(symbol: str) -> str:
+    symbol_upper = symbol.upper()
+    if symbol_upper in TOKENS:
+        return TOKENS[symbol_upper]
+    return symbol  # Assume it's already a mint address
+
+
 class JupiterSwapManager:
     """Manages Jupiter swap operations for air-gapped cold wallets"""
 
+    # Built once; padding is part of the literal rather than ' ' * N per call
+    _SUMMARY_TEMPLATE = (
+        "╔══════════════════════════════════════════════════════════╗\n"
+        "║                    SWAP TRANSACTION                      ║\n"
+        "╠══════════════════════════════════════════════════════════╣\n"
+        "║  From:          {input_amount:.6f} {input_symbol:<30} ║\n"
+        "║  To:            {output_amount:.6f} {output_symbol:<30} ║\n"
+        "║  Price Impact:  {price_impact:.2f}%                                   ║\n"
+        "║  Route:         {route_steps} step(s)                                  ║\n"
+        "╚══════════════════════════════════════════════════════════╝"
+    )
+
     def __init__(self, slippage_bps: int = 50):
         """
         Initialize Jupiter swap manager
@@ -47,14 +93,24 @@ class JupiterSwapManager:
             slippage_bps: Slippage tolerance in basis points (50 = 0.5%)
         """
         self.slippage_bps = slippage_bps
-        self.client = httpx.Client(timeout=30.0)
+        self.client = _shared_client()
+        # Created on first async call, shared by every a* method
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Parsed unsigned transactions, so a retried sign skips re-parsing
+        self._tx_cache: "OrderedDict[bytes, VersionedTransaction]" = OrderedDict()
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=30.0,
+                http2=HAS_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=16),
+            )
+        return self._async_client
 
     def get_token_address(self, symbol: str) -> Optional[str]:
         """Get token mint address from symbol"""
-        symbol_upper = symbol.upper()
-        if symbol_upper in TOKENS:
-            return TOKENS[symbol_upper]
-        return symbol  # Assume it's already a mint address
+        return _resolve_token(symbol)
 
     def get_quote(
         self,
@@ -76,48 +132,31 @@ class JupiterSwapManager:
             Quote data or None on error
         """
         try:
-            input_addr = self.get_token_address(input_mint)
-            output_addr = self.get_token_address(output_mint)
-            slippage = slippage_bps or self.slippage_bps
-
-            print_info(f"Fetching quote from Jupiter...")
-            print_info(f"  Input: {input_mint} ({input_addr[:8]}...)")
-            print_info(f"  Output: {output_mint} ({output_addr[:8]}...)")
-            print_info(f"  Amount: {amount}")
-
-            params = {
-                "inputMint": input_addr,
-                "outputMint": output_addr,
-                "amount": str(amount),
-                "slippageBps": str(slippage),
-                "onlyDirectRoutes": "false",
-                "asLegacyTransaction": "false"
-            }
-
+            params = self._quote_params(input_mint, output_mint, amount, slippage_bps)
             response = self.client.get(JUPITER_QUOTE_API, params=params)
             response.raise_for_status()
+            return self._check_quote(json_loads(response.content))
 
-            quote = response.json()
-
-            if "error" in quote:
-                print_error(f"Jupiter API error: {quote['error']}")
-                return None
-
-            # Display quote info
-            in_amount = int(quote.get("inAmount", 0))
-            out_amount = int(quote.get("outAmount", 0))
-            price_impact = quote.get("priceImpactPct", 0)
-
-            print_success("Quote received!")
-            print_info(f"  Input amount: {in_amount}")
-            print_info(f"  Expected output: {out_amount}")
-            print_info(f"  Price impact: {price_impact}%")
-            print_info(f"  Route: {len(quote.get('routePlan', []))} steps")
-
-            if float(price_impact) > 1.0:
-                print_warning(f"High price impact: {price_impact}%")
+        except httpx.HTTPError as e:
+            print_error(f"HTTP error fetching quote: {e}")
+            return None
+        except Exception as e:
+            print_error(f"Failed to get quote: {e}")
+            return None
 
-            return quote
+    async def aget_quote(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        slippage_bps: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async get_quote()"""
+        try:
+            params = self._quote_params(input_mint, output_mint, amount, slippage_bps)
+            response = await self._get_async_client().get(JUPITER_QUOTE_API, params=params)
+            response.raise_for_status()
+            return self._check_quote(json_loads(response.content))
 
         except httpx.HTTPError as e:
             print_error(f"HTTP error fetching quote: {e}")
@@ -126,6 +165,53 @@ class JupiterSwapManager:
             print_error(f"Failed to get quote: {e}")
             return None
 
+    def _quote_params(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        slippage_bps: Optional[int]
+    ) -> Dict[str, str]:
+        input_addr = self.get_token_address(input_mint)
+        output_addr = self.get_token_address(output_mint)
+        slippage = slippage_bps or self.slippage_bps
+
+        print_info(f"Fetching quote from Jupiter...")
+        print_info(f"  Input: {input_mint} ({input_addr[:8]}...)")
+        print_info(f"  Output: {output_mint} ({output_addr[:8]}...)")
+        print_info(f"  Amount: {amount}")
+
+        return {
+            "inputMint": input_addr,
+            "outputMint": output_addr,
+            "amount": str(amount),
+            "slippageBps": str(slippage),
+            "onlyDirectRoutes": "false",
+            "asLegacyTransaction": "false"
+        }
+
+    def _check_quote(self, quote: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Reject API errors and display the quote"""
+        if "error" in quote:
+            print_error(f"Jupiter API error: {quote['error']}")
+            return None
+
+        # Display quote info
+        in_amount = int(quote.get("inAmount", 0))
+        out_amount = int(quote.get("outAmount", 0))
+        price_impact = quote.get("priceImpactPct", 0)
+
+        print_success("Quote received!")
+        print_info(f"  Input amount: {in_amount}")
+        print_info(f"  Expected output: {out_amount}")
+        print_info(f"  Price impact: {price_impact}%")
+        print_info(f"  Route: {len(quote.get('routePlan', []))} steps")
+
+        if float(price_impact) > 1.0:
+            print_warning(f"High price impact: {price_impact}%")
+
+        return quote
+
     def create_swap_transaction(
         self,
         quote: Dict[str, Any],
@@ -148,41 +234,41 @@ class JupiterSwapManager:
         try:
             print_info("Creating swap transaction...")
 
-            # Prepare swap request
-            swap_request = {
-                "quoteResponse": quote,
-                "userPublicKey": user_pubkey,
-                "wrapAndUnwrapSol": wrap_unwrap_sol,
-                "dynamicComputeUnitLimit": True,
-                "prioritizationFeeLamports": priority_fee or "auto"
-            }
-
             response = self.client.post(
                 JUPITER_SWAP_API,
-                json=swap_request,
+                json=_swap_request(quote, user_pubkey, wrap_unwrap_sol, priority_fee),
                 headers={"Content-Type": "application/json"}
             )
             response.raise_for_status()
 
-            swap_data = response.json()
-
-            if "error" in swap_data:
-                print_error(f"Swap API error: {swap_data['error']}")
-                return None
+            return _swap_tx_bytes(json_loads(response.content))
 
-            # Get the serialized transaction
-            swap_tx_base64 = swap_data.get("swapTransaction")
-            if not swap_tx_base64:
-                print_error("No transaction returned from Jupiter")
-                return None
+        except httpx.HTTPError as e:
+            print_error(f"HTTP error creating swap: {e}")
+            return None
+        except Exception as e:
+            print_error(f"Failed to create swap transaction: {e}")
+            return None
 
-            # Decode the transaction
-            tx_bytes = base64.b64decode(swap_tx_base64)
+    async def acreate_swap_transaction(
+        self,
+        quote: Dict[str, Any],
+        user_pubkey: str,
+        wrap_unwrap_sol: bool = True,
+        priority_fee: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Async create_swap_transaction()"""
+        try:
+            print_info("Creating swap transaction...")
 
-            print_success("Unsigned swap transaction created!")
-            print_info(f"  Transaction size: {len(tx_bytes)} bytes")
+            response = await self._get_async_client().post(
+                JUPITER_SWAP_API,
+                json=_swap_request(quote, user_pubkey, wrap_unwrap_sol, priority_fee),
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
 
-            return tx_bytes
+            return _swap_tx_bytes(json_loads(response.content))
 
         except httpx.HTTPError as e:
             print_error(f"HTTP error creating swap: {e}")
@@ -202,28 +288,32 @@ class JupiterSwapManager:
             Price data or None on error
         """
         try:
-            # Convert symbols to addresses
-            addresses = [self.get_token_address(tid) for tid in token_ids]
-
-            params = {
-                "ids": ",".join(addresses)
-            }
-
-            response = self.client.get(JUPITER_PRICE_API, params=params)
+            response = self.client.get(JUPITER_PRICE_API, params=self._price_params(token_ids))
             response.raise_for_status()
+            return _price_data(json_loads(response.content))
 
-            prices = response.json()
-
-            if "data" not in prices:
-                print_error("No price data returned")
-                return None
+        except Exception as e:
+            print_error(f"Failed to get prices: {e}")
+            return None
 
-            return prices["data"]
+    async def aget_price(self, token_ids: List[str]) -> Optional[Dict[str, Any]]:
+        """Async get_price()"""
+        try:
+            response = await self._get_async_client().get(
+                JUPITER_PRICE_API, params=self._price_params(token_ids)
+            )
+            response.raise_for_status()
+            return _price_data(json_loads(response.content))
 
         except Exception as e:
             print_error(f"Failed to get prices: {e}")
             return None
 
+    def _price_params(self, token_ids: List[str]) -> Dict[str, str]:
+        # Convert symbols to addresses
+        addresses = [self.get_token_address(tid) for tid in token_ids]
+        return {"ids": ",".join(addresses)}
+
     def save_swap_transaction(
         self,
         tx_bytes: bytes,
@@ -252,8 +342,8 @@ class JupiterSwapManager:
                 "quote_info": quote_info or {}
             }
 
-            with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+            # Compact JSON in one write; the base64 blob dominates the file
+            filepath.write_bytes(json_dumps(tx_data))
 
             print_success(f"Swap transaction saved to: {filepath}")
             return True
@@ -278,14 +368,14 @@ class JupiterSwapManager:
                 print_error(f"Transaction file not found: {filepath}")
                 return None
 
-            with open(filepath, 'r') as f:
-                tx_data = json.load(f)
+            with open(filepath, 'rb') as f:
+                tx_data = json_loads(f.read())
 
             if tx_data.get("type") != "jupiter_swap_unsigned":
                 print_error("Invalid Jupiter swap transaction file")
                 return None
 
-            tx_bytes = base64.b64decode(tx_data["transaction"])
+            tx_bytes = base64.b64decode(tx_data["transaction"], validate=True)
             quote_info = tx_data.get("quote_info", {})
 
             print_success(f"Loaded swap transaction from: {filepath}")
@@ -319,14 +409,23 @@ class JupiterSwapManager:
             Signed transaction bytes or None on error
         """
         try:
-            # Deserialize versioned transaction
-            tx = VersionedTransaction.from_bytes(tx_bytes)
+            # Deserialize versioned transaction (reused across retries)
+            tx = self._tx_cache.get(tx_bytes)
+            if tx is None:
+                tx = VersionedTransaction.from_bytes(tx_bytes)
+                self._tx_cache[tx_bytes] = tx
+                if len(self._tx_cache) > 4:
+                    self._tx_cache.popitem(last=False)
+            else:
+                self._tx_cache.move_to_end(tx_bytes)
 
             # Sign the transaction
             tx.sign([keypair])
 
             # Serialize back to bytes
             signed_bytes = bytes(tx)
+            # Don't keep the transaction around once it has been signed
+            self._tx_cache.pop(tx_bytes, None)
 
             print_success("Swap transaction signed successfully!")
             return signed_bytes
@@ -347,8 +446,8 @@ class JupiterSwapManager:
                 "transaction": base64.b64encode(tx_bytes).decode('utf-8')
             }
 
-            with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+            # Compact JSON in one write; the base64 blob dominates the file
+            filepath.write_bytes(json_dumps(tx_data))
 
             print_success(f"Signed swap saved to: {filepath}")
             return True
@@ -357,6 +456,32 @@ class JupiterSwapManager:
             print_error(f"Failed to save signed swap: {e}")
             return False
 
+    def sign_and_save(self, unsigned_b64: str, keypair: Keypair, path: str) -> bool:
+        """
+        Sign a base64 unsigned swap (as stored in a swap file) and save it
+
+        Decodes once and hands the signed bytes straight to
+        save_signed_swap(), with no intermediate file or re-parse.
+
+        Args:
+            unsigned_b64: Base64 unsigned transaction
+            keypair: Keypair to sign with
+            path: File path to save the signed swap to
+
+        Returns:
+            True if the signed swap was saved
+        """
+        try:
+            tx_bytes = base64.b64decode(unsigned_b64, validate=True)
+        except ValueError as e:
+            print_error(f"Invalid swap transaction encoding: {e}")
+            return False
+
+        signed_bytes = self.sign_swap_transaction(tx_bytes, keypair)
+        if signed_bytes is None:
+            return False
+        return self.save_signed_swap(signed_bytes, path)
+
     def get_swap_summary(
         self,
         input_symbol: str,
@@ -367,24 +492,62 @@ class JupiterSwapManager:
         route_steps: int
     ) -> str:
         """Generate human-readable swap summary"""
-        summary = f"""
-╔══════════════════════════════════════════════════════════╗
-║                    SWAP TRANSACTION                      ║
-╠══════════════════════════════════════════════════════════╣
-║  From:          {input_amount:.6f} {input_symbol:<30} ║
-║  To:            {output_amount:.6f} {output_symbol:<30} ║
-║  Price Impact:  {price_impact:.2f}%{' '*35}║
-║  Route:         {route_steps} step(s){' '*34}║
-╚══════════════════════════════════════════════════════════╝
-        """
-        return summary.strip()
-
-    def __del__(self):
-        """Cleanup HTTP client"""
-        try:
-            self.client.close()
-        except:
-            pass
+        return self._SUMMARY_TEMPLATE.format(
+            input_amount=input_amount,
+            input_symbol=input_symbol,
+            output_amount=output_amount,
+            output_symbol=output_symbol,
+            price_impact=price_impact,
+            route_steps=route_steps,
+        )
+
+    async def aclose(self):
+        """Close the async HTTP client, if one was opened"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+
+def _swap_request(
+    quote: Dict[str, Any],
+    user_pubkey: str,
+    wrap_unwrap_sol: bool,
+    priority_fee: Optional[int]
+) -> Dict[str, Any]:
+    return {
+        "quoteResponse": quote,
+        "userPublicKey": user_pubkey,
+        "wrapAndUnwrapSol": wrap_unwrap_sol,
+        "dynamicComputeUnitLimit": True,
+        "prioritizationFeeLamports": priority_fee or "auto"
+    }
+
+
+def _swap_tx_bytes(swap_data: Dict[str, Any]) -> Optional[bytes]:
+    """Decode the unsigned transaction from a /swap response"""
+    if "error" in swap_data:
+        print_error(f"Swap API error: {swap_data['error']}")
+        return None
+
+    # Get the serialized transaction
+    swap_tx_base64 = swap_data.get("swapTransaction")
+    if not swap_tx_base64:
+        print_error("No transaction returned from Jupiter")
+        return None
+
+    tx_bytes = base64.b64decode(swap_tx_base64, validate=True)
+
+    print_success("Unsigned swap transaction created!")
+    print_info(f"  Transaction size: {len(tx_bytes)} bytes")
+
+    return tx_bytes
+
+
+def _price_data(prices: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if "data" not in prices:
+        print_error("No price data returned")
+        return None
+    return prices["data"]
 
 
 def sol_to_lamports(sol: float) -> int:
@@ -405,3 +568,33 @@ def tokens_to_smallest_unit(amount: float, decimals: int) -> int:
 def smallest_unit_to_tokens(amount: int, decimals: int) -> float:
     """Convert smallest unit to token amount"""
     return amount / (10 ** decimals)
+
+
+# 10 ** decimals for every mint precision in use (SPL 0-9, EVM up to 18)
+_UNIT_SCALE = [10 ** d for d in range(19)]
+
+
+def _unit_scales(decimals: Union[int, Iterable[int]], count: int) -> List[int]:
+    if isinstance(decimals, int):
+        return [_UNIT_SCALE[decimals] if decimals < 19 else 10 ** decimals] * count
+    return [_UNIT_SCALE[d] if d < 19 else 10 ** d for d in decimals]
+
+
+def tokens_to_smallest_unit_batch(
+    amounts: Iterable[float],
+    decimals: Union[int, Iterable[int]]
+) -> List[int]:
+    """Convert many token amounts to smallest units (per-row or shared decimals)"""
+    amounts = list(amounts)
+    scales = _unit_scales(decimals, len(amounts))
+    return [int(amount * scale) for amount, scale in zip(amounts, scales)]
+
+
+def smallest_unit_to_tokens_batch(
+    amounts: Iterable[int],
+    decimals: Union[int, Iterable[int]]
+) -> List[float]:
+    """Convert many smallest-unit amounts to token amounts"""
+    amounts = list(amounts)
+    scales = _unit_scales(decimals, len(amounts))
+    return [amount / scale for amount, scale in zip(amounts, scales)]
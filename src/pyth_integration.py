@@ -5,11 +5,46 @@ Real-time price data for vault dashboard and portfolio valuation
 B - Love U 3000
 """
 
+import json
+import math
+import time
+import atexit
+import asyncio
+import functools
+import threading
 import httpx
-from typing import Optional, Dict, List, Any
+from concurrent.futures import as_completed
+from typing import Optional, Dict, List, Any, Tuple
 from decimal import Decimal
 
 from src.ui import print_success, print_error, print_info, print_warning
+from src._pool import get_io_pool
+from src._compat import HAS_HTTP2, json_loads
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+# msgspec decodes batched feed lists straight into typed fields in C,
+# coercing Hermes' stringified integers and skipping fields we don't use
+try:
+    import msgspec
+
+    class _FeedPrice(msgspec.Struct):
+        price: int = 0
+        expo: int = 0
+        conf: int = 0
+        publish_time: int = 0
+
+    class _Feed(msgspec.Struct):
+        id: str = ""
+        price: _FeedPrice = msgspec.field(default_factory=_FeedPrice)
+
+    _FEED_DECODER = msgspec.json.Decoder(List[_Feed], strict=False)
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
 
 # Pyth Hermes API endpoint
@@ -31,14 +66,200 @@ PYTH_PRICE_FEEDS = {
 # Supported tokens for price lookup
 SUPPORTED_TOKENS = list(PYTH_PRICE_FEEDS.keys())
 
+# Feed ID -> symbol for parsing batched responses; Hermes may echo IDs
+# without the 0x prefix, so both spellings are mapped
+_FEED_ID_TO_SYMBOL = {fid: sym for sym, fid in PYTH_PRICE_FEEDS.items()}
+_FEED_ID_TO_SYMBOL.update({fid[2:]: sym for sym, fid in PYTH_PRICE_FEEDS.items()})
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_symbol(symbol: str) -> str:
+    """Map a token symbol to its feed key, e.g. "sol" -> "SOL/USD"."""
+    symbol_upper = symbol.upper()
+    if symbol_upper in PYTH_PRICE_FEEDS or symbol_upper.endswith("/USD"):
+        return symbol_upper
+    return symbol_upper + "/USD"
+
+
+# Bound once: the price cache checks the clock on every lookup
+_monotonic = time.monotonic
+
+# Hermes exponents are small negative ints (-8, -6, ...); index a table
+# instead of paying int ** int plus a float conversion per feed
+_EXPO_SCALE = {e: 10.0 ** e for e in range(-20, 1)}
+
+
+def _parse_price_feed(symbol: str, price_feed: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a price result from one Hermes price feed entry."""
+    price_data = price_feed.get("price", {})
+
+    price_raw = int(price_data.get("price", 0))
+    expo = int(price_data.get("expo", 0))
+    conf = int(price_data.get("conf", 0))
+
+    # Calculate actual price
+    scale = _EXPO_SCALE.get(expo) or 10.0 ** expo
+    price = price_raw * scale
+    confidence = conf * scale
+
+    return {
+        "symbol": symbol,
+        "price": price,
+        "confidence": confidence,
+        "price_raw": price_raw,
+        "expo": expo,
+        "publish_time": price_data.get("publish_time", 0),
+        "raw": price_feed
+    }
+
+
+def _feed_request(symbols: List[str]) -> List[Tuple[str, str]]:
+    """Query params for a batched feed request (duplicates dropped)."""
+    feed_ids = {}
+    for symbol in symbols:
+        feed_id = PYTH_PRICE_FEEDS.get(_normalize_symbol(symbol))
+        if feed_id is not None:
+            feed_ids[feed_id] = None
+    return [("ids[]", fid) for fid in feed_ids]
+
+
+def _parse_price_feeds(data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for price_feed in data:
+        symbol = _FEED_ID_TO_SYMBOL.get(price_feed.get("id"))
+        if symbol is None:
+            continue
+        results[symbol] = _parse_price_feed(symbol, price_feed)
+    return results
+
+
+def _decode_price_feeds(content: bytes) -> Dict[str, Dict[str, Any]]:
+    """Parse a batched Hermes response body into price results."""
+    if not HAS_MSGSPEC:
+        return _parse_price_feeds(json_loads(content))
+
+    results = {}
+    for feed in _FEED_DECODER.decode(content):
+        symbol = _FEED_ID_TO_SYMBOL.get(feed.id)
+        if symbol is None:
+            continue
+        price_data = feed.price
+        expo = price_data.expo
+        scale = _EXPO_SCALE.get(expo) or 10.0 ** expo
+        results[symbol] = {
+            "symbol": symbol,
+            "price": price_data.price * scale,
+            "confidence": price_data.conf * scale,
+            "price_raw": price_data.price,
+            "expo": expo,
+            "publish_time": price_data.publish_time,
+            "raw": msgspec.to_builtins(feed)
+        }
+    return results
+
+
+def _portfolio_value(
+    holdings: Dict[str, float],
+    prices: Dict[str, Optional[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """Value holdings against already-fetched prices."""
+    breakdown = {}
+
+    for symbol, amount in holdings.items():
+        price_data = prices.get(_normalize_symbol(symbol))
+        if price_data:
+            price = price_data["price"]
+            token_value = amount * price
+            breakdown[symbol] = {
+                "amount": amount,
+                "price": price,
+                "value_usd": token_value,
+                "percentage": 0  # Will calculate after total
+            }
+        else:
+            print_warning(f"No price data for {symbol}")
+
+    # Correctly rounded sum, so large portfolios don't drift by cents
+    total_usd = math.fsum(entry["value_usd"] for entry in breakdown.values())
+
+    # Calculate percentages: one multiply per entry, no re-lookup by symbol
+    if total_usd > 0:
+        pct_scale = 100.0 / total_usd
+        for entry in breakdown.values():
+            entry["percentage"] = entry["value_usd"] * pct_scale
+
+    return {
+        "total_usd": total_usd,
+        "breakdown": breakdown,
+        "timestamp": int(time.time())
+    }
+
+
+# One sync client per process: every instance multiplexes its calls to
+# hermes.pyth.network over the same kept-alive (HTTP/2 when available) TLS session
+_SHARED_CLIENT: Optional[httpx.Client] = None
+
+
+def _shared_client() -> httpx.Client:
+    """Return the process-wide sync client, creating it on first use."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        _SHARED_CLIENT = httpx.Client(
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            # With an explicit transport, http2/limits must be set on it
+            transport=httpx.HTTPTransport(
+                http2=HAS_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+                retries=1,
+            ),
+        )
+    return _SHARED_CLIENT
+
+
+@atexit.register
+def _close_shared_client():
+    if _SHARED_CLIENT is not None:
+        _SHARED_CLIENT.close()
+
 
 class PythPriceClient:
     """Client for fetching real-time price data from Pyth Network"""
 
     def __init__(self):
-        self.client = httpx.Client(timeout=10.0)
-        self.cache = {}  # Simple price cache
+        self.client = _shared_client()
+        # Created on first async call, shared by every a* method
+        self._async_client: Optional[httpx.AsyncClient] = None
         self.cache_ttl = 5  # Cache for 5 seconds
+        if TTLCache is not None:
+            self.cache = TTLCache(maxsize=256, ttl=self.cache_ttl, timer=_monotonic)
+        else:
+            self.cache = {}  # symbol -> (expires, price)
+        # get_prices_concurrent() reads and fills the cache from pool threads
+        self._cache_lock = threading.Lock()
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=10.0,
+                http2=HAS_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=16),
+            )
+        return self._async_client
+
+    def _cached_price(self, symbol_upper: str) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            cached = self.cache.get(symbol_upper)
+        if TTLCache is not None:
+            return cached
+        if cached and _monotonic() < cached[0]:
+            return cached[1]
+        return None
+
+    def _cache_price(self, symbol_upper: str, result: Dict[str, Any]) -> None:
+        if TTLCache is None:
+            result = (_monotonic() + self.cache_ttl, result)
+        with self._cache_lock:
+            self.cache[symbol_upper] = result
 
     def get_price(
         self,
@@ -56,10 +277,7 @@ class PythPriceClient:
             Price data dictionary or None on error
         """
         try:
-            # Normalize symbol
-            symbol_upper = symbol.upper()
-            if not symbol_upper.endswith("/USD"):
-                symbol_upper = f"{symbol_upper}/USD"
+            symbol_upper = _normalize_symbol(symbol)
 
             # Check if symbol is supported
             if symbol_upper not in PYTH_PRICE_FEEDS:
@@ -67,56 +285,67 @@ class PythPriceClient:
                 return None
 
             # Check cache
-            if use_cache and symbol_upper in self.cache:
-                cached_data = self.cache[symbol_upper]
-                import time
-                if time.time() - cached_data["timestamp"] < self.cache_ttl:
-                    return cached_data["data"]
-
-            # Get price feed ID
-            feed_id = PYTH_PRICE_FEEDS[symbol_upper]
+            if use_cache:
+                cached = self._cached_price(symbol_upper)
+                if cached:
+                    return cached
 
             # Fetch latest price
             response = self.client.get(
                 f"{PYTH_HERMES_API}/api/latest_price_feeds",
-                params={"ids[]": feed_id}
+                params={"ids[]": PYTH_PRICE_FEEDS[symbol_upper]}
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
 
             if not data or len(data) == 0:
                 print_error(f"No price data returned for {symbol}")
                 return None
 
-            price_feed = data[0]
-            price_data = price_feed.get("price", {})
+            result = _parse_price_feed(symbol_upper, data[0])
+            self._cache_price(symbol_upper, result)
+            return result
+
+        except httpx.HTTPError as e:
+            print_error(f"HTTP error fetching price for {symbol}: {e}")
+            return None
+        except Exception as e:
+            print_error(f"Failed to get price for {symbol}: {e}")
+            return None
 
-            # Parse price data
-            price_raw = int(price_data.get("price", 0))
-            expo = int(price_data.get("expo", 0))
-            conf = int(price_data.get("conf", 0))
+    async def aget_price(
+        self,
+        symbol: str,
+        use_cache: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Async get_price(), sharing the price cache."""
+        try:
+            symbol_upper = _normalize_symbol(symbol)
 
-            # Calculate actual price
-            price = price_raw * (10 ** expo)
-            confidence = conf * (10 ** expo)
+            if symbol_upper not in PYTH_PRICE_FEEDS:
+                print_warning(f"Price feed not available for {symbol}")
+                return None
 
-            result = {
-                "symbol": symbol_upper,
-                "price": price,
-                "confidence": confidence,
-                "expo": expo,
-                "publish_time": price_data.get("publish_time", 0),
-                "raw": price_feed
-            }
+            if use_cache:
+                cached = self._cached_price(symbol_upper)
+                if cached:
+                    return cached
 
-            # Update cache
-            import time
-            self.cache[symbol_upper] = {
-                "data": result,
-                "timestamp": time.time()
-            }
+            response = await self._get_async_client().get(
+                f"{PYTH_HERMES_API}/api/latest_price_feeds",
+                params={"ids[]": PYTH_PRICE_FEEDS[symbol_upper]}
+            )
+            response.raise_for_status()
+
+            data = json_loads(response.content)
+
+            if not data or len(data) == 0:
+                print_error(f"No price data returned for {symbol}")
+                return None
 
+            result = _parse_price_feed(symbol_upper, data[0])
+            self._cache_price(symbol_upper, result)
             return result
 
         except httpx.HTTPError as e:
@@ -140,26 +369,10 @@ class PythPriceClient:
             Dictionary mapping symbols to price data
         """
         try:
-            # Normalize symbols and get feed IDs
-            feed_ids = []
-            symbol_map = {}
-
-            for symbol in symbols:
-                symbol_upper = symbol.upper()
-                if not symbol_upper.endswith("/USD"):
-                    symbol_upper = f"{symbol_upper}/USD"
-
-                if symbol_upper in PYTH_PRICE_FEEDS:
-                    feed_id = PYTH_PRICE_FEEDS[symbol_upper]
-                    feed_ids.append(feed_id)
-                    symbol_map[feed_id] = symbol_upper
-
-            if not feed_ids:
+            params = _feed_request(symbols)
+            if not params:
                 return {}
 
-            # Build request with multiple IDs
-            params = [("ids[]", fid) for fid in feed_ids]
-
             # Fetch all prices at once
             response = self.client.get(
                 f"{PYTH_HERMES_API}/api/latest_price_feeds",
@@ -167,35 +380,56 @@ class PythPriceClient:
             )
             response.raise_for_status()
 
-            data = response.json()
+            return _decode_price_feeds(response.content)
 
-            # Parse results
-            results = {}
-            for price_feed in data:
-                feed_id = price_feed.get("id")
-                if feed_id not in symbol_map:
-                    continue
+        except Exception as e:
+            print_error(f"Failed to get multiple prices: {e}")
+            return {}
 
-                symbol = symbol_map[feed_id]
-                price_data = price_feed.get("price", {})
+    def get_prices_concurrent(
+        self,
+        symbols: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get prices with one get_price() per symbol on the shared I/O pool
 
-                price_raw = int(price_data.get("price", 0))
-                expo = int(price_data.get("expo", 0))
-                conf = int(price_data.get("conf", 0))
+        For when the batched endpoint is rate-limited or returns partial
+        data; the calling (UI) thread only waits for the results.
 
-                price = price_raw * (10 ** expo)
-                confidence = conf * (10 ** expo)
+        Args:
+            symbols: List of token symbols
 
-                results[symbol] = {
-                    "symbol": symbol,
-                    "price": price,
-                    "confidence": confidence,
-                    "expo": expo,
-                    "publish_time": price_data.get("publish_time", 0),
-                    "raw": price_feed
-                }
+        Returns:
+            Dictionary mapping symbols to price data
+        """
+        futures = {
+            get_io_pool().submit(self.get_price, symbol): _normalize_symbol(symbol)
+            for symbol in dict.fromkeys(symbols)
+        }
+        results = {}
+        for future in as_completed(futures):
+            price = future.result()  # get_price() reports its own errors
+            if price:
+                results[futures[future]] = price
+        return results
+
+    async def aget_multiple_prices(
+        self,
+        symbols: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Async get_multiple_prices(): one batched request for all feeds."""
+        try:
+            params = _feed_request(symbols)
+            if not params:
+                return {}
+
+            response = await self._get_async_client().get(
+                f"{PYTH_HERMES_API}/api/latest_price_feeds",
+                params=params
+            )
+            response.raise_for_status()
 
-            return results
+            return _decode_price_feeds(response.content)
 
         except Exception as e:
             print_error(f"Failed to get multiple prices: {e}")
@@ -216,45 +450,34 @@ class PythPriceClient:
             Portfolio valuation data or None on error
         """
         try:
-            # Get all prices
+            prices = self.get_multiple_prices(list(holdings.keys()))
+            return _portfolio_value(holdings, prices)
+
+        except Exception as e:
+            print_error(f"Failed to calculate portfolio value: {e}")
+            return None
+
+    async def aget_portfolio_value(
+        self,
+        holdings: Dict[str, float]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Async get_portfolio_value()
+
+        Uses the batched feed request; if that comes back empty, the
+        per-symbol requests are issued concurrently instead.
+        """
+        try:
             symbols = list(holdings.keys())
-            prices = self.get_multiple_prices(symbols)
-
-            # Calculate total value
-            total_usd = 0.0
-            breakdown = {}
-
-            for symbol, amount in holdings.items():
-                symbol_key = symbol.upper()
-                if not symbol_key.endswith("/USD"):
-                    symbol_key = f"{symbol_key}/USD"
-
-                if symbol_key in prices:
-                    price_data = prices[symbol_key]
-                    token_value = amount * price_data["price"]
-                    total_usd += token_value
-
-                    breakdown[symbol] = {
-                        "amount": amount,
-                        "price": price_data["price"],
-                        "value_usd": token_value,
-                        "percentage": 0  # Will calculate after total
-                    }
-                else:
-                    print_warning(f"No price data for {symbol}")
-
-            # Calculate percentages
-            for symbol in breakdown:
-                if total_usd > 0:
-                    breakdown[symbol]["percentage"] = (
-                        breakdown[symbol]["value_usd"] / total_usd * 100
-                    )
-
-            return {
-                "total_usd": total_usd,
-                "breakdown": breakdown,
-                "timestamp": int(__import__("time").time())
-            }
+            prices = await self.aget_multiple_prices(symbols)
+
+            if not prices and symbols:
+                fetched = await asyncio.gather(*(self.aget_price(s) for s in symbols))
+                prices = {
+                    _normalize_symbol(s): p for s, p in zip(symbols, fetched) if p
+                }
+
+            return _portfolio_value(holdings, prices)
 
         except Exception as e:
             print_error(f"Failed to calculate portfolio value: {e}")
@@ -285,12 +508,11 @@ class PythPriceClient:
 
         return result
 
-    def __del__(self):
-        """Cleanup HTTP client"""
-        try:
-            self.client.close()
-        except:
-            pass
+    async def aclose(self):
+        """Close the async HTTP client, if one was opened"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
 
 
 def format_usd(amount: float) -> str:
@@ -8,8 +8,8 @@ Enables easy transfer of:
 B - Love U 3000
 """
 
+import sys
 import json
-import base64
 from pathlib import Path
 from typing import Optional
 
@@ -19,7 +19,20 @@ try:
 except ImportError:
     HAS_QRCODE = False
 
+# base45 (RFC 9285) stays within the QR alphanumeric charset, so oversized
+# payloads pack 11 bits per 2 chars instead of 8 bits per base64 char
+try:
+    import base45
+    HAS_BASE45 = True
+except ImportError:
+    HAS_BASE45 = False
+
 from src.ui import print_success, print_error, print_info, print_warning
+from src._compat import base64, b64encode_str, json_dumps, json_loads
+
+# Codes are machine-scanned, so a fixed mask is fine; leaving it unset makes
+# qrcode render and score all 8 masks, which dominates large codes
+_QR_MASK_PATTERN = 0
 
 
 class QRTransfer:
@@ -28,7 +41,12 @@ class QRTransfer:
     def __init__(self):
         self.qr_available = HAS_QRCODE
 
-    def generate_ascii_qr(self, data: str, box_size: int = 1) -> Optional[str]:
+    def generate_ascii_qr(
+        self,
+        data: str,
+        box_size: int = 1,
+        alphanumeric: bool = False
+    ) -> Optional[str]:
         """Generate ASCII art QR code for terminal display"""
         if not self.qr_available:
             print_warning("qrcode library not installed. Install with: pip install qrcode")
@@ -39,23 +57,19 @@ class QRTransfer:
                 version=None,  # Auto-size
                 error_correction=qrcode.constants.ERROR_CORRECT_L,
                 box_size=box_size,
-                border=2
+                border=2,
+                mask_pattern=_QR_MASK_PATTERN
             )
+            if alphanumeric:
+                # Caller guarantees the alphanumeric charset (e.g. base45)
+                data = qrcode.util.QRData(data, mode=qrcode.util.MODE_ALPHA_NUM)
             qr.add_data(data)
             qr.make(fit=True)
 
-            # Generate ASCII representation
-            lines = []
-            for row in qr.modules:
-                line = ""
-                for cell in row:
-                    if cell:
-                        line += "██"
-                    else:
-                        line += "  "
-                lines.append(line)
-
-            return "\n".join(lines)
+            # Generate ASCII representation: pack each row of bools as 0/1
+            # bytes, then widen every cell with two C-level replaces
+            grid = b"\n".join(map(bytes, qr.modules)).decode("latin-1")
+            return grid.replace("\x00", "  ").replace("\x01", "██")
         except Exception as e:
             print_error(f"Failed to generate QR code: {e}")
             return None
@@ -67,21 +81,33 @@ class QRTransfer:
         print("=" * 60)
 
         # Compress the data
-        json_data = json.dumps(tx_data, separators=(',', ':'))
+        raw_json = json_dumps(tx_data)
+        json_data = raw_json.decode()
 
         # Check size - QR codes have limits
+        alphanumeric = False
         if len(json_data) > 2000:
-            print_warning("Transaction too large for QR. Using base64 encoding...")
-            json_data = base64.b64encode(json_data.encode()).decode()
+            # base45 only when it goes into a QR; it contains spaces, which
+            # don't survive being copied by hand
+            if HAS_BASE45 and self.qr_available:
+                print_warning("Transaction too large for QR. Using base45 encoding...")
+                json_data = base45.b45encode(raw_json).decode('ascii')
+                alphanumeric = True
+            else:
+                print_warning("Transaction too large for QR. Using base64 encoding...")
+                json_data = b64encode_str(raw_json)
 
-        ascii_qr = self.generate_ascii_qr(json_data)
+        ascii_qr = self.generate_ascii_qr(json_data, alphanumeric=alphanumeric)
 
         if ascii_qr:
             print(ascii_qr)
             print("\n" + "=" * 60)
             print_info(f"Data size: {len(json_data)} bytes")
         else:
-            # Fallback: show base64 data
+            # Fallback: show the data for copying by hand. base45's spaces
+            # don't survive that, so re-encode a base45 payload as base64.
+            if alphanumeric:
+                json_data = b64encode_str(raw_json)
             print_info("QR generation unavailable. Copy this data manually:")
             print("-" * 60)
             print(json_data)
@@ -92,7 +118,7 @@ class QRTransfer:
         tx_data = {
             "type": "signed_transaction",
             "version": "1.0",
-            "data": base64.b64encode(signed_tx_bytes).decode('utf-8')
+            "data": b64encode_str(signed_tx_bytes)
         }
 
         self.display_transaction_qr(tx_data, "SIGNED TRANSACTION - SCAN TO BROADCAST")
@@ -101,7 +127,7 @@ class QRTransfer:
         """Parse unsigned transaction from QR scan or pasted data"""
         try:
             # Try direct JSON parse
-            data = json.loads(input_data)
+            data = json_loads(input_data)
 
             if data.get("type") == "unsigned_transaction":
                 return data
@@ -110,10 +136,19 @@ class QRTransfer:
                 return None
 
         except json.JSONDecodeError:
+            # Try base45 decode (oversized payloads from a QR scan)
+            if HAS_BASE45:
+                try:
+                    data = json_loads(base45.b45decode(input_data.strip()))
+                    if data.get("type") == "unsigned_transaction":
+                        return data
+                except Exception:
+                    pass
+
             # Try base64 decode
             try:
                 decoded = base64.b64decode(input_data).decode('utf-8')
-                data = json.loads(decoded)
+                data = json_loads(decoded)
                 if data.get("type") == "unsigned_transaction":
                     return data
             except Exception:
@@ -133,7 +168,8 @@ class QRTransfer:
                 version=None,
                 error_correction=qrcode.constants.ERROR_CORRECT_L,
                 box_size=10,
-                border=4
+                border=4,
+                mask_pattern=_QR_MASK_PATTERN
             )
             qr.add_data(data)
             qr.make(fit=True)
@@ -148,8 +184,13 @@ class QRTransfer:
             return False
 
 
-def create_qr_signing_workflow():
-    """Interactive QR-based signing workflow for air-gapped device"""
+def create_qr_signing_workflow(input_path: Optional[str] = None):
+    """
+    Interactive QR-based signing workflow for air-gapped device
+
+    Args:
+        input_path: File holding the unsigned transaction (skips the paste prompt)
+    """
     from src.wallet import WalletManager
     from src.transaction import TransactionManager
 
@@ -188,22 +229,26 @@ def create_qr_signing_workflow():
     print_info(f"Wallet loaded: {public_key[:8]}...{public_key[-8:]}")
 
     # Get transaction data from user
-    print("\n" + "-" * 60)
-    print("Paste the unsigned transaction JSON (from companion app):")
-    print("(paste all at once, then press Enter twice)")
-    print("-" * 60)
-
-    lines = []
-    while True:
+    if input_path:
         try:
-            line = input()
-            if line == "" and lines:
+            input_data = Path(input_path).read_text()
+        except OSError as e:
+            print_error(f"Could not read {input_path}: {e}")
+            return
+    else:
+        print("\n" + "-" * 60)
+        print("Paste the unsigned transaction JSON (from companion app):")
+        print("(paste all at once, then press Enter twice)")
+        print("-" * 60)
+
+        # Buffered line reads until the first blank line after the paste
+        lines = []
+        for line in sys.stdin:
+            if not line.strip() and lines:
                 break
             lines.append(line)
-        except EOFError:
-            break
 
-    input_data = "\n".join(lines)
+        input_data = "".join(lines)
 
     # Parse transaction
     tx_data = qr.parse_unsigned_tx_input(input_data)
@@ -288,4 +333,6 @@ def create_qr_signing_workflow():
 
 
 if __name__ == "__main__":
-    create_qr_signing_workflow()
+    args = sys.argv[1:]
+    path = args[args.index("--input") + 1] if "--input" in args[:-1] else None
+    create_qr_signing_workflow(path)
@@ -8,6 +8,7 @@ Implements Argon2id key derivation and XSalsa20-Poly1305 encryption.
 import json
 import os
 import gc
+import ctypes
 from typing import Optional, Tuple, List, Dict
 
 import nacl.secret
@@ -15,6 +16,16 @@ import nacl.utils
 import nacl.pwhash
 from solders.keypair import Keypair
 
+
+def zeroize(buf: bytearray) -> None:
+    """
+    Overwrite a mutable key buffer in place.
+    Unlike `del` + `gc.collect()`, this actually clears the bytes.
+    """
+    if buf:
+        ctypes.memset((ctypes.c_char * len(buf)).from_buffer(buf), 0, len(buf))
+
+
 class SecureWalletHandler:
     """
     Handles encrypted wallet operations.
@@ -9,8 +9,6 @@ Supports:
 B - Love U 3000
 """
 
-import json
-import base64
 from pathlib import Path
 from typing import Optional, Tuple, List
 from dataclasses import dataclass
@@ -26,12 +24,19 @@ from solders.system_program import create_account, CreateAccountParams
 from config import LAMPORTS_PER_SOL
 from src.ui import print_success, print_error, print_info, print_warning
 
+from src._compat import PRETTY_JSON, base64, b64encode_str, json_dumps, json_loads
+
 
 # SPL Token Program IDs
 TOKEN_PROGRAM_ID = Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
 ASSOCIATED_TOKEN_PROGRAM_ID = Pubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")
 SYSTEM_PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
 
+# Serialized/derived forms of the constant IDs, built once at import
+_TOKEN_PROGRAM_BYTES = bytes(TOKEN_PROGRAM_ID)
+_SYSTEM_PROGRAM_META = AccountMeta(pubkey=SYSTEM_PROGRAM_ID, is_signer=False, is_writable=False)
+_TOKEN_PROGRAM_META = AccountMeta(pubkey=TOKEN_PROGRAM_ID, is_signer=False, is_writable=False)
+
 
 @dataclass
 class TokenInfo:
@@ -77,31 +82,21 @@ KNOWN_TOKENS = {
     ),
 }
 
+# Mint address -> symbol, for get_token_symbol()
+_MINT_TO_SYMBOL = {info.mint: symbol for symbol, info in KNOWN_TOKENS.items()}
+
 
 def get_associated_token_address(wallet: Pubkey, mint: Pubkey) -> Pubkey:
     """Derive the associated token account address for a wallet and mint"""
     seeds = [
         bytes(wallet),
-        bytes(TOKEN_PROGRAM_ID),
+        _TOKEN_PROGRAM_BYTES,
         bytes(mint)
     ]
 
-    # Find program derived address
-    # This is a simplified version - in production use the proper PDA derivation
-    import hashlib
-
-    combined = b''.join(seeds) + bytes(ASSOCIATED_TOKEN_PROGRAM_ID) + b"ProgramDerivedAddress"
-
-    for bump in range(255, -1, -1):
-        try:
-            seed_with_bump = combined + bytes([bump])
-            hash_result = hashlib.sha256(seed_with_bump).digest()
-            # Check if it's a valid point on the curve (simplified)
-            return Pubkey.from_bytes(hash_result)
-        except Exception:
-            continue
-
-    raise ValueError("Could not find valid PDA")
+    # Bump search and off-curve check run natively in solders
+    ata, _bump = Pubkey.find_program_address(seeds, ASSOCIATED_TOKEN_PROGRAM_ID)
+    return ata
 
 
 class TokenTransferManager:
@@ -148,8 +143,8 @@ class TokenTransferManager:
             AccountMeta(pubkey=ata, is_signer=False, is_writable=True),
             AccountMeta(pubkey=wallet, is_signer=False, is_writable=False),
             AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=SYSTEM_PROGRAM_ID, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=TOKEN_PROGRAM_ID, is_signer=False, is_writable=False),
+            _SYSTEM_PROGRAM_META,
+            _TOKEN_PROGRAM_META,
         ]
 
         return Instruction(
@@ -236,11 +231,11 @@ class TokenTransferManager:
                 "type": "unsigned_token_transaction",
                 "version": "1.0",
                 "token": token_info,
-                "data": base64.b64encode(tx_bytes).decode('utf-8')
+                "data": b64encode_str(tx_bytes)
             }
 
-            with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(json_dumps(tx_data, pretty=PRETTY_JSON))
 
             print_success(f"Unsigned token transaction saved to: {filepath}")
             return True
@@ -270,7 +265,7 @@ async def get_token_accounts(rpc_url: str, wallet: str) -> List[dict]:
                 timeout=30.0
             )
 
-            data = response.json()
+            data = json_loads(response.content)
 
             if "error" in data:
                 print_error(f"RPC error: {data['error']}")
@@ -300,10 +295,10 @@ async def get_token_accounts(rpc_url: str, wallet: str) -> List[dict]:
 
 def get_token_symbol(mint: str) -> str:
     """Get token symbol from mint address"""
-    for symbol, info in KNOWN_TOKENS.items():
-        if info.mint == mint:
-            return symbol
-    return mint[:8] + "..."
+    symbol = _MINT_TO_SYMBOL.get(mint)
+    if symbol is None:
+        return mint[:8] + "..."
+    return symbol
 
 
 if __name__ == "__main__":
@@ -4,8 +4,6 @@ Transaction Management - Create, sign, and serialize Solana transactions
 B - Love U 3000
 """
 
-import json
-import base64
 import sys
 from pathlib import Path
 from typing import Optional, Tuple
@@ -20,6 +18,8 @@ from solders.message import Message
 from config import LAMPORTS_PER_SOL, INFRASTRUCTURE_FEE_PERCENTAGE, INFRASTRUCTURE_FEE_WALLET
 from src.ui import print_success, print_error, print_info, print_warning, console
 
+from src._compat import PRETTY_JSON, base64, b64encode_str, json_dumps, json_loads
+
 # Import Rust signer (REQUIRED)
 try:
     sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -239,11 +239,11 @@ class TransactionManager:
             tx_data = {
                 "type": "unsigned_transaction",
                 "version": "1.0",
-                "data": base64.b64encode(tx_bytes).decode('utf-8')
+                "data": b64encode_str(tx_bytes)
             }
             
-            with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(json_dumps(tx_data, pretty=PRETTY_JSON))
             
             print_success(f"Unsigned transaction saved to: {filepath}")
             return True
@@ -258,8 +258,8 @@ class TransactionManager:
                 print_error(f"Transaction file not found: {filepath}")
                 return None
             
-            with open(filepath, 'r') as f:
-                tx_data = json.load(f)
+            with open(filepath, 'rb') as f:
+                tx_data = json_loads(f.read())
             
             if tx_data.get("type") != "unsigned_transaction":
                 print_error("Invalid transaction file format")
@@ -282,11 +282,11 @@ class TransactionManager:
             tx_data = {
                 "type": "signed_transaction",
                 "version": "1.0",
-                "data": base64.b64encode(tx_bytes).decode('utf-8')
+                "data": b64encode_str(tx_bytes)
             }
             
-            with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(json_dumps(tx_data, pretty=PRETTY_JSON))
             
             print_success(f"Signed transaction saved to: {filepath}")
             return True
@@ -301,8 +301,8 @@ class TransactionManager:
                 print_error(f"Transaction file not found: {filepath}")
                 return None
             
-            with open(filepath, 'r') as f:
-                tx_data = json.load(f)
+            with open(filepath, 'rb') as f:
+                tx_data = json_loads(f.read())
             
             if tx_data.get("type") != "signed_transaction":
                 print_error("Invalid signed transaction file format")
@@ -322,7 +322,7 @@ class TransactionManager:
             print_error("No signed transaction available")
             return None
         
-        return base64.b64encode(self.signed_tx).decode('utf-8')
+        return b64encode_str(self.signed_tx)
     
     def decode_transaction_info(self, tx_bytes: bytes) -> Optional[dict]:
         try:
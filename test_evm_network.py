@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test BaseNetwork connection checks against a mocked JSON-RPC endpoint
+
+Usage:
+    python3 -m pytest test_evm_network.py
+"""
+
+
+import json
+
+import httpx
+
+from config import BASE_CHAIN_ID
+from src.evm_network import BaseNetwork
+
+
+class _MockRPC:
+    """httpx handler answering eth_chainId/eth_blockNumber, or failing when down."""
+    
+    def __init__(self, chain_id: int = BASE_CHAIN_ID):
+        self.chain_id = chain_id
+        self.down = False
+        self.methods = []
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self.down:
+            raise httpx.ConnectError("connection refused", request=request)
+        body = json.loads(request.content)
+        self.methods.append(body["method"])
+        result = hex(self.chain_id) if body["method"] == "eth_chainId" else "0x10"
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": result})
+
+
+def _network(rpc: _MockRPC) -> BaseNetwork:
+    network = BaseNetwork(rpc_url="http://rpc.test")
+    network.client.close()
+    network.client = httpx.Client(transport=httpx.MockTransport(rpc))
+    return network
+
+
+def test_chain_id_fetched_once():
+    rpc = _MockRPC()
+    with _network(rpc) as network:
+        assert network.is_connected()
+        assert network.is_connected()
+    assert rpc.methods == ["eth_chainId", "eth_blockNumber"]
+
+
+def test_endpoint_down_after_first_call():
+    rpc = _MockRPC()
+    with _network(rpc) as network:
+        assert network.is_connected()
+        rpc.down = True
+        assert not network.is_connected()
+        rpc.down = False
+        assert network.is_connected()
+
+
+def test_wrong_chain_is_not_cached():
+    rpc = _MockRPC(chain_id=1)
+    with _network(rpc) as network:
+        assert not network.is_connected()
+        rpc.chain_id = BASE_CHAIN_ID
+        assert network.is_connected()
+    assert rpc.methods == ["eth_chainId", "eth_chainId"]
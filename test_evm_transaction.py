@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test EIP-1559 signing against eth-account's reference implementation
+
+Usage:
+    python3 -m pytest test_evm_transaction.py
+"""
+
+import pytest
+from eth_account import Account
+
+from src import evm_transaction
+from src.evm_transaction import EVMTransactionManager
+
+PRIVATE_KEY = bytes.fromhex("4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318")
+SENDER = Account.from_key(PRIVATE_KEY).address
+RECIPIENT = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+USDC = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def _reference(tx: dict) -> bytes:
+    public = {k: v for k, v in tx.items() if not k.startswith("_")}
+    return bytes(Account.sign_transaction(public, PRIVATE_KEY).raw_transaction)
+
+
+def _eth_transfer(manager: EVMTransactionManager) -> dict:
+    return manager.create_eth_transfer(SENDER, RECIPIENT, 0.0125, 7, 2_000_000_000, 1_000_000)
+
+
+def _erc20_transfer(manager: EVMTransactionManager) -> dict:
+    return manager.create_erc20_transfer(SENDER, USDC, RECIPIENT, 25_000_000, 8, 2_000_000_000, 1_000_000)
+
+
+@pytest.fixture(params=[True, False], ids=["coincurve", "eth-account"])
+def manager(request, monkeypatch):
+    if request.param and not evm_transaction.HAS_COINCURVE:
+        pytest.skip("coincurve not installed")
+    monkeypatch.setattr(evm_transaction, "HAS_COINCURVE", request.param)
+    return EVMTransactionManager(verbose=False)
+
+
+@pytest.mark.parametrize("build", [_eth_transfer, _erc20_transfer])
+def test_signature_matches_eth_account(manager, build):
+    tx = build(manager)
+    assert manager.sign_transaction(tx, PRIVATE_KEY) == _reference(tx)
+
+
+def test_eth_transfer_encoder_matches_rlp():
+    tx = _eth_transfer(EVMTransactionManager(verbose=False))
+    assert evm_transaction._eth_transfer_payload(tx) == evm_transaction._unsigned_payload(tx)
+
+
+@pytest.mark.parametrize("field, value", [
+    ("nonce", 99),
+    ("maxFeePerGas", 3_000_000_000),
+    ("to", USDC),
+    ("value", 1),
+])
+def test_edited_tx_is_not_signed_stale(manager, field, value):
+    tx = _eth_transfer(manager)
+    tx[field] = value
+    assert manager.sign_transaction(tx, PRIVATE_KEY) == _reference(tx)
+    
+    decoded = manager.deserialize_unsigned_tx(manager.serialize_unsigned_tx(tx))
+    assert decoded[field] == value
+
+
+def test_batch_signing_matches_eth_account(manager):
+    txs = [_eth_transfer(manager), _erc20_transfer(manager)]
+    assert manager.sign_transaction_batch(txs, PRIVATE_KEY) == [_reference(tx) for tx in txs]
+
+
+def test_unsigned_payload_round_trip():
+    manager = EVMTransactionManager(verbose=False)
+    tx = _erc20_transfer(manager)
+    decoded = manager.deserialize_unsigned_tx(manager.serialize_unsigned_tx(tx))
+    assert decoded == {k: v for k, v in tx.items() if not k.startswith("_")}
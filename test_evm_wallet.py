@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test EVM key generation and in-memory key clearing
+
+Usage:
+    python3 -m pytest test_evm_wallet.py
+"""
+
+import pytest
+from eth_account import Account
+
+from src import evm_wallet
+from src.evm_wallet import EVMWalletManager
+
+
+@pytest.fixture(params=[True, False], ids=["coincurve", "eth-account"])
+def wallet(request, monkeypatch):
+    if request.param and not evm_wallet.HAS_COINCURVE:
+        pytest.skip("coincurve not installed")
+    monkeypatch.setattr(evm_wallet, "HAS_COINCURVE", request.param)
+    return EVMWalletManager()
+
+
+def test_generated_key_matches_address(wallet):
+    address = wallet.generate_keypair()
+    assert isinstance(wallet._private_key, bytearray)
+    assert Account.from_key(bytes(wallet._private_key)).address == address
+    assert wallet.account.address == address
+
+
+def test_clear_memory_zeroizes_key(wallet):
+    wallet.generate_keypair()
+    key = wallet._private_key
+    assert any(key)
+    
+    wallet.clear_memory()
+    assert key == bytearray(32)
+    assert wallet._private_key is None
+    assert wallet.account is None
+
+
+def test_replacing_key_zeroizes_previous(wallet):
+    wallet.generate_keypair()
+    first = wallet._private_key
+    wallet.generate_keypair()
+    assert first == bytearray(32)
+    assert any(wallet._private_key)
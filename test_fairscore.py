@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Test FairScore lookups, caching and 404 handling against a mocked API
+
+Usage:
+    python3 -m pytest test_fairscore.py
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from src import fairscore_integration
+from src.fairscore_integration import AsyncFairScoreClient, FairScoreClient
+
+WALLET = "2BqcFZhc4CPa7sbwa5QCKxTWJB1UZUgEV3fLUQjXgrjn"
+
+
+class _MockAPI:
+    """httpx handler answering /score with a fixed status, counting requests."""
+    
+    def __init__(self, status: int, body=None):
+        self.status = status
+        self.body = body
+        self.calls = 0
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/score/batch":
+            return httpx.Response(404)
+        self.calls += 1
+        return httpx.Response(self.status, json=self.body)
+
+
+def _client(api: _MockAPI, tmp_path=None) -> FairScoreClient:
+    db_path = str(tmp_path / "fairscore.db") if tmp_path else ""
+    client = FairScoreClient(api_key="test", db_path=db_path)
+    client.client.close()
+    client.client = httpx.Client(transport=httpx.MockTransport(api))
+    return client
+
+
+def test_scored_wallet_is_cached():
+    api = _MockAPI(200, {"wallet": WALLET, "fairscore": 65.0, "tier": "platinum", "badges": []})
+    with _client(api) as client:
+        assert client.get_tier(WALLET) == 4
+        assessment = client.get_risk_assessment(WALLET)
+        assert assessment.label == "HIGH TRUST"
+        assert assessment.fairscore == 65.0
+    assert api.calls == 1
+
+
+def test_score_fallback_when_tier_missing():
+    api = _MockAPI(200, {"wallet": WALLET, "fairscore": 10.0})
+    with _client(api) as client:
+        assert client.get_tier(WALLET) == 1
+        assert client.should_block_transaction(WALLET)[0]
+
+
+def test_unscored_wallet_is_unknown():
+    api = _MockAPI(404, {"error": "wallet not found"})
+    with _client(api) as client:
+        assert client.get_tier(WALLET) is None
+        assessment = client.get_risk_assessment(WALLET)
+        assert assessment.label == "UNKNOWN"
+        assert assessment.action == "WARN"
+        assert not assessment.available
+        assert client.get_transfer_limit(WALLET) == 10
+        assert client.should_block_transaction(WALLET) == (False, "")
+        assert client.get_tiers_batch([WALLET]) == {WALLET: None}
+    # Remembered: the 404 isn't re-requested
+    assert api.calls == 1
+
+
+def test_unscored_wallet_is_not_persisted(tmp_path):
+    api = _MockAPI(404)
+    with _client(api, tmp_path) as client:
+        assert client.get_tier(WALLET) is None
+    with _client(api, tmp_path) as client:
+        assert client.get_tier(WALLET) is None
+    assert api.calls == 2
+
+
+def test_server_error_is_unknown_and_briefly_cached():
+    api = _MockAPI(503)
+    with _client(api) as client:
+        assert client.get_tier(WALLET) is None
+        assert client.get_risk_assessment(WALLET).label == "UNKNOWN"
+    assert api.calls == 1
+
+
+def test_async_unscored_wallet_is_unknown():
+    api = _MockAPI(404)
+    
+    async def lookup():
+        async with AsyncFairScoreClient(api_key="test", db_path="") as client:
+            await client.client.aclose()
+            client.client = httpx.AsyncClient(transport=httpx.MockTransport(api))
+            first = await client.get_tier(WALLET)
+            second = await client.get_tier(WALLET)
+            return first, second
+    
+    assert asyncio.run(lookup()) == (None, None)
+    assert api.calls == 1
+
+
+def test_scores_stay_in_memory_by_default():
+    client = FairScoreClient(api_key="test")
+    try:
+        assert client.db is None
+    finally:
+        client.close()
+
+
+def test_purge_score_cache(tmp_path):
+    api = _MockAPI(200, {"wallet": WALLET, "fairscore": 50.0, "tier": "gold"})
+    db_path = tmp_path / "fairscore.db"
+    with _client(api, tmp_path) as client:
+        assert client.get_tier(WALLET) == 3
+        client.purge_cache()
+        assert client.get_tier(WALLET) == 3
+    assert api.calls == 2
+    
+    assert fairscore_integration.purge_score_cache(str(db_path))
+    assert not [name for name in os.listdir(tmp_path) if name.startswith("fairscore.db")]
+    assert not fairscore_integration.purge_score_cache(str(db_path))
+
+
+def test_connection_reuse_is_logged(caplog):
+    class _PooledAPI(_MockAPI):
+        """Reports a TCP connect through the request's trace only on the first call."""
+        
+        def __call__(self, request):
+            if self.calls == 0:
+                request.extensions["trace"]("connection.connect_tcp.complete", {})
+            return super().__call__(request)
+    
+    api = _PooledAPI(200, {"wallet": WALLET, "fairscore": 50.0, "tier": "gold"})
+    client = FairScoreClient(api_key="test", db_path="")
+    client.client.close()
+    client.client = httpx.Client(
+        transport=httpx.MockTransport(api),
+        event_hooks=fairscore_integration._client_options("test")["event_hooks"],
+    )
+    with caplog.at_level(logging.DEBUG, logger=fairscore_integration.__name__), client:
+        client.get_tier(WALLET)
+        client.get_tier("9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM")
+    
+    logged = [r.getMessage() for r in caplog.records if r.getMessage().startswith("FairScore GET")]
+    assert len(logged) == 2
+    assert "reused=False" in logged[0]
+    assert "reused=True" in logged[1]
+
+
+def test_default_client_is_created_once(monkeypatch):
+    created = []
+    barrier = threading.Barrier(8)
+    
+    class _SlowClient:
+        def __init__(self):
+            created.append(self)
+            time.sleep(0.05)  # widen the window between check and assignment
+    
+    monkeypatch.setattr(fairscore_integration, "FairScoreClient", _SlowClient)
+    monkeypatch.setattr(fairscore_integration, "_DEFAULT_CLIENT", None)
+    
+    def fetch():
+        barrier.wait()
+        return fairscore_integration.get_default_client()
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: fetch(), range(8)))
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
+
+
+def test_async_client_keeps_sqlite_off_the_event_loop(tmp_path, monkeypatch):
+    api = _MockAPI(200, {"wallet": WALLET, "fairscore": 50.0, "tier": "gold"})
+    db_threads = []
+    for name in ("_load_persisted", "_persist"):
+        original = getattr(fairscore_integration._ScoreCache, name)
+        
+        def recorded(self, *args, _original=original):
+            db_threads.append(threading.get_ident())
+            return _original(self, *args)
+        monkeypatch.setattr(fairscore_integration._ScoreCache, name, recorded)
+    
+    async def lookup():
+        async with AsyncFairScoreClient(api_key="test", db_path=str(tmp_path / "fairscore.db")) as client:
+            await client.client.aclose()
+            client.client = httpx.AsyncClient(transport=httpx.MockTransport(api))
+            tier = await client.get_tier(WALLET)
+        return tier, threading.get_ident()
+    
+    tier, loop_thread = asyncio.run(lookup())
+    assert tier == 3
+    assert len(db_threads) == 2
+    assert loop_thread not in db_threads
+    # The score was persisted: a fresh client reads it back without the API
+    with _client(_MockAPI(500), tmp_path) as client:
+        assert client.get_tier(WALLET) == 3
+
+
+def test_static_program_has_no_score(capsys):
+    program = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+    api = _MockAPI(500)
+    with _client(api) as client:
+        assessment = client.get_risk_assessment(program)
+        assert assessment.tier == 1 and assessment.fairscore is None
+        blocked, reason = client.should_block_transaction(program)
+        assert blocked and "known program" in reason
+        
+        client.display_reputation_badge(program)
+        client.display_reputation_badge(program, verbose=True)
+        client.display_reputation_badges([program])
+    out = capsys.readouterr().out
+    assert "known program" in out
+    assert "0.0" not in out and "0/100" not in out
+    assert api.calls == 0
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Test rootfs extraction, cache verification and image copying in the ISO builder
+
+Usage:
+    python3 -m pytest test_iso_builder.py
+"""
+
+import hashlib
+import io
+import os
+import stat
+import tarfile
+
+import pytest
+
+from src import iso_builder
+from src.iso_builder import ISOBuilder
+
+
+def _tarball(*members) -> bytes:
+    """Build a .tar.gz from (TarInfo, payload-or-None) pairs."""
+    out = io.BytesIO()
+    with tarfile.open(fileobj=out, mode="w:gz") as tar:
+        for info, payload in members:
+            if payload is not None:
+                info.size = len(payload)
+                tar.addfile(info, io.BytesIO(payload))
+            else:
+                tar.addfile(info)
+    return out.getvalue()
+
+
+def _entry(name, type_=tarfile.REGTYPE, mode=0o644, linkname=""):
+    info = tarfile.TarInfo(name)
+    info.type = type_
+    info.mode = mode
+    info.linkname = linkname
+    return info
+
+
+def _extract(tmp_path, data: bytes) -> ISOBuilder:
+    builder = ISOBuilder()
+    builder.rootfs_dir = tmp_path / "rootfs"
+    builder.rootfs_dir.mkdir()
+    tarball = tmp_path / "rootfs.tar.gz"
+    tarball.write_bytes(data)
+    builder._extract_rootfs(tarball)
+    return builder
+
+
+def test_extraction_keeps_sticky_and_setuid_bits(tmp_path):
+    data = _tarball(
+        (_entry("tmp", tarfile.DIRTYPE, 0o1777), None),
+        (_entry("bin", tarfile.DIRTYPE, 0o755), None),
+        (_entry("bin/bbsuid", mode=0o4755), b"\x7fELF"),
+        (_entry("bin/sh", tarfile.SYMTYPE, 0o777, "/bin/busybox"), None),
+    )
+    rootfs = _extract(tmp_path, data).rootfs_dir
+    
+    assert stat.S_IMODE((rootfs / "tmp").stat().st_mode) == 0o1777
+    assert stat.S_IMODE((rootfs / "bin" / "bbsuid").stat().st_mode) == 0o4755
+    # Absolute symlinks are left pointing into the (future) root
+    assert (rootfs / "bin" / "sh").readlink().as_posix() == "/bin/busybox"
+
+
+@pytest.mark.parametrize("member", [
+    _entry("../escape"),
+    _entry("/etc/passwd"),
+    _entry("etc/../../escape"),
+    _entry("dev/sda", tarfile.BLKTYPE),
+    _entry("dev/mem", tarfile.CHRTYPE),
+    _entry("etc/shadow", tarfile.LNKTYPE, linkname="/etc/shadow"),
+])
+def test_extraction_rejects_unsafe_members(tmp_path, member):
+    payload = b"x" if member.isreg() else None
+    with pytest.raises(tarfile.TarError):
+        _extract(tmp_path, _tarball((member, payload)))
+    assert not (tmp_path / "escape").exists()
+
+
+def test_extraction_rejects_writes_through_symlinks(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    data = _tarball(
+        (_entry("etc", tarfile.SYMTYPE, 0o777, str(outside)), None),
+        (_entry("etc/passwd"), b"root::0:0::/root:/bin/sh\n"),
+    )
+    with pytest.raises(tarfile.TarError):
+        _extract(tmp_path, data)
+    assert not (outside / "passwd").exists()
+
+
+@pytest.fixture
+def rootfs_cache(tmp_path, monkeypatch):
+    """Point the rootfs cache at tmp_path and forbid real downloads."""
+    monkeypatch.setattr(iso_builder, "ROOTFS_CACHE_DIR", tmp_path / "cache")
+    
+    def no_network(self, *args):
+        raise AssertionError("unexpected download")
+    monkeypatch.setattr(ISOBuilder, "_download_rootfs_parallel", no_network)
+    monkeypatch.setattr(ISOBuilder, "_download_rootfs_single", no_network)
+    
+    tarball = _tarball((_entry("etc/alpine-release"), b"3.19.1\n"))
+    cache_path = iso_builder._rootfs_cache_path()
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_bytes(tarball)
+    return cache_path, hashlib.sha256(tarball).hexdigest()
+
+
+def test_verified_cache_hit_is_extracted(tmp_path, monkeypatch, rootfs_cache):
+    cache_path, digest = rootfs_cache
+    monkeypatch.setattr(iso_builder, "_published_sha256", lambda: digest)
+    
+    rootfs = ISOBuilder().download_and_extract_rootfs(str(tmp_path / "work"))
+    assert (rootfs / "etc" / "alpine-release").read_bytes() == b"3.19.1\n"
+
+
+def test_tampered_cache_is_discarded(tmp_path, monkeypatch, rootfs_cache):
+    cache_path, digest = rootfs_cache
+    cache_path.write_bytes(_tarball((_entry("etc/alpine-release"), b"evil\n")))
+    monkeypatch.setattr(iso_builder, "_published_sha256", lambda: digest)
+    monkeypatch.setattr(ISOBuilder, "_download_rootfs", lambda self, expected: None)
+    
+    assert ISOBuilder().download_and_extract_rootfs(str(tmp_path / "work")) is None
+    assert not cache_path.exists()
+    assert not (tmp_path / "work" / "rootfs" / "etc").exists()
+
+
+def test_cache_is_refused_without_any_checksum(tmp_path, monkeypatch, rootfs_cache):
+    # Offline with no recorded digest: the cache can't be verified
+    monkeypatch.setattr(iso_builder, "_published_sha256", lambda: None)
+    
+    assert ISOBuilder().download_and_extract_rootfs(str(tmp_path / "work")) is None
+    assert not (tmp_path / "work" / "rootfs" / "etc").exists()
+
+
+def test_offline_rebuild_uses_recorded_checksum(tmp_path, monkeypatch, rootfs_cache):
+    cache_path, digest = rootfs_cache
+    cache_path.with_suffix(".sha256").write_text(digest + "\n")
+    monkeypatch.setattr(iso_builder, "_published_sha256", lambda: None)
+    
+    rootfs = ISOBuilder().download_and_extract_rootfs(str(tmp_path / "work"))
+    assert (rootfs / "etc" / "alpine-release").read_bytes() == b"3.19.1\n"
+
+
+def test_offline_rebuild_rejects_tampered_cache(tmp_path, monkeypatch, rootfs_cache):
+    cache_path, digest = rootfs_cache
+    cache_path.with_suffix(".sha256").write_text(digest + "\n")
+    cache_path.write_bytes(_tarball((_entry("etc/alpine-release"), b"evil\n")))
+    monkeypatch.setattr(iso_builder, "_published_sha256", lambda: None)
+    
+    assert ISOBuilder().download_and_extract_rootfs(str(tmp_path / "work")) is None
+    assert not cache_path.exists()
+
+
+def test_verified_download_records_its_checksum(tmp_path, monkeypatch):
+    monkeypatch.setattr(iso_builder, "ROOTFS_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(ISOBuilder, "_download_rootfs_parallel", lambda self, dest, expected: False)
+    tarball = _tarball((_entry("etc/alpine-release"), b"3.19.1\n"))
+    digest = hashlib.sha256(tarball).hexdigest()
+    
+    def fake_single(self, dest):
+        dest.write_bytes(tarball)
+        return digest
+    monkeypatch.setattr(ISOBuilder, "_download_rootfs_single", fake_single)
+    
+    assert ISOBuilder()._download_rootfs(digest) == iso_builder._rootfs_cache_path()
+    assert iso_builder._recorded_sha256() == digest
+
+
+def test_mismatched_download_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(iso_builder, "ROOTFS_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(ISOBuilder, "_download_rootfs_parallel", lambda self, dest, expected: False)
+    
+    def fake_single(self, dest):
+        dest.write_bytes(b"not the release tarball")
+        return hashlib.sha256(b"not the release tarball").hexdigest()
+    monkeypatch.setattr(ISOBuilder, "_download_rootfs_single", fake_single)
+    
+    assert ISOBuilder()._download_rootfs("0" * 64) is None
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def _copy_image(tmp_path, copy, size: int) -> bytes:
+    """Run an image copy routine over a random `size`-byte image, returning the output."""
+    payload = os.urandom(size)
+    src_path = tmp_path / "image.img"
+    src_path.write_bytes(payload)
+    dst_path = tmp_path / "device.img"
+    
+    depth = 4
+    buffer = iso_builder._alloc_io_buffer(depth * iso_builder._FLASH_CHUNK)
+    region = memoryview(buffer)
+    views = [region[i * iso_builder._FLASH_CHUNK:(i + 1) * iso_builder._FLASH_CHUNK]
+             for i in range(depth)]
+    src_fd = os.open(src_path, os.O_RDONLY)
+    dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+    copied = []
+    try:
+        copy(src_fd, dst_fd, size, views, copied.append)
+    finally:
+        os.close(src_fd)
+        os.close(dst_fd)
+        for v in views:
+            v.release()
+        region.release()
+        buffer.close()
+    
+    assert sum(copied) == size
+    written = dst_path.read_bytes()
+    # The tail is padded with zeros to the O_DIRECT block size
+    assert len(written) == iso_builder._aligned(size)
+    assert written[size:] == bytes(len(written) - size)
+    assert written[:size] == payload
+    return written
+
+
+# A whole number of chunks, a block-aligned tail and an unaligned tail
+_IMAGE_SIZES = [
+    2 * iso_builder._FLASH_CHUNK,
+    2 * iso_builder._FLASH_CHUNK + 8192,
+    2 * iso_builder._FLASH_CHUNK + 1234,
+    1234,
+]
+
+
+@pytest.mark.parametrize("size", _IMAGE_SIZES)
+def test_pwritev_copy(tmp_path, size):
+    _copy_image(tmp_path, lambda s, d, n, views, advance:
+                iso_builder._copy_image_pwritev(s, d, n, views[0], advance), size)
+
+
+@pytest.mark.parametrize("size", _IMAGE_SIZES)
+def test_uring_copy(tmp_path, size):
+    if not iso_builder.HAS_IO_URING:
+        pytest.skip("liburing not installed")
+    
+    def copy(*args):
+        if not iso_builder._copy_image_uring(*args):
+            pytest.skip("io_uring unavailable in this kernel")
+    _copy_image(tmp_path, copy, size)
+
+
+@pytest.fixture
+def uring():
+    if not iso_builder.HAS_IO_URING:
+        pytest.skip("liburing not installed")
+    ring = iso_builder.liburing.io_uring()
+    try:
+        iso_builder.liburing.io_uring_queue_init(1, ring, 0)
+    except OSError:
+        pytest.skip("io_uring unavailable in this kernel")
+    iso_builder.liburing.io_uring_queue_exit(ring)
+
+
+def _open_fds() -> int:
+    return len(os.listdir("/proc/self/fd"))
+
+
+def test_uring_manifest_write(tmp_path, uring):
+    # More files than one submission batch holds
+    count = iso_builder._URING_DEPTH + 5
+    entries = [(str(tmp_path / f"file{i}"), 0o700 if i % 2 else None, b"%d\n" % i)
+               for i in range(count)]
+    
+    assert iso_builder._write_manifest_uring(entries)
+    for i, (path, mode, payload) in enumerate(entries):
+        assert open(path, "rb").read() == payload
+        if mode is not None:
+            assert stat.S_IMODE(os.stat(path).st_mode) == mode
+
+
+def test_uring_manifest_write_failure_closes_files(tmp_path, uring):
+    entries = [(str(tmp_path / "ok"), None, b"ok"),
+               (str(tmp_path / "missing" / "file"), None, b"lost")]
+    before = _open_fds()
+    with pytest.raises(FileNotFoundError):
+        iso_builder._write_manifest_uring(entries)
+    assert _open_fds() == before
+
+
+def test_uring_rmtree(tmp_path, uring):
+    top = tmp_path / "rootfs"
+    for d in ("a/b/c", "a/d", "e"):
+        (top / d).mkdir(parents=True)
+    for f in ("a/b/c/x", "a/d/y", "e/z", "top"):
+        (top / f).write_bytes(b"x")
+    (top / "a" / "link").symlink_to("/etc")
+    (top / "a" / "deadlink").symlink_to("missing")
+    
+    assert iso_builder._rmtree_uring(str(top))
+    assert not os.path.lexists(top)
+    assert os.path.isdir("/etc")
+
+
+def test_archive_fallback_ignores_squashfs_unless_requested(tmp_path, monkeypatch):
+    builder = ISOBuilder()
+    builder.rootfs_dir = tmp_path / "rootfs"
+    (builder.rootfs_dir / "etc").mkdir(parents=True)
+    monkeypatch.setattr(iso_builder.shutil, "which",
+                        lambda tool: None if tool == "pigz" else f"/usr/bin/{tool}")
+    monkeypatch.setattr(ISOBuilder, "_create_squashfs_image",
+                        lambda self, output_dir: output_dir / "solana-cold-wallet.sqfs")
+    
+    monkeypatch.setattr(iso_builder, "_USE_SQUASHFS", False)
+    assert builder._create_archive_image(tmp_path).name == "solana-cold-wallet.tar.gz"
+    
+    monkeypatch.setattr(iso_builder, "_USE_SQUASHFS", True)
+    assert builder._create_archive_image(tmp_path).name == "solana-cold-wallet.sqfs"
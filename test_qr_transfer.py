@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test QR payload encoding (JSON, base45, base64) round-trips through the parser
+
+Usage:
+    python3 -m pytest test_qr_transfer.py
+"""
+
+import base64
+import os
+
+import pytest
+
+from src import qr_transfer
+from src.qr_transfer import QRTransfer
+
+
+def _unsigned_tx(size: int) -> dict:
+    return {
+        "type": "unsigned_transaction",
+        "version": "1.0",
+        "data": base64.b64encode(os.urandom(size)).decode("ascii"),
+    }
+
+
+def _displayed_payload(monkeypatch, qr: QRTransfer, tx: dict):
+    """Run display_transaction_qr, returning (payload put in the QR, alphanumeric flag)."""
+    shown = []
+    monkeypatch.setattr(
+        qr, "generate_ascii_qr",
+        lambda data, box_size=1, alphanumeric=False: shown.append((data, alphanumeric)) or "",
+    )
+    qr.display_transaction_qr(tx)
+    return shown[0]
+
+
+def test_small_tx_round_trips_as_json(monkeypatch):
+    qr = QRTransfer()
+    tx = _unsigned_tx(200)
+    payload, alphanumeric = _displayed_payload(monkeypatch, qr, tx)
+    assert payload.startswith("{") and not alphanumeric
+    assert qr.parse_unsigned_tx_input(payload) == tx
+
+
+@pytest.mark.skipif(not qr_transfer.HAS_BASE45, reason="base45 not installed")
+def test_large_tx_round_trips_as_base45(monkeypatch):
+    qr = QRTransfer()
+    if not qr.qr_available:
+        pytest.skip("qrcode not installed")
+    tx = _unsigned_tx(1800)
+    payload, alphanumeric = _displayed_payload(monkeypatch, qr, tx)
+    assert alphanumeric
+    assert set(payload) <= set("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:")
+    assert qr.parse_unsigned_tx_input(payload) == tx
+    # Scanners and terminals often add a trailing newline
+    assert qr.parse_unsigned_tx_input(payload + "\n") == tx
+
+
+def test_large_tx_round_trips_as_base64(monkeypatch):
+    monkeypatch.setattr(qr_transfer, "HAS_BASE45", False)
+    qr = QRTransfer()
+    tx = _unsigned_tx(1800)
+    payload, alphanumeric = _displayed_payload(monkeypatch, qr, tx)
+    assert not alphanumeric
+    assert qr.parse_unsigned_tx_input(payload) == tx
+
+
+@pytest.mark.skipif(not qr_transfer.HAS_BASE45, reason="base45 not installed")
+def test_base45_qr_is_smaller_than_base64():
+    qr = QRTransfer()
+    if not qr.qr_available:
+        pytest.skip("qrcode not installed")
+    raw = qr_transfer.json_dumps(_unsigned_tx(1000))
+    as_base45 = qr.generate_ascii_qr(qr_transfer.base45.b45encode(raw).decode("ascii"), alphanumeric=True)
+    as_base64 = qr.generate_ascii_qr(base64.b64encode(raw).decode("ascii"))
+    assert len(as_base45.splitlines()) < len(as_base64.splitlines())
+
+
+def test_rejects_other_payload_types():
+    qr = QRTransfer()
+    assert qr.parse_unsigned_tx_input('{"type":"signed_transaction"}') is None
+    assert qr.parse_unsigned_tx_input("not a transaction") is None
+
+
+@pytest.mark.skipif(not qr_transfer.HAS_BASE45, reason="base45 not installed")
+def test_oversized_tx_falls_back_to_base64_text(capsys):
+    qr = QRTransfer()
+    if not qr.qr_available:
+        pytest.skip("qrcode not installed")
+    # Too big even for a version-40 QR in base45
+    tx = _unsigned_tx(4000)
+    qr.display_transaction_qr(tx)
+    lines = capsys.readouterr().out.splitlines()
+    payload = lines[lines.index("-" * 60) + 1]
+    assert " " not in payload
+    assert qr.parse_unsigned_tx_input(payload) == tx
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Test associated token account derivation against fixed wallet/mint vectors
+
+Usage:
+    python3 -m pytest test_token_transfer.py
+"""
+
+import pytest
+from solders.pubkey import Pubkey
+
+from src.token_transfer import get_associated_token_address
+
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+
+@pytest.mark.parametrize("wallet, mint, ata", [
+    # Coldstar's infrastructure fee wallet (config.py) and USDC
+    ("Cak1aAwxM2jTdu7AtdaHbqAc3Dfafts7KdsHNrtXN5rT", USDC_MINT,
+     "ZhSAsg1PspHouejZNVxuM1UuA3FWBcDMJ3RnL6vgdU8"),
+    # First off-curve hash at bump 251, so the bump search is exercised
+    ("2BqcFZhc4CPa7sbwa5QCKxTWJB1UZUgEV3fLUQjXgrjn", USDC_MINT,
+     "Fo7iTsMiSsqRTKrdr4YofBFnS52CTd5LmSKar8rVH7aN"),
+])
+def test_associated_token_address(wallet, mint, ata):
+    derived = get_associated_token_address(Pubkey.from_string(wallet), Pubkey.from_string(mint))
+    assert str(derived) == ata
+    # A PDA: no private key can exist for it
+    assert not derived.is_on_curve()